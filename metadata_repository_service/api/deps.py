@@ -15,9 +15,219 @@
 
 """FastAPI dependencies (used with the `Depends` feature)"""
 
-from metadata_repository_service.config import CONFIG
+from typing import Callable, Optional, Tuple, Type
+
+from fastapi import Depends, Query
+from fastapi.exceptions import HTTPException
+from pydantic import BaseModel
+
+from metadata_repository_service.bulk_models import BatchRequest
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.pagination import (
+    CursorError,
+    decode_cursor,
+    get_page_size,
+)
+from metadata_repository_service.dao.entity_registry import REGISTERED_COLLECTIONS
+from metadata_repository_service.dao.loader import REQUEST_LOADER, EntityLoader
+from metadata_repository_service.graph_models import GraphDirectionEnum, GraphRequest
+from metadata_repository_service.pagination_models import (
+    ListOrderEnum,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import AccessionResolutionRequest
 
 
 def get_config():
     """Get runtime configuration."""
     return CONFIG
+
+
+async def use_entity_loader(config: Config = Depends(get_config)):
+    """Batch and memoize the entity lookups of the DAO for the current request."""
+    loader = EntityLoader(config)
+    REQUEST_LOADER.set(loader)
+    yield loader
+    REQUEST_LOADER.set(None)
+
+
+# The offset, limit and cursor of a requested page
+PageQuery = Tuple[Optional[int], Optional[int], Optional[str]]
+
+
+def relation_page_params(name: str) -> Callable[..., PageQuery]:
+    """Get a dependency that reads the requested page of a relation from the
+    ``{name}_offset``, ``{name}_limit`` and ``{name}_cursor`` query parameters."""
+
+    def get_page_query(
+        offset: Optional[int] = Query(
+            None,
+            alias=f"{name}_offset",
+            ge=0,
+            description=f"The position of the first of the {name} to return.",
+        ),
+        limit: Optional[int] = Query(
+            None,
+            alias=f"{name}_limit",
+            ge=0,
+            description=f"The maximum number of {name} to return.",
+        ),
+        cursor: Optional[str] = Query(
+            None,
+            alias=f"{name}_cursor",
+            description=f"The cursor of a page of {name}, as returned with the"
+            + " previous page.",
+        ),
+    ) -> PageQuery:
+        return offset, limit, cursor
+
+    return get_page_query
+
+
+def entity_page_params(
+    *model_classes: Type[BaseModel],
+) -> Callable[..., PageRequest]:
+    """Get a dependency that reads the requested page of a collection from the
+    ``limit``, ``cursor``, ``fields`` and ``order_by`` query parameters. Only the
+    fields of the model classes can be requested."""
+    known_fields = {field for cls in model_classes for field in cls.__fields__}
+
+    def get_page_request(
+        limit: Optional[int] = Query(
+            None, ge=1, description="The maximum number of entities to return."
+        ),
+        cursor: Optional[str] = Query(
+            None,
+            description="The cursor of a page, as returned with the previous page.",
+        ),
+        fields: Optional[str] = Query(
+            None,
+            description="Comma-separated fields of the entities to return."
+            + " All fields are returned by default.",
+        ),
+        order_by: ListOrderEnum = Query(
+            ListOrderEnum.ID, description="The order of the entities."
+        ),
+        config: Config = Depends(get_config),
+    ) -> PageRequest:
+        after = None
+        if cursor is not None:
+            try:
+                after = decode_cursor(cursor)
+            except CursorError as error:
+                raise HTTPException(status_code=400, detail=str(error)) from error
+            if after.get("order_by") != order_by.value or "id" not in after:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid cursor '{cursor}' for the order by {order_by.value}",
+                )
+        field_list = None
+        if fields is not None:
+            field_list = [field.strip() for field in fields.split(",") if field.strip()]
+            unknown = sorted(set(field_list) - known_fields)
+            if unknown:
+                raise HTTPException(
+                    status_code=400, detail=f"Unknown fields: {', '.join(unknown)}"
+                )
+        return PageRequest(
+            limit=get_page_size(limit, config),
+            order_by=order_by,
+            after=after,
+            fields=field_list,
+        )
+
+    return get_page_request
+
+
+def get_reference_page_request(
+    limit: Optional[int] = Query(
+        None, ge=1, description="The maximum number of entities to return."
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="The cursor of a page, as returned with the previous page.",
+    ),
+    entity_type: Optional[str] = Query(
+        None,
+        description="Only return referencing entities of this type, e.g. Experiment.",
+    ),
+    config: Config = Depends(get_config),
+) -> ReferencePageRequest:
+    """Get the requested page of the entities that reference an entity."""
+    if entity_type is not None and entity_type not in REGISTERED_COLLECTIONS:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown entity type: {entity_type}"
+        )
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_cursor(cursor).get("key")
+        except CursorError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+        if not isinstance(after, str):
+            raise HTTPException(status_code=400, detail=f"Invalid cursor '{cursor}'")
+    return ReferencePageRequest(
+        limit=get_page_size(limit, config), entity_type=entity_type, after=after
+    )
+
+
+def get_graph_request(
+    direction: GraphDirectionEnum = Query(
+        GraphDirectionEnum.DOWN,
+        description="Follow the references of the entities (down), the references"
+        + " to the entities (up), or both.",
+    ),
+    depth: int = Query(
+        1, ge=1, description="The maximum number of references to follow."
+    ),
+    types: Optional[str] = Query(
+        None,
+        description="Comma-separated types of the entities to walk through,"
+        + " e.g. Experiment,Sample. All types by default.",
+    ),
+    config: Config = Depends(get_config),
+) -> GraphRequest:
+    """Get the requested walk through the references between entities, with its
+    depth reduced to ``max_graph_depth``."""
+    type_list = None
+    if types is not None:
+        type_list = [x.strip() for x in types.split(",") if x.strip()]
+        unknown = sorted(set(type_list) - set(REGISTERED_COLLECTIONS))
+        if unknown:
+            raise HTTPException(
+                status_code=400, detail=f"Unknown entity types: {', '.join(unknown)}"
+            )
+    return GraphRequest(
+        direction=direction, depth=min(depth, config.max_graph_depth), types=type_list
+    )
+
+
+def get_batch_request(
+    batch: BatchRequest, config: Config = Depends(get_config)
+) -> BatchRequest:
+    """Get the IDs and accessions of a batch request, rejecting requests with
+    more than ``max_batch_size`` of them."""
+    size = len(batch.ids) + len(batch.accessions)
+    if size > config.max_batch_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot look up {size} entities at once,"
+            + f" the maximum is {config.max_batch_size}.",
+        )
+    return batch
+
+
+def get_resolution_request(
+    resolution: AccessionResolutionRequest, config: Config = Depends(get_config)
+) -> AccessionResolutionRequest:
+    """Get the accessions of a resolution request, rejecting requests with
+    more than ``max_batch_size`` of them."""
+    size = len(resolution.accessions)
+    if size > config.max_batch_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot resolve {size} accessions at once,"
+            + f" the maximum is {config.max_batch_size}.",
+        )
+    return resolution
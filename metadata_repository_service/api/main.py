@@ -18,9 +18,14 @@ Additional endpoints might be structured in dedicated modules
 (each of them having a sub-router).
 """
 
-from fastapi import FastAPI
+import logging
+
+from fastapi import Depends, FastAPI
 from ghga_service_chassis_lib.api import configure_app
+from pymongo.errors import PyMongoError
 
+from metadata_repository_service.api.deps import get_config, use_entity_loader
+from metadata_repository_service.api.routers.accessions import accession_router
 from metadata_repository_service.api.routers.analyses import analysis_router
 from metadata_repository_service.api.routers.analysis_processes import (
     analysis_process_router,
@@ -36,11 +41,13 @@ from metadata_repository_service.api.routers.dataset_summary import (
     dataset_summary_router,
 )
 from metadata_repository_service.api.routers.datasets import dataset_router
+from metadata_repository_service.api.routers.entities import entity_router
 from metadata_repository_service.api.routers.experiment_processes import (
     experiment_process_router,
 )
 from metadata_repository_service.api.routers.experiments import experiment_router
 from metadata_repository_service.api.routers.files import file_router
+from metadata_repository_service.api.routers.graph import graph_router
 from metadata_repository_service.api.routers.individuals import individual_router
 from metadata_repository_service.api.routers.members import member_router
 from metadata_repository_service.api.routers.metadata_summary import (
@@ -54,11 +61,19 @@ from metadata_repository_service.api.routers.studies import study_router
 from metadata_repository_service.api.routers.submissions import submission_router
 from metadata_repository_service.api.routers.technologies import technology_router
 from metadata_repository_service.api.routers.workflows import workflow_router
-from metadata_repository_service.config import CONFIG, configure_logging
+from metadata_repository_service.config import CONFIG, Config, configure_logging
+from metadata_repository_service.core.scheduler import get_background_scheduler
+from metadata_repository_service.dao.cache import get_cache_stats
+from metadata_repository_service.dao.dataset_summary import (
+    schedule_dirty_dataset_summaries,
+)
+from metadata_repository_service.dao.db import close_db, connect_db
+from metadata_repository_service.dao.index_registry import INDEX_REGISTRY
+from metadata_repository_service.dao.indexes import reconcile_indexes
 
 configure_logging()
 
-app = FastAPI()
+app = FastAPI(dependencies=[Depends(use_entity_loader)])
 configure_app(app, config=CONFIG)
 
 app.include_router(dataset_router)
@@ -82,6 +97,40 @@ app.include_router(technology_router)
 app.include_router(workflow_router)
 app.include_router(dataset_summary_router)
 app.include_router(metadata_summary_router)
+app.include_router(accession_router)
+app.include_router(entity_router)
+app.include_router(graph_router)
+
+
+def get_app_config() -> Config:
+    """Get the runtime configuration that the routes of the application use,
+    including an override of the ``get_config`` dependency (e.g. in tests)."""
+    return app.dependency_overrides.get(get_config, get_config)()
+
+
+@app.on_event("startup")
+async def startup():
+    """Create the shared database client and the missing indexes, and resume
+    the recomputation of dirty summaries when the application starts."""
+    config = get_app_config()
+    await connect_db(config)
+    if config.db_create_indexes:
+        try:
+            await reconcile_indexes(INDEX_REGISTRY, config=config)
+        except PyMongoError as error:
+            logging.error("Could not reconcile the indexes: %s", error)
+    try:
+        await schedule_dirty_dataset_summaries(config=config)
+    except PyMongoError as error:
+        logging.error("Could not schedule the dirty dataset summaries: %s", error)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop the background jobs and close the shared database client
+    when the application stops."""
+    await get_background_scheduler(get_app_config()).close()
+    await close_db()
 
 
 @app.get("/")
@@ -91,3 +140,12 @@ async def index():
     redirects to the API documentation.
     """
     return "Index of the Metadata Repository Service"
+
+
+@app.get("/cache_stats", summary="Get the statistics of the entity cache")
+async def cache_stats():
+    """
+    Get the size and the hit and miss counts of the in-process entity cache
+    of this worker, per database URL and name.
+    """
+    return get_cache_stats()
@@ -0,0 +1,69 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"Routes for resolving accessions"
+
+from fastapi import APIRouter, Depends
+from fastapi.exceptions import HTTPException
+
+from metadata_repository_service.api.deps import get_config, get_resolution_request
+from metadata_repository_service.config import Config
+from metadata_repository_service.dao.accession_resolver import (
+    resolve_accession,
+    resolve_accessions,
+)
+from metadata_repository_service.resolution_models import (
+    AccessionResolution,
+    AccessionResolutionRequest,
+    ResolvedAccession,
+)
+
+accession_router = APIRouter()
+
+
+@accession_router.get(
+    "/accessions/{accession}",
+    response_model=ResolvedAccession,
+    summary="Resolve an accession",
+    tags=["Query"],
+)
+async def get_accession(accession: str, config: Config = Depends(get_config)):
+    """
+    Given an accession, get the type and ID of the entity it identifies.
+    """
+    resolved = await resolve_accession(accession, config=config)
+    if not resolved:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Entity with accession '{accession}' not found",
+        )
+    return resolved
+
+
+@accession_router.post(
+    "/accessions/resolve",
+    response_model=AccessionResolution,
+    summary="Resolve many accessions",
+    tags=["Query"],
+)
+async def get_accessions_resolved(
+    resolution: AccessionResolutionRequest = Depends(get_resolution_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given accessions, get the types and IDs of the entities they identify at once.
+    Accessions without an entity are reported.
+    """
+    return await resolve_accessions(resolution.accessions, config=config)
@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.analysis import get_analysis
+from metadata_repository_service.dao.analysis import (
+    get_analysis,
+    get_analysis_batch,
+    get_analysis_referenced_by,
+    list_analyses,
+)
 from metadata_repository_service.models import Analysis
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 analysis_router = APIRouter()
 
@@ -46,3 +63,57 @@ async def get_analyses(
             detail=f"{Analysis.__name__} with id '{analysis_id}' not found",
         )
     return analysis
+
+
+@analysis_router.get(
+    "/analyses",
+    response_model=EntityPage[Analysis],
+    response_model_exclude_unset=True,
+    summary="List Analyses",
+    tags=["Query"],
+)
+async def get_analysis_list(
+    page: PageRequest = Depends(entity_page_params(Analysis)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Analysis records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_analyses(page, config=config)
+
+
+@analysis_router.post(
+    "/analyses/batch",
+    response_model=EntityBatch[Analysis],
+    summary="Get many Analyses",
+    tags=["Query"],
+)
+async def get_analyses_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Analysis IDs and accessions, get the Analysis records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_analysis_batch(batch, embedded=embedded, config=config)
+
+
+@analysis_router.get(
+    "/analyses/{analysis_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference an Analysis",
+    tags=["Query"],
+)
+async def get_analysis_references(
+    analysis_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given an Analysis ID, get the entities that reference the Analysis, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_analysis_referenced_by(analysis_id, page, config=config)
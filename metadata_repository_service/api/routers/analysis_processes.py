@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.analysis_process import get_analysis_process
+from metadata_repository_service.dao.analysis_process import (
+    get_analysis_process,
+    get_analysis_process_batch,
+    get_analysis_process_referenced_by,
+    list_analysis_processes,
+)
 from metadata_repository_service.models import AnalysisProcess
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 analysis_process_router = APIRouter()
 
@@ -48,3 +65,59 @@ async def get_analysis_processes(
             detail=f"{AnalysisProcess.__name__} with id '{analysis_process_id}' not found",
         )
     return analysis_process
+
+
+@analysis_process_router.get(
+    "/analysis_process",
+    response_model=EntityPage[AnalysisProcess],
+    response_model_exclude_unset=True,
+    summary="List AnalysisProcesses",
+    tags=["Query"],
+)
+async def get_analysis_process_list(
+    page: PageRequest = Depends(entity_page_params(AnalysisProcess)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the AnalysisProcess records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_analysis_processes(page, config=config)
+
+
+@analysis_process_router.post(
+    "/analysis_process/batch",
+    response_model=EntityBatch[AnalysisProcess],
+    summary="Get many AnalysisProcesses",
+    tags=["Query"],
+)
+async def get_analysis_processes_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given AnalysisProcess IDs and accessions, get the AnalysisProcess records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_analysis_process_batch(batch, embedded=embedded, config=config)
+
+
+@analysis_process_router.get(
+    "/analysis_process/{analysis_process_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference an AnalysisProcess",
+    tags=["Query"],
+)
+async def get_analysis_process_references(
+    analysis_process_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given an AnalysisProcess ID, get the entities that reference the AnalysisProcess,
+    page by page. The entities are ordered by their type, reference field and ID.
+    """
+    return await get_analysis_process_referenced_by(
+        analysis_process_id, page, config=config
+    )
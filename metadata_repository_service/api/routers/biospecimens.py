@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.biospecimen import get_biospecimen
+from metadata_repository_service.dao.biospecimen import (
+    get_biospecimen,
+    get_biospecimen_batch,
+    get_biospecimen_referenced_by,
+    list_biospecimens,
+)
 from metadata_repository_service.models import Biospecimen
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 biospecimen_router = APIRouter()
 
@@ -46,3 +63,57 @@ async def get_biospecimens(
             detail=f"{Biospecimen.__name__} with id '{biospecimen_id}' not found",
         )
     return biospecimen
+
+
+@biospecimen_router.get(
+    "/biospecimens",
+    response_model=EntityPage[Biospecimen],
+    response_model_exclude_unset=True,
+    summary="List Biospecimens",
+    tags=["Query"],
+)
+async def get_biospecimen_list(
+    page: PageRequest = Depends(entity_page_params(Biospecimen)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Biospecimen records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_biospecimens(page, config=config)
+
+
+@biospecimen_router.post(
+    "/biospecimens/batch",
+    response_model=EntityBatch[Biospecimen],
+    summary="Get many Biospecimens",
+    tags=["Query"],
+)
+async def get_biospecimens_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Biospecimen IDs and accessions, get the Biospecimen records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_biospecimen_batch(batch, embedded=embedded, config=config)
+
+
+@biospecimen_router.get(
+    "/biospecimens/{biospecimen_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Biospecimen",
+    tags=["Query"],
+)
+async def get_biospecimen_references(
+    biospecimen_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Biospecimen ID, get the entities that reference the Biospecimen,
+    page by page. The entities are ordered by their type, reference field and ID.
+    """
+    return await get_biospecimen_referenced_by(biospecimen_id, page, config=config)
@@ -17,14 +17,29 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
 from metadata_repository_service.creation_models import CreateDataAccessCommittee
 from metadata_repository_service.dao.data_access_committee import (
     create_data_access_committee,
     get_data_access_committee,
+    get_data_access_committee_batch,
+    get_data_access_committee_referenced_by,
+    list_data_access_committees,
 )
 from metadata_repository_service.models import DataAccessCommittee
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 data_access_committee_router = APIRouter()
 
@@ -75,3 +90,61 @@ async def create_data_access_committees(
         data_access_committee, config=config
     )
     return dac_entity
+
+
+@data_access_committee_router.get(
+    "/data_access_committees",
+    response_model=EntityPage[DataAccessCommittee],
+    response_model_exclude_unset=True,
+    summary="List DataAccessCommittees",
+    tags=["Query"],
+)
+async def get_data_access_committee_list(
+    page: PageRequest = Depends(entity_page_params(DataAccessCommittee)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the DataAccessCommittee records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_data_access_committees(page, config=config)
+
+
+@data_access_committee_router.post(
+    "/data_access_committees/batch",
+    response_model=EntityBatch[DataAccessCommittee],
+    summary="Get many DataAccessCommittees",
+    tags=["Query"],
+)
+async def get_data_access_committees_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given DataAccessCommittee IDs and accessions, get the DataAccessCommittee records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_data_access_committee_batch(
+        batch, embedded=embedded, config=config
+    )
+
+
+@data_access_committee_router.get(
+    "/data_access_committees/{data_access_committee_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a DataAccessCommittee",
+    tags=["Query"],
+)
+async def get_data_access_committee_references(
+    data_access_committee_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a DataAccessCommittee ID, get the entities that reference the DataAccessCommittee,
+    page by page. The entities are ordered by their type, reference field and ID.
+    """
+    return await get_data_access_committee_referenced_by(
+        data_access_committee_id, page, config=config
+    )
@@ -17,7 +17,13 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
 from metadata_repository_service.creation_models import (
     CreateDataAccessCommittee,
@@ -29,8 +35,17 @@ from metadata_repository_service.dao.data_access_committee import (
 from metadata_repository_service.dao.data_access_policy import (
     create_data_access_policy,
     get_data_access_policy,
+    get_data_access_policy_batch,
+    get_data_access_policy_referenced_by,
+    list_data_access_policies,
 )
 from metadata_repository_service.models import DataAccessPolicy
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 data_access_policy_router = APIRouter()
 
@@ -94,3 +109,59 @@ async def create_data_access_policies(
         )
     dap = await create_data_access_policy(data_access_policy, config=config)
     return dap
+
+
+@data_access_policy_router.get(
+    "/data_access_policies",
+    response_model=EntityPage[DataAccessPolicy],
+    response_model_exclude_unset=True,
+    summary="List DataAccessPolicies",
+    tags=["Query"],
+)
+async def get_data_access_policy_list(
+    page: PageRequest = Depends(entity_page_params(DataAccessPolicy)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the DataAccessPolicy records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_data_access_policies(page, config=config)
+
+
+@data_access_policy_router.post(
+    "/data_access_policies/batch",
+    response_model=EntityBatch[DataAccessPolicy],
+    summary="Get many DataAccessPolicies",
+    tags=["Query"],
+)
+async def get_data_access_policies_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given DataAccessPolicy IDs and accessions, get the DataAccessPolicy records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_data_access_policy_batch(batch, embedded=embedded, config=config)
+
+
+@data_access_policy_router.get(
+    "/data_access_policies/{data_access_policy_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a DataAccessPolicy",
+    tags=["Query"],
+)
+async def get_data_access_policy_references(
+    data_access_policy_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a DataAccessPolicy ID, get the entities that reference the DataAccessPolicy,
+    page by page. The entities are ordered by their type, reference field and ID.
+    """
+    return await get_data_access_policy_referenced_by(
+        data_access_policy_id, page, config=config
+    )
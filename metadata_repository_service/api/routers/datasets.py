@@ -14,48 +14,165 @@
 # limitations under the License.
 "Routes for retrieving Datasets"
 
+from typing import Dict, List, Optional, Tuple
+
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
-from metadata_repository_service.config import Config
-from metadata_repository_service.creation_models import (
-    CreateDataAccessPolicy,
-    CreateDataset,
-    CreateFile,
+from metadata_repository_service.api.deps import (
+    PageQuery,
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+    relation_page_params,
+)
+from metadata_repository_service.bulk_models import (
+    BatchRequest,
+    BulkDatasetCreation,
+    DatasetCreationResult,
+    EntityBatch,
 )
-from metadata_repository_service.dao.data_access_policy import (
-    get_data_access_policy_by_accession,
+from metadata_repository_service.config import Config
+from metadata_repository_service.core.pagination import (
+    CursorError,
+    decode_cursor,
+    get_page_size,
 )
+from metadata_repository_service.creation_models import CreateDataset
 from metadata_repository_service.dao.dataset import (
+    DatasetError,
+    DatasetReferenceError,
+    bulk_create_datasets,
     change_dataset_status,
     create_dataset,
     get_dataset,
+    get_dataset_batch,
     get_dataset_by_accession,
+    get_dataset_page,
+    get_dataset_referenced_by,
+    list_datasets,
+    resolve_dataset_references,
 )
-from metadata_repository_service.dao.file import get_file_by_accession
+from metadata_repository_service.dao.dataset_closure import get_dataset_closure_entry
 from metadata_repository_service.models import Dataset
+from metadata_repository_service.pagination_models import (
+    DatasetPage,
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 from metadata_repository_service.patch_models import (
     DatasetStatusPatch,
     ReleaseStatusEnum,
 )
+from metadata_repository_service.resolution_models import (
+    DatasetClosureEntry,
+    EntityReference,
+)
 
 dataset_router = APIRouter()
 
 
+def get_missing_references_detail(missing: Dict[str, List[str]]) -> str:
+    """Describe the entities referenced by a new Dataset that could not be found."""
+    details = []
+    if "has_data_access_policy" in missing:
+        details.append(
+            f"DataAccessPolicy Accession {missing['has_data_access_policy'][0]}"
+            + " provided in 'dataset.has_data_access_policy' could not be found. "
+            + "Cannot create a Dataset that references a "
+            + "non-existing DataAccessPolicy."
+        )
+    if "has_file" in missing:
+        details.append(
+            f"File Accessions {missing['has_file']} provided in "
+            + "'dataset.has_file' could not be found. "
+            + "Cannot create a Dataset that references a "
+            + "non-existing File entity."
+        )
+    return " ".join(details)
+
+
+def _get_window(
+    relation: str, query: PageQuery, config: Config
+) -> Optional[Tuple[int, int]]:
+    """Get the offset and limit of the requested page of a relation, if any."""
+    offset, limit, cursor = query
+    if cursor is not None:
+        try:
+            position = decode_cursor(cursor)
+        except CursorError as error:
+            raise HTTPException(status_code=400, detail=str(error)) from error
+        if position.get("relation") != relation or not isinstance(
+            position.get("offset"), int
+        ):
+            raise HTTPException(
+                status_code=400, detail=f"Invalid cursor '{cursor}' for {relation}"
+            )
+        offset = position["offset"]
+        if limit is None:
+            limit = position.get("limit")
+    if offset is None and limit is None:
+        return None
+    return offset or 0, get_page_size(limit, config)
+
+
+def get_requested_pages(
+    files: PageQuery = Depends(relation_page_params("files")),
+    samples: PageQuery = Depends(relation_page_params("samples")),
+    experiments: PageQuery = Depends(relation_page_params("experiments")),
+    analyses: PageQuery = Depends(relation_page_params("analyses")),
+    config: Config = Depends(get_config),
+) -> Dict[str, Tuple[int, int]]:
+    """Get the requested pages of the relations of an embedded Dataset."""
+    queries = {
+        "has_file": files,
+        "has_sample": samples,
+        "has_experiment": experiments,
+        "has_analysis": analyses,
+    }
+    pages = {}
+    for relation, query in queries.items():
+        window = _get_window(relation, query, config)
+        if window is not None:
+            pages[relation] = window
+    return pages
+
+
 @dataset_router.get(
     "/datasets/{dataset_id}",
-    response_model=Dataset,
+    response_model=DatasetPage,
     summary="Get a Dataset",
     tags=["Query"],
 )
 async def get_datasets(
-    dataset_id: str, embedded: bool = False, config: Config = Depends(get_config)
+    dataset_id: str,
+    embedded: bool = False,
+    pages: Dict[str, Tuple[int, int]] = Depends(get_requested_pages),
+    config: Config = Depends(get_config),
 ):
     """
     Given a Dataset ID, get the Dataset record from the metadata store.
+
+    The files, samples, experiments and analyses of an embedded Dataset can be
+    paged through with the ``{relation}_offset`` and ``{relation}_limit`` or the
+    ``{relation}_cursor`` query parameters. If any page is requested, only the
+    requested pages are returned of these relations.
     """
-    dataset = await get_dataset(dataset_id=dataset_id, embedded=embedded, config=config)
+    if pages and not embedded:
+        raise HTTPException(
+            status_code=400,
+            detail="Relations can only be paged through in embedded Datasets.",
+        )
+    if pages:
+        dataset: Optional[Dataset] = await get_dataset_page(
+            dataset_id=dataset_id, pages=pages, config=config
+        )
+    else:
+        dataset = await get_dataset(
+            dataset_id=dataset_id, embedded=embedded, config=config
+        )
     if not dataset:
         raise HTTPException(
             status_code=404,
@@ -72,38 +189,49 @@ async def create_datasets(dataset: CreateDataset, config: Config = Depends(get_c
     Given a list of File accessions and a DataAccessPolicy accession, create a
     Dataset and write to the metadata store.
     """
-    dap_accession = dataset.has_data_access_policy
-    if isinstance(dap_accession, CreateDataAccessPolicy):
-        dap_accession = dap_accession.alias
-    dap_entity = await get_data_access_policy_by_accession(dap_accession, config=config)
-    if not dap_entity:
+    try:
+        references = await resolve_dataset_references(dataset, config=config)
+    except DatasetReferenceError as error:
         raise HTTPException(
-            status_code=404,
-            detail=f"DataAccessPolicy Accession {dap_accession} provided in "
-            + "'dataset.has_data_access_policy' could not be found. "
-            + "Cannot create a Dataset that references a "
-            + "non-existing DataAccessPolicy.",
-        )
+            status_code=404, detail=get_missing_references_detail(error.missing)
+        ) from error
+    new_dataset = await create_dataset(dataset, config=config, references=references)
+    return new_dataset
 
-    file_accessions = dataset.has_file
-    nonexistent_file_accessions = []
-    for file_accession in file_accessions:
-        if isinstance(file_accession, CreateFile):
-            file_accession = file_accession.alias
-        file_entity = await get_file_by_accession(file_accession, config=config)
-        if not file_entity:
-            nonexistent_file_accessions.append(file_accession)
 
-    if nonexistent_file_accessions:
-        raise HTTPException(
-            status_code=404,
-            detail=f"File Accessions {nonexistent_file_accessions} provided in "
-            + "'dataset.has_file' could not be found. "
-            + "Cannot create a Dataset that references a "
-            + "non-existing File entity.",
-        )
-    new_dataset = await create_dataset(dataset, config=config)
-    return new_dataset
+@dataset_router.post(
+    "/datasets/bulk",
+    response_model=BulkDatasetCreation,
+    summary="Create many Datasets",
+    tags=["Dataset"],
+)
+async def create_datasets_in_bulk(
+    datasets: List[CreateDataset], config: Config = Depends(get_config)
+):
+    """
+    Given a list of Datasets, each with a list of File accessions and a
+    DataAccessPolicy accession, create the Datasets and write them to the
+    metadata store. Datasets that cannot be created are reported individually
+    and do not prevent the creation of the others.
+    """
+    results = []
+    for index, result in enumerate(await bulk_create_datasets(datasets, config=config)):
+        if isinstance(result, DatasetReferenceError):
+            results.append(
+                DatasetCreationResult(
+                    index=index,
+                    error=get_missing_references_detail(result.missing),
+                    missing=result.missing,
+                )
+            )
+        elif isinstance(result, DatasetError):
+            results.append(DatasetCreationResult(index=index, error=str(result)))
+        else:
+            results.append(DatasetCreationResult(index=index, dataset=result))
+    failed = sum(1 for x in results if x.error is not None)
+    return BulkDatasetCreation(
+        created=len(results) - failed, failed=failed, results=results
+    )
 
 
 @dataset_router.patch(
@@ -141,3 +269,82 @@ async def update_dataset_status(
         dataset_accession, dataset, config=config
     )
     return updated_dataset
+
+
+@dataset_router.get(
+    "/datasets",
+    response_model=EntityPage[Dataset],
+    response_model_exclude_unset=True,
+    summary="List Datasets",
+    tags=["Query"],
+)
+async def get_dataset_list(
+    page: PageRequest = Depends(entity_page_params(Dataset)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Dataset records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_datasets(page, config=config)
+
+
+@dataset_router.post(
+    "/datasets/batch",
+    response_model=EntityBatch[Dataset],
+    summary="Get many Datasets",
+    tags=["Query"],
+)
+async def get_datasets_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Dataset IDs and accessions, get the Dataset records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_dataset_batch(batch, embedded=embedded, config=config)
+
+
+@dataset_router.get(
+    "/datasets/{dataset_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Dataset",
+    tags=["Query"],
+)
+async def get_dataset_references(
+    dataset_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Dataset ID, get the entities that reference the Dataset, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_dataset_referenced_by(dataset_id, page, config=config)
+
+
+@dataset_router.get(
+    "/datasets/{dataset_id}/entities/{entity_id}",
+    response_model=DatasetClosureEntry,
+    summary="Get whether an entity is part of a Dataset",
+    tags=["Query"],
+)
+async def get_dataset_entity(
+    dataset_id: str, entity_id: str, config: Config = Depends(get_config)
+):
+    """
+    Given a Dataset ID and an ID of an entity of any type, get whether the Dataset
+    references the entity directly or indirectly, from the closure of the Dataset.
+    """
+    entry = await get_dataset_closure_entry(dataset_id, entity_id, config=config)
+    if not entry:
+        raise HTTPException(
+            status_code=404,
+            detail=(
+                f"Entity with id '{entity_id}' not part of Dataset"
+                f" with id '{dataset_id}'"
+            ),
+        )
+    return entry
@@ -0,0 +1,65 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"Routes for looking up entities of any type by their ID"
+
+from fastapi import APIRouter, Depends
+from fastapi.exceptions import HTTPException
+
+from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.config import Config
+from metadata_repository_service.dao.dataset_closure import get_covering_datasets
+from metadata_repository_service.dao.entity_registry import get_entity_registration
+from metadata_repository_service.resolution_models import (
+    CoveringDatasets,
+    EntityRegistration,
+)
+
+entity_router = APIRouter()
+
+
+@entity_router.get(
+    "/entities/{entity_id}",
+    response_model=EntityRegistration,
+    summary="Get the type of an entity",
+    tags=["Query"],
+)
+async def get_entity_type(entity_id: str, config: Config = Depends(get_config)):
+    """
+    Given an ID of an entity of any type, get the type, accession and schema type
+    of the entity from the entity registry.
+    """
+    registration = await get_entity_registration(entity_id, config=config)
+    if not registration:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Entity with id '{entity_id}' not found",
+        )
+    return registration
+
+
+@entity_router.get(
+    "/entities/{entity_id}/datasets",
+    response_model=CoveringDatasets,
+    summary="Get the Datasets that cover an entity",
+    tags=["Query"],
+)
+async def get_entity_datasets(entity_id: str, config: Config = Depends(get_config)):
+    """
+    Given an ID of an entity of any type, get the IDs of the Datasets that
+    reference the entity directly or indirectly, from the Dataset closures.
+    """
+    dataset_ids = await get_covering_datasets([entity_id], config=config)
+    return CoveringDatasets(entity_id=entity_id, dataset_ids=dataset_ids)
@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.experiment_process import get_experiment_process
+from metadata_repository_service.dao.experiment_process import (
+    get_experiment_process,
+    get_experiment_process_batch,
+    get_experiment_process_referenced_by,
+    list_experiment_processes,
+)
 from metadata_repository_service.models import ExperimentProcess
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 experiment_process_router = APIRouter()
 
@@ -48,3 +65,59 @@ async def get_experiment_processes(
             detail=f"{ExperimentProcess.__name__} with id '{experiment_process_id}' not found",
         )
     return experiment_process
+
+
+@experiment_process_router.get(
+    "/experiment_processes",
+    response_model=EntityPage[ExperimentProcess],
+    response_model_exclude_unset=True,
+    summary="List ExperimentProcesses",
+    tags=["Query"],
+)
+async def get_experiment_process_list(
+    page: PageRequest = Depends(entity_page_params(ExperimentProcess)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the ExperimentProcess records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_experiment_processes(page, config=config)
+
+
+@experiment_process_router.post(
+    "/experiment_processes/batch",
+    response_model=EntityBatch[ExperimentProcess],
+    summary="Get many ExperimentProcesses",
+    tags=["Query"],
+)
+async def get_experiment_processes_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given ExperimentProcess IDs and accessions, get the ExperimentProcess records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_experiment_process_batch(batch, embedded=embedded, config=config)
+
+
+@experiment_process_router.get(
+    "/experiment_processes/{experiment_process_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference an ExperimentProcess",
+    tags=["Query"],
+)
+async def get_experiment_process_references(
+    experiment_process_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given an ExperimentProcess ID, get the entities that reference the ExperimentProcess,
+    page by page. The entities are ordered by their type, reference field and ID.
+    """
+    return await get_experiment_process_referenced_by(
+        experiment_process_id, page, config=config
+    )
@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.experiment import get_experiment
+from metadata_repository_service.dao.experiment import (
+    get_experiment,
+    get_experiment_batch,
+    get_experiment_referenced_by,
+    list_experiments,
+)
 from metadata_repository_service.models import Experiment
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 experiment_router = APIRouter()
 
@@ -46,3 +63,57 @@ async def get_experiments(
             detail=f"{Experiment.__name__} with id '{experiment_id}' not found",
         )
     return experiment
+
+
+@experiment_router.get(
+    "/experiments",
+    response_model=EntityPage[Experiment],
+    response_model_exclude_unset=True,
+    summary="List Experiments",
+    tags=["Query"],
+)
+async def get_experiment_list(
+    page: PageRequest = Depends(entity_page_params(Experiment)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Experiment records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_experiments(page, config=config)
+
+
+@experiment_router.post(
+    "/experiments/batch",
+    response_model=EntityBatch[Experiment],
+    summary="Get many Experiments",
+    tags=["Query"],
+)
+async def get_experiments_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Experiment IDs and accessions, get the Experiment records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_experiment_batch(batch, embedded=embedded, config=config)
+
+
+@experiment_router.get(
+    "/experiments/{experiment_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference an Experiment",
+    tags=["Query"],
+)
+async def get_experiment_references(
+    experiment_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given an Experiment ID, get the entities that reference the Experiment,
+    page by page. The entities are ordered by their type, reference field and ID.
+    """
+    return await get_experiment_referenced_by(experiment_id, page, config=config)
@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.file import get_file
+from metadata_repository_service.dao.file import (
+    get_file,
+    get_file_batch,
+    get_file_referenced_by,
+    list_files,
+)
 from metadata_repository_service.models import File
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 file_router = APIRouter()
 
@@ -41,3 +58,57 @@ async def get_files(
             detail=f"{File.__name__} with id '{file_id}' not found",
         )
     return file
+
+
+@file_router.get(
+    "/files",
+    response_model=EntityPage[File],
+    response_model_exclude_unset=True,
+    summary="List Files",
+    tags=["Query"],
+)
+async def get_file_list(
+    page: PageRequest = Depends(entity_page_params(File)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the File records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_files(page, config=config)
+
+
+@file_router.post(
+    "/files/batch",
+    response_model=EntityBatch[File],
+    summary="Get many Files",
+    tags=["Query"],
+)
+async def get_files_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given File IDs and accessions, get the File records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_file_batch(batch, embedded=embedded, config=config)
+
+
+@file_router.get(
+    "/files/{file_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a File",
+    tags=["Query"],
+)
+async def get_file_references(
+    file_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a File ID, get the entities that reference the File, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_file_referenced_by(file_id, page, config=config)
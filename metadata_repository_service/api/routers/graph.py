@@ -0,0 +1,56 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"Routes for walking the references between entities"
+
+from fastapi import APIRouter, Depends
+from fastapi.exceptions import HTTPException
+
+from metadata_repository_service.api.deps import get_config, get_graph_request
+from metadata_repository_service.config import Config
+from metadata_repository_service.dao.entity_registry import REGISTERED_COLLECTIONS
+from metadata_repository_service.dao.graph import get_entity_graph
+from metadata_repository_service.graph_models import Graph, GraphRequest
+
+graph_router = APIRouter()
+
+
+@graph_router.get(
+    "/graph/{entity_type}/{entity_id}",
+    response_model=Graph,
+    summary="Walk the references of an entity",
+    tags=["Query"],
+)
+async def get_graph(
+    entity_type: str,
+    entity_id: str,
+    request: GraphRequest = Depends(get_graph_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given the type and ID of an entity, get the entities that can be reached by
+    following references from it, and the references between them.
+    """
+    if entity_type not in REGISTERED_COLLECTIONS:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown entity type: {entity_type}"
+        )
+    graph = await get_entity_graph(entity_type, entity_id, request, config=config)
+    if not graph:
+        raise HTTPException(
+            status_code=404,
+            detail=f"{entity_type} with id '{entity_id}' not found",
+        )
+    return graph
@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.individual import get_individual
+from metadata_repository_service.dao.individual import (
+    get_individual,
+    get_individual_batch,
+    get_individual_referenced_by,
+    list_individuals,
+)
 from metadata_repository_service.models import Individual
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 individual_router = APIRouter()
 
@@ -46,3 +63,57 @@ async def get_individuals(
             detail=f"{Individual.__name__} with id '{individual_id}' not found",
         )
     return individual
+
+
+@individual_router.get(
+    "/individuals",
+    response_model=EntityPage[Individual],
+    response_model_exclude_unset=True,
+    summary="List Individuals",
+    tags=["Query"],
+)
+async def get_individual_list(
+    page: PageRequest = Depends(entity_page_params(Individual)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Individual records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_individuals(page, config=config)
+
+
+@individual_router.post(
+    "/individuals/batch",
+    response_model=EntityBatch[Individual],
+    summary="Get many Individuals",
+    tags=["Query"],
+)
+async def get_individuals_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Individual IDs and accessions, get the Individual records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_individual_batch(batch, embedded=embedded, config=config)
+
+
+@individual_router.get(
+    "/individuals/{individual_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference an Individual",
+    tags=["Query"],
+)
+async def get_individual_references(
+    individual_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given an Individual ID, get the entities that reference the Individual,
+    page by page. The entities are ordered by their type, reference field and ID.
+    """
+    return await get_individual_referenced_by(individual_id, page, config=config)
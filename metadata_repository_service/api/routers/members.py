@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.member import get_member
+from metadata_repository_service.dao.member import (
+    get_member,
+    get_member_batch,
+    get_member_referenced_by,
+    list_members,
+)
 from metadata_repository_service.models import Member
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 member_router = APIRouter()
 
@@ -44,3 +61,57 @@ async def get_members(
             detail=f"{Member.__name__} with id '{member_id}' not found",
         )
     return member
+
+
+@member_router.get(
+    "/members",
+    response_model=EntityPage[Member],
+    response_model_exclude_unset=True,
+    summary="List Members",
+    tags=["Query"],
+)
+async def get_member_list(
+    page: PageRequest = Depends(entity_page_params(Member)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Member records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_members(page, config=config)
+
+
+@member_router.post(
+    "/members/batch",
+    response_model=EntityBatch[Member],
+    summary="Get many Members",
+    tags=["Query"],
+)
+async def get_members_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Member IDs and accessions, get the Member records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_member_batch(batch, embedded=embedded, config=config)
+
+
+@member_router.get(
+    "/members/{member_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Member",
+    tags=["Query"],
+)
+async def get_member_references(
+    member_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Member ID, get the entities that reference the Member, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_member_referenced_by(member_id, page, config=config)
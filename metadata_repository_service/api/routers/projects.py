@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.project import get_project
+from metadata_repository_service.dao.project import (
+    get_project,
+    get_project_batch,
+    get_project_referenced_by,
+    list_projects,
+)
 from metadata_repository_service.models import Project
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 project_router = APIRouter()
 
@@ -44,3 +61,57 @@ async def get_projects(
             detail=f"{Project.__name__} with id '{project_id}' not found",
         )
     return project
+
+
+@project_router.get(
+    "/projects",
+    response_model=EntityPage[Project],
+    response_model_exclude_unset=True,
+    summary="List Projects",
+    tags=["Query"],
+)
+async def get_project_list(
+    page: PageRequest = Depends(entity_page_params(Project)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Project records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_projects(page, config=config)
+
+
+@project_router.post(
+    "/projects/batch",
+    response_model=EntityBatch[Project],
+    summary="Get many Projects",
+    tags=["Query"],
+)
+async def get_projects_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Project IDs and accessions, get the Project records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_project_batch(batch, embedded=embedded, config=config)
+
+
+@project_router.get(
+    "/projects/{project_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Project",
+    tags=["Query"],
+)
+async def get_project_references(
+    project_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Project ID, get the entities that reference the Project, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_project_referenced_by(project_id, page, config=config)
@@ -19,10 +19,32 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.protocol import get_protocol
-from metadata_repository_service.models import AnnotatedProtocol, Protocol
+from metadata_repository_service.dao.protocol import (
+    get_protocol,
+    get_protocol_batch,
+    get_protocol_referenced_by,
+    list_protocols,
+)
+from metadata_repository_service.models import (
+    AnnotatedProtocol,
+    LibraryPreparationProtocol,
+    Protocol,
+    SequencingProtocol,
+)
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 protocol_router = APIRouter()
 
@@ -48,3 +70,59 @@ async def get_protocols(
             detail=f"{Protocol.__name__} with id '{protocol_id}' not found",
         )
     return protocol
+
+
+@protocol_router.get(
+    "/protocols",
+    response_model=EntityPage[AnnotatedProtocol],
+    response_model_exclude_unset=True,
+    summary="List Protocols",
+    tags=["Query"],
+)
+async def get_protocol_list(
+    page: PageRequest = Depends(
+        entity_page_params(Protocol, SequencingProtocol, LibraryPreparationProtocol)
+    ),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Protocol records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_protocols(page, config=config)
+
+
+@protocol_router.post(
+    "/protocols/batch",
+    response_model=EntityBatch[AnnotatedProtocol],
+    summary="Get many Protocols",
+    tags=["Query"],
+)
+async def get_protocols_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Protocol IDs and accessions, get the Protocol records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_protocol_batch(batch, embedded=embedded, config=config)
+
+
+@protocol_router.get(
+    "/protocols/{protocol_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Protocol",
+    tags=["Query"],
+)
+async def get_protocol_references(
+    protocol_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Protocol ID, get the entities that reference the Protocol, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_protocol_referenced_by(protocol_id, page, config=config)
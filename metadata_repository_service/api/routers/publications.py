@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.publication import get_publication
+from metadata_repository_service.dao.publication import (
+    get_publication,
+    get_publication_batch,
+    get_publication_referenced_by,
+    list_publications,
+)
 from metadata_repository_service.models import Publication
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 publication_router = APIRouter()
 
@@ -46,3 +63,57 @@ async def get_publications(
             detail=f"{Publication.__name__} with id '{publication_id}' not found",
         )
     return publication
+
+
+@publication_router.get(
+    "/publications",
+    response_model=EntityPage[Publication],
+    response_model_exclude_unset=True,
+    summary="List Publications",
+    tags=["Query"],
+)
+async def get_publication_list(
+    page: PageRequest = Depends(entity_page_params(Publication)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Publication records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_publications(page, config=config)
+
+
+@publication_router.post(
+    "/publications/batch",
+    response_model=EntityBatch[Publication],
+    summary="Get many Publications",
+    tags=["Query"],
+)
+async def get_publications_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Publication IDs and accessions, get the Publication records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_publication_batch(batch, embedded=embedded, config=config)
+
+
+@publication_router.get(
+    "/publications/{publication_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Publication",
+    tags=["Query"],
+)
+async def get_publication_references(
+    publication_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Publication ID, get the entities that reference the Publication,
+    page by page. The entities are ordered by their type, reference field and ID.
+    """
+    return await get_publication_referenced_by(publication_id, page, config=config)
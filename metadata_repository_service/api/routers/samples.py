@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.sample import get_sample
+from metadata_repository_service.dao.sample import (
+    get_sample,
+    get_sample_batch,
+    get_sample_referenced_by,
+    list_samples,
+)
 from metadata_repository_service.models import Sample
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 sample_router = APIRouter()
 
@@ -44,3 +61,57 @@ async def get_samples(
             detail=f"{Sample.__name__} with id '{sample_id}' not found",
         )
     return sample
+
+
+@sample_router.get(
+    "/samples",
+    response_model=EntityPage[Sample],
+    response_model_exclude_unset=True,
+    summary="List Samples",
+    tags=["Query"],
+)
+async def get_sample_list(
+    page: PageRequest = Depends(entity_page_params(Sample)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Sample records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_samples(page, config=config)
+
+
+@sample_router.post(
+    "/samples/batch",
+    response_model=EntityBatch[Sample],
+    summary="Get many Samples",
+    tags=["Query"],
+)
+async def get_samples_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Sample IDs and accessions, get the Sample records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_sample_batch(batch, embedded=embedded, config=config)
+
+
+@sample_router.get(
+    "/samples/{sample_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Sample",
+    tags=["Query"],
+)
+async def get_sample_references(
+    sample_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Sample ID, get the entities that reference the Sample, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_sample_referenced_by(sample_id, page, config=config)
@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.study import get_study
+from metadata_repository_service.dao.study import (
+    get_study,
+    get_study_batch,
+    get_study_referenced_by,
+    list_studies,
+)
 from metadata_repository_service.models import Study
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 study_router = APIRouter()
 
@@ -41,3 +58,57 @@ async def get_studies(
             detail=f"{Study.__name__} with id '{study_id}' not found",
         )
     return study
+
+
+@study_router.get(
+    "/studies",
+    response_model=EntityPage[Study],
+    response_model_exclude_unset=True,
+    summary="List Studies",
+    tags=["Query"],
+)
+async def get_study_list(
+    page: PageRequest = Depends(entity_page_params(Study)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Study records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_studies(page, config=config)
+
+
+@study_router.post(
+    "/studies/batch",
+    response_model=EntityBatch[Study],
+    summary="Get many Studies",
+    tags=["Query"],
+)
+async def get_studies_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Study IDs and accessions, get the Study records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_study_batch(batch, embedded=embedded, config=config)
+
+
+@study_router.get(
+    "/studies/{study_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Study",
+    tags=["Query"],
+)
+async def get_study_references(
+    study_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Study ID, get the entities that reference the Study, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_study_referenced_by(study_id, page, config=config)
@@ -17,17 +17,32 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
 from metadata_repository_service.creation_models import CreateSubmission
 from metadata_repository_service.dao.submission import (
     add_submission,
     get_submission,
+    get_submission_batch,
+    get_submission_referenced_by,
+    list_submissions,
     patch_submission,
     update_submission,
 )
 from metadata_repository_service.models import Submission
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 from metadata_repository_service.patch_models import SubmissionStatusPatch
+from metadata_repository_service.resolution_models import EntityReference
 
 submission_router = APIRouter()
 
@@ -132,3 +147,57 @@ async def update_full_submission(
     updated_submission = await update_submission(submission, input_submission, config)
 
     return updated_submission
+
+
+@submission_router.get(
+    "/submissions",
+    response_model=EntityPage[Submission],
+    response_model_exclude_unset=True,
+    summary="List Submissions",
+    tags=["Query"],
+)
+async def get_submission_list(
+    page: PageRequest = Depends(entity_page_params(Submission)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Submission records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_submissions(page, config=config)
+
+
+@submission_router.post(
+    "/submissions/batch",
+    response_model=EntityBatch[Submission],
+    summary="Get many Submissions",
+    tags=["Query"],
+)
+async def get_submissions_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Submission IDs and accessions, get the Submission records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_submission_batch(batch, embedded=embedded, config=config)
+
+
+@submission_router.get(
+    "/submissions/{submission_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Submission",
+    tags=["Query"],
+)
+async def get_submission_references(
+    submission_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Submission ID, get the entities that reference the Submission, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_submission_referenced_by(submission_id, page, config=config)
@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.technology import get_technology
+from metadata_repository_service.dao.technology import (
+    get_technology,
+    get_technology_batch,
+    get_technology_referenced_by,
+    list_technologies,
+)
 from metadata_repository_service.models import Technology
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 technology_router = APIRouter()
 
@@ -46,3 +63,57 @@ async def get_technologies(
             detail=f"{Technology.__name__} with id '{technology_id}' not found",
         )
     return technology
+
+
+@technology_router.get(
+    "/technologies",
+    response_model=EntityPage[Technology],
+    response_model_exclude_unset=True,
+    summary="List Technologies",
+    tags=["Query"],
+)
+async def get_technology_list(
+    page: PageRequest = Depends(entity_page_params(Technology)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Technology records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_technologies(page, config=config)
+
+
+@technology_router.post(
+    "/technologies/batch",
+    response_model=EntityBatch[Technology],
+    summary="Get many Technologies",
+    tags=["Query"],
+)
+async def get_technologies_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Technology IDs and accessions, get the Technology records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_technology_batch(batch, embedded=embedded, config=config)
+
+
+@technology_router.get(
+    "/technologies/{technology_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Technology",
+    tags=["Query"],
+)
+async def get_technology_references(
+    technology_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Technology ID, get the entities that reference the Technology, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_technology_referenced_by(technology_id, page, config=config)
@@ -17,10 +17,27 @@
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from metadata_repository_service.api.deps import get_config
+from metadata_repository_service.api.deps import (
+    entity_page_params,
+    get_batch_request,
+    get_config,
+    get_reference_page_request,
+)
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import Config
-from metadata_repository_service.dao.workflow import get_workflow
+from metadata_repository_service.dao.workflow import (
+    get_workflow,
+    get_workflow_batch,
+    get_workflow_referenced_by,
+    list_workflows,
+)
 from metadata_repository_service.models import Workflow
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
 
 workflow_router = APIRouter()
 
@@ -46,3 +63,57 @@ async def get_workflows(
             detail=f"{Workflow.__name__} with id '{workflow_id}' not found",
         )
     return workflow
+
+
+@workflow_router.get(
+    "/workflows",
+    response_model=EntityPage[Workflow],
+    response_model_exclude_unset=True,
+    summary="List Workflows",
+    tags=["Query"],
+)
+async def get_workflow_list(
+    page: PageRequest = Depends(entity_page_params(Workflow)),
+    config: Config = Depends(get_config),
+):
+    """
+    Page through the Workflow records of the metadata store, in the order of
+    their IDs or creation dates.
+    """
+    return await list_workflows(page, config=config)
+
+
+@workflow_router.post(
+    "/workflows/batch",
+    response_model=EntityBatch[Workflow],
+    summary="Get many Workflows",
+    tags=["Query"],
+)
+async def get_workflows_in_batch(
+    batch: BatchRequest = Depends(get_batch_request),
+    embedded: bool = False,
+    config: Config = Depends(get_config),
+):
+    """
+    Given Workflow IDs and accessions, get the Workflow records from the
+    metadata store at once. IDs and accessions without a record are reported.
+    """
+    return await get_workflow_batch(batch, embedded=embedded, config=config)
+
+
+@workflow_router.get(
+    "/workflows/{workflow_id}/referenced_by",
+    response_model=EntityPage[EntityReference],
+    summary="Get the entities that reference a Workflow",
+    tags=["Query"],
+)
+async def get_workflow_references(
+    workflow_id: str,
+    page: ReferencePageRequest = Depends(get_reference_page_request),
+    config: Config = Depends(get_config),
+):
+    """
+    Given a Workflow ID, get the entities that reference the Workflow, page by page.
+    The entities are ordered by their type, reference field and ID.
+    """
+    return await get_workflow_referenced_by(workflow_id, page, config=config)
@@ -0,0 +1,83 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Models for operations on many objects at once"""
+
+from typing import Dict, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+from pydantic.generics import GenericModel
+
+from metadata_repository_service.models import Dataset
+
+EntityT = TypeVar("EntityT")
+
+
+class DatasetCreationResult(BaseModel):
+    """
+    The outcome of the creation of one Dataset of a bulk request.
+    """
+
+    index: int = Field(
+        ..., description="The position of the Dataset in the bulk request."
+    )
+    dataset: Optional[Dataset] = Field(
+        None, description="The created Dataset, if the creation succeeded."
+    )
+    error: Optional[str] = Field(
+        None, description="Why the Dataset could not be created, if it failed."
+    )
+    missing: Optional[Dict[str, List[str]]] = Field(
+        None,
+        description="The accessions that could not be found, per reference field.",
+    )
+
+
+class BulkDatasetCreation(BaseModel):
+    """
+    The outcome of a bulk creation of Datasets.
+    """
+
+    created: int = Field(..., description="The number of created Datasets.")
+    failed: int = Field(
+        ..., description="The number of Datasets that could not be created."
+    )
+    results: List[DatasetCreationResult] = Field(
+        ..., description="The outcome for each Dataset, in the order of the request."
+    )
+
+
+class BatchRequest(BaseModel):
+    """
+    The IDs and accessions of the entities to look up at once.
+    """
+
+    ids: List[str] = Field([], description="The IDs of the entities.")
+    accessions: List[str] = Field([], description="The accessions of the entities.")
+
+
+class EntityBatch(GenericModel, Generic[EntityT]):
+    """
+    The entities that were found for a batch request.
+    """
+
+    items: List[EntityT] = Field(
+        ..., description="The found entities, in the order of the request."
+    )
+    missing_ids: List[str] = Field(
+        [], description="The requested IDs without an entity."
+    )
+    missing_accessions: List[str] = Field(
+        [], description="The requested accessions without an entity."
+    )
@@ -16,9 +16,11 @@
 """Config Parameter Modeling and Parsing"""
 
 import logging.config
+from typing import Literal, Optional
 
 from ghga_service_chassis_lib.api import ApiConfigBase
 from ghga_service_chassis_lib.config import config_from_yaml
+from pydantic import Field
 
 
 def configure_logging():
@@ -64,6 +66,113 @@ class Config(ApiConfigBase):
     # are inherited from PubSubConfigBase;
     db_url: str = "mongodb://localhost:27017"
     db_name: str = "metadata-store"
+    db_max_pool_size: int = Field(
+        100, description="Maximum number of connections in the database pool."
+    )
+    db_min_pool_size: int = Field(
+        0, description="Minimum number of connections kept in the database pool."
+    )
+    db_max_idle_time_ms: Optional[int] = Field(
+        60_000,
+        description="Milliseconds a pooled database connection may stay idle"
+        + " before it is closed. Set to null to keep idle connections open.",
+    )
+    db_connect_timeout_ms: int = Field(
+        20_000, description="Timeout in milliseconds for opening a connection."
+    )
+    db_server_selection_timeout_ms: int = Field(
+        30_000,
+        description="Timeout in milliseconds for finding a suitable database server.",
+    )
+    db_socket_timeout_ms: Optional[int] = Field(
+        None,
+        description="Timeout in milliseconds for a single database operation."
+        + " Set to null to wait indefinitely.",
+    )
+    db_create_indexes: bool = Field(
+        True,
+        description="Whether to create the missing indexes of the metadata store"
+        + " when the service starts. Indexes that differ from their declaration"
+        + " or are not declared are only reported.",
+    )
+    accession_strategy: Literal["random", "counter"] = Field(
+        "random",
+        description="How accessions are generated: 'random' reserves random"
+        + " accessions in the accession tracker, 'counter' numbers them"
+        + " sequentially per prefix. The counter strategy does not check for"
+        + " existing random accessions and is meant for new metadata stores.",
+    )
+    accession_block_size: int = Field(
+        1000,
+        description="Number of sequential accessions that each process reserves"
+        + " ahead of time with the 'counter' accession strategy.",
+        ge=0,
+    )
+    embedding_engine: Literal["python", "aggregation"] = Field(
+        "python",
+        description="How references are embedded: 'python' resolves them with"
+        + " batched queries per level, 'aggregation' joins them on the database"
+        + " server with $lookup in a single round trip.",
+    )
+    entity_cache_size: int = Field(
+        10_000,
+        description="Maximum number of entities kept in the in-process entity"
+        + " cache. Set to 0 to disable the cache.",
+    )
+    entity_cache_ttl: float = Field(
+        300,
+        description="Seconds after which a cached entity expires. This bounds how"
+        + " long changes made by other processes may go unnoticed.",
+    )
+    accession_cache_size: int = Field(
+        100_000,
+        description="Maximum number of resolved accessions kept in the in-process"
+        + " accession cache. Resolved accessions expire like cached entities."
+        + " Set to 0 to disable the cache.",
+    )
+    dataset_embedded_chunk_size: int = Field(
+        1000,
+        description="Number of embedded entities per relation (e.g. files) that"
+        + " are stored together in one chunk of an embedded Dataset.",
+        ge=1,
+    )
+    default_page_size: int = Field(
+        100,
+        description="Number of entities per page, if a client pages through"
+        + " entities without giving a limit.",
+        ge=1,
+    )
+    max_page_size: int = Field(
+        1000,
+        description="Maximum number of entities per page. Larger limits requested"
+        + " by clients are reduced to this size.",
+        ge=1,
+    )
+    max_batch_size: int = Field(
+        1000,
+        description="Maximum number of IDs and accessions that clients can look"
+        + " up at once with the batch endpoints.",
+        ge=1,
+    )
+    max_graph_depth: int = Field(
+        10,
+        description="Maximum number of references that clients can follow from"
+        + " an entity with the graph endpoint. Larger depths are reduced to it.",
+        ge=1,
+    )
+    max_graph_nodes: int = Field(
+        1000,
+        description="Maximum number of entities that the graph endpoint returns."
+        + " Walks that reach more entities are cut off.",
+        ge=1,
+    )
+    background_max_concurrency: int = Field(
+        4,
+        description="Maximum number of background jobs, e.g. recomputing dirty"
+        + " Dataset summaries or materializing new Datasets, that each process"
+        + " runs at the same time.",
+        ge=1,
+    )
 
 
 CONFIG = Config()
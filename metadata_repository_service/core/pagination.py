@@ -0,0 +1,73 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Opaque cursors for paging through entities.
+
+A cursor is the URL-safe base64 encoding of the JSON position of the next page.
+Clients pass it back unchanged and must not rely on its content.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict, Optional
+
+from metadata_repository_service.config import CONFIG, Config
+
+
+class CursorError(RuntimeError):
+    """Raised when a cursor cannot be decoded."""
+
+
+def encode_cursor(position: Dict[str, Any]) -> str:
+    """
+    Encode the position of a page as an opaque cursor.
+
+    Args:
+        position: The JSON serializable position of the page
+
+    Returns:
+        The cursor
+
+    """
+    data = json.dumps(position, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(data.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor that was encoded with ``encode_cursor``.
+
+    Args:
+        cursor: The cursor
+
+    Returns:
+        The position of the page
+
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(data)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as error:
+        raise CursorError(f"Invalid cursor '{cursor}'") from error
+    if not isinstance(position, dict):
+        raise CursorError(f"Invalid cursor '{cursor}'")
+    return position
+
+
+def get_page_size(limit: Optional[int], config: Config = CONFIG) -> int:
+    """Get the size of a page, given the limit requested by a client."""
+    if limit is None:
+        return config.default_page_size
+    return min(limit, config.max_page_size)
@@ -0,0 +1,111 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+In-process scheduling of background jobs.
+"""
+
+import asyncio
+import contextvars
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List
+
+from metadata_repository_service.config import CONFIG, Config
+
+Job = Callable[[], Awaitable[Any]]
+
+log = logging.getLogger(__name__)
+
+
+class BackgroundScheduler:
+    """Runs keyed jobs in the background of the event loop, with at most
+    ``max_concurrency`` jobs at a time.
+
+    A job that is scheduled again before it started is only run once. A job
+    that is scheduled again while it runs is run once more afterwards, so that
+    it sees the changes that led to scheduling it again. Failing jobs are logged.
+    Jobs run in a fresh context, so that they do not inherit the request-scoped
+    state of the request that scheduled them.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self._jobs: Dict[Hashable, Job] = {}
+        self._queue: Deque[Hashable] = deque()
+        self._running: Dict[Hashable, "asyncio.Task[None]"] = {}
+
+    def schedule(self, key: Hashable, job: Job):
+        """Schedule a job, replacing a job with the same key that did not start yet.
+
+        This must be called from within the running event loop.
+        """
+        if key not in self._jobs and key not in self._running:
+            self._queue.append(key)
+        self._jobs[key] = job
+        self._start_jobs()
+
+    def pending(self) -> int:
+        """Get the number of jobs that are waiting or running."""
+        return len(self._jobs) + len(self._running)
+
+    async def join(self):
+        """Wait until all scheduled jobs, including the ones they schedule, are done."""
+        while self._running:
+            await asyncio.gather(*self._running.values(), return_exceptions=True)
+
+    async def close(self):
+        """Drop the waiting jobs and cancel the running ones."""
+        self._jobs.clear()
+        self._queue.clear()
+        tasks = list(self._running.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start_jobs(self):
+        """Start waiting jobs as long as the concurrency allows it."""
+        while self._queue and len(self._running) < self.max_concurrency:
+            key = self._queue.popleft()
+            job = self._jobs.pop(key)
+            loop = asyncio.get_running_loop()
+            coroutine = self._run(key, job)
+            self._running[key] = contextvars.Context().run(
+                lambda: loop.create_task(coroutine)
+            )
+
+    async def _run(self, key: Hashable, job: Job):
+        """Run a job and start the next ones when it is done."""
+        try:
+            await job()
+        except Exception:  # pylint: disable=broad-except
+            log.exception("Background job %s failed", key)
+        finally:
+            del self._running[key]
+            if key in self._jobs:
+                self._queue.append(key)
+            self._start_jobs()
+
+
+# The background scheduler of this process, created on first use
+_SCHEDULER: List[BackgroundScheduler] = []
+
+
+def get_background_scheduler(config: Config = CONFIG) -> BackgroundScheduler:
+    """Get the scheduler for the background jobs of this process, e.g. the
+    recomputation of dirty summaries and the materialization of Datasets."""
+    if not _SCHEDULER:
+        _SCHEDULER.append(BackgroundScheduler(config.background_max_concurrency))
+    return _SCHEDULER[0]
@@ -0,0 +1,54 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Deduplication of concurrent calls.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Lets concurrent calls with the same key share a single execution.
+
+    The first call for a key starts the execution, all calls for the key that
+    arrive until it is done wait for its result (or exception). A caller that
+    is cancelled while waiting does not cancel the execution for the others.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Run the call, unless a call with the same key is in flight already,
+        and return the result of the call that is in flight."""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(call())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+
+    def in_flight(self) -> int:
+        """Get the number of calls that are in flight."""
+        return len(self._calls)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]"):
+        """Forget a call that is done."""
+        if self._calls.get(key) is future:
+            del self._calls[key]
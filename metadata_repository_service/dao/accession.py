@@ -0,0 +1,280 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Allocation of unique accessions.
+
+There are two strategies, selected by the ``accession_strategy`` config:
+
+- ``random`` accessions are reserved in the accession tracker collection, whose
+  unique index rejects accessions that were issued before.
+- ``counter`` accessions are numbered sequentially per prefix. A counter document
+  per prefix is advanced with an atomic ``$inc`` by a whole block of numbers,
+  which each process then hands out from memory without further round trips.
+  Numbers of blocks that are not used up (e.g. on restart) are skipped. Since the
+  counted accessions are not checked against the tracker, the counter strategy
+  is meant for metadata stores that have not been filled with random
+  accessions of the same prefix.
+"""
+
+import logging
+import random
+from typing import Dict, List, Set, Tuple
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.utils import get_timestamp
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.indexes import field_index
+
+ACCESSION_TRACKER_COLLECTION = "_accession_tracker_"
+ACCESSION_TRACKER_INDEXES = [field_index("accession", unique=True)]
+# Whether the accession tracker of a database has its unique index
+_ACCESSION_TRACKER_INDEXED: Dict[Tuple[str, str], bool] = {}
+# Rounds of collisions after which the accession allocation gives up
+ACCESSION_ALLOCATION_ATTEMPTS = 10
+DUPLICATE_KEY_ERROR = 11000
+
+ACCESSION_COUNTER_COLLECTION = "_accession_counters_"
+ACCESSION_NUMBER_DIGITS = 12
+MAX_ACCESSION_NUMBER = 10**ACCESSION_NUMBER_DIGITS - 1
+# Unused numbers of the last reserved block per database and prefix: [next, end)
+_ACCESSION_BLOCKS: Dict[Tuple[str, str, str], Tuple[int, int]] = {}
+
+
+class AccessionAllocationError(RuntimeError):
+    """Raised when no unique accessions could be allocated."""
+
+
+async def generate_accession(collection_name: str, config: Config = CONFIG) -> str:
+    """
+    Generate a unique accession.
+
+    Args:
+        collection_name: The name of the collection
+        config: Runtime configuration
+
+    Returns:
+        A new accession
+
+    """
+    accessions = await allocate_accessions({collection_name: 1}, config=config)
+    return accessions[collection_name][0]
+
+
+async def allocate_accessions(
+    counts: Dict[str, int], config: Config = CONFIG
+) -> Dict[str, List[str]]:
+    """
+    Allocate unique accessions for several collections at once,
+    with the strategy of the runtime configuration.
+
+    Args:
+        counts: The number of accessions to allocate per collection name
+        config: Runtime configuration
+
+    Returns:
+        The allocated accessions per collection name
+
+    """
+    if config.accession_strategy == "counter":
+        return {
+            collection_name: await _allocate_counted_accessions(
+                collection_name, count, config=config
+            )
+            for collection_name, count in counts.items()
+        }
+    return await _allocate_random_accessions(counts, config=config)
+
+
+async def _allocate_random_accessions(
+    counts: Dict[str, int], config: Config = CONFIG
+) -> Dict[str, List[str]]:
+    """Allocate random accessions for several collections at once.
+
+    The candidates are reserved in the accession tracker with one unordered
+    ``insert_many``. Its unique index rejects the candidates that were issued
+    before, and only those are replaced by new candidates and retried.
+    """
+    client = await get_db_client(config)
+    collection = client[config.db_name][ACCESSION_TRACKER_COLLECTION]
+    indexed = await _ensure_accession_tracker_indexes(config)
+    allocated: Dict[str, List[str]] = {name: [] for name in counts}
+    pending = [name for name, count in counts.items() for _ in range(count)]
+    for _ in range(ACCESSION_ALLOCATION_ATTEMPTS):
+        if not pending:
+            return allocated
+        candidates = _generate_candidates(pending)
+        rejected = await _reserve_candidates(collection, candidates, indexed)
+        for index, (collection_name, accession) in enumerate(zip(pending, candidates)):
+            if index not in rejected:
+                allocated[collection_name].append(accession)
+        pending = [pending[index] for index in sorted(rejected)]
+    if pending:
+        raise AccessionAllocationError(
+            f"Could not allocate {len(pending)} unique accessions after"
+            + f" {ACCESSION_ALLOCATION_ATTEMPTS} attempts"
+        )
+    return allocated
+
+
+async def _reserve_candidates(
+    collection: AsyncIOMotorCollection, candidates: List[str], indexed: bool
+) -> Set[int]:
+    """Insert candidate accessions into the accession tracker and return the
+    indexes of the candidates that were issued before.
+
+    Without the unique index of the tracker, the candidates that exist already
+    are looked up before the insertion instead.
+    """
+    rejected: Set[int] = set()
+    if not indexed:
+        issued = await collection.find(
+            {"accession": {"$in": candidates}}, {"accession": True}
+        ).to_list(None)
+        issued_accessions = {x["accession"] for x in issued}
+        rejected = {i for i, x in enumerate(candidates) if x in issued_accessions}
+    positions = [i for i in range(len(candidates)) if i not in rejected]
+    if not positions:
+        return rejected
+    timestamp = await get_timestamp()
+    try:
+        await collection.insert_many(
+            [{"accession": candidates[i], "timestamp": timestamp} for i in positions],
+            ordered=False,
+        )
+    except BulkWriteError as error:
+        write_errors = error.details.get("writeErrors", [])
+        if any(x.get("code") != DUPLICATE_KEY_ERROR for x in write_errors):
+            raise
+        rejected.update(positions[x["index"]] for x in write_errors)
+    return rejected
+
+
+async def _allocate_counted_accessions(
+    collection_name: str, count: int, config: Config = CONFIG
+) -> List[str]:
+    """Allocate sequential accessions for a collection.
+
+    The numbers are taken from the block of this process first. If the block
+    does not suffice, the counter of the prefix is advanced by the missing
+    numbers plus a new block in one atomic update.
+    """
+    prefix = get_accession_prefix(collection_name)
+    key = (config.db_url, config.db_name, prefix)
+    next_number, end = _ACCESSION_BLOCKS.get(key, (0, 0))
+    taken = min(count, end - next_number)
+    numbers = list(range(next_number, next_number + taken))
+    _ACCESSION_BLOCKS[key] = (next_number + taken, end)
+    missing = count - taken
+    if missing > 0:
+        reserved = missing + config.accession_block_size
+        client = await get_db_client(config)
+        collection = client[config.db_name][ACCESSION_COUNTER_COLLECTION]
+        counter = await collection.find_one_and_update(
+            {"_id": prefix},
+            {"$inc": {"value": reserved}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        end = counter["value"] + 1
+        start = end - reserved
+        if end - 1 > MAX_ACCESSION_NUMBER:
+            raise AccessionAllocationError(
+                f"The accession counter of {prefix} is exhausted"
+            )
+        numbers.extend(range(start, start + missing))
+        # a block reserved concurrently by another task is dropped here,
+        # which only leaves a gap in the numbering
+        _ACCESSION_BLOCKS[key] = (start + missing, end)
+    return [_format_accession(prefix, number) for number in numbers]
+
+
+def _generate_candidates(collection_names: List[str]) -> List[str]:
+    """Generate distinct candidate accessions, one for each collection name."""
+    candidates: List[str] = []
+    seen: Set[str] = set()
+    for collection_name in collection_names:
+        accession = _generate_accession(collection_name)
+        while accession in seen:
+            accession = _generate_accession(collection_name)
+        seen.add(accession)
+        candidates.append(accession)
+    return candidates
+
+
+async def _ensure_accession_tracker_indexes(config: Config = CONFIG) -> bool:
+    """Create the unique index that the accession allocation relies on,
+    once per database and process, and return whether it exists."""
+    key = (config.db_url, config.db_name)
+    if key in _ACCESSION_TRACKER_INDEXED:
+        return _ACCESSION_TRACKER_INDEXED[key]
+    client = await get_db_client(config)
+    collection = client[config.db_name][ACCESSION_TRACKER_COLLECTION]
+    try:
+        await collection.create_indexes(ACCESSION_TRACKER_INDEXES)
+    except OperationFailure as error:
+        logging.error(
+            "The accession tracker cannot be indexed, so issued accessions are"
+            " looked up before new ones are reserved: %s",
+            error,
+        )
+        _ACCESSION_TRACKER_INDEXED[key] = False
+    else:
+        _ACCESSION_TRACKER_INDEXED[key] = True
+    return _ACCESSION_TRACKER_INDEXED[key]
+
+
+def get_accession_prefix(collection_name: str) -> str:
+    """
+    Get the prefix of the accessions of a collection.
+
+    Args:
+        collection_name: The name of the collection
+
+    Returns:
+        The accession prefix, e.g. ``GHGA:DAP`` for ``DataAccessPolicy``
+
+    """
+    special_accession_prefix = {
+        "DataAccessPolicy": "DAP",
+        "DataAccessCommittee": "DAC",
+    }
+    collection_abbr = special_accession_prefix.get(
+        collection_name, collection_name[:3].upper()
+    )
+    return f"GHGA:{collection_abbr}"
+
+
+def _generate_accession(collection_name: str) -> str:
+    """
+    Generate a random accession for a collection.
+
+    Args:
+        collection_name: The name of the collection
+
+    Returns:
+        A new accession
+
+    """
+    reference = random.randint(1, MAX_ACCESSION_NUMBER)  # nosec
+    return _format_accession(get_accession_prefix(collection_name), reference)
+
+
+def _format_accession(prefix: str, number: int) -> str:
+    """Format an accession from its prefix and number."""
+    return f"{prefix}{str(number).zfill(ACCESSION_NUMBER_DIGITS)}"
@@ -0,0 +1,139 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Resolution of accessions to the entities they identify.
+
+The prefix of an accession (e.g. ``GHGA:FIL``) determines the collection of its
+entity, so each accession is looked up with an indexed query on that collection
+only. Resolved accessions are kept in the accession cache, which is invalidated
+by writes to the collection like the entity cache.
+"""
+
+from typing import Dict, List, Optional
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.dao.accession import (
+    ACCESSION_NUMBER_DIGITS,
+    get_accession_prefix,
+)
+from metadata_repository_service.dao.cache import get_accession_cache
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.utils import ACCESSIONED_ENTITIES
+from metadata_repository_service.resolution_models import (
+    AccessionResolution,
+    ResolvedAccession,
+)
+
+# The collection of the entities per accession prefix
+ACCESSION_COLLECTIONS = {
+    get_accession_prefix(collection_name): collection_name
+    for collection_name in sorted(ACCESSIONED_ENTITIES)
+}
+
+
+def get_accession_collection(accession: str) -> Optional[str]:
+    """
+    Get the collection of the entity that an accession identifies.
+
+    Args:
+        accession: The accession, e.g. ``GHGA:FIL000000000001``
+
+    Returns:
+        The name of the collection, or ``None`` if the accession is malformed
+        or its prefix is unknown
+
+    """
+    prefix = accession[:-ACCESSION_NUMBER_DIGITS]
+    number = accession[-ACCESSION_NUMBER_DIGITS:]
+    if len(number) != ACCESSION_NUMBER_DIGITS or not number.isdigit():
+        return None
+    return ACCESSION_COLLECTIONS.get(prefix)
+
+
+async def resolve_accessions(
+    accessions: List[str], config: Config = CONFIG
+) -> AccessionResolution:
+    """
+    Given accessions, get the types and IDs of the entities they identify,
+    with one query per collection for the accessions that are not cached.
+
+    Args:
+        accessions: The accessions to resolve
+        config: Runtime configuration
+
+    Returns:
+        The resolved accessions in the order of the request, and the accessions
+        without an entity
+
+    """
+    accessions = list(dict.fromkeys(accessions))
+    cache = get_accession_cache(config)
+    resolved: Dict[str, Dict] = {}
+    pending: Dict[str, List[str]] = {}
+    for accession in accessions:
+        collection_name = get_accession_collection(accession)
+        if collection_name is None:
+            continue
+        cached = (
+            cache.get((collection_name, "accession", accession, None))
+            if cache
+            else None
+        )
+        if cached is not None:
+            resolved[accession] = cached
+        else:
+            pending.setdefault(collection_name, []).append(accession)
+
+    if pending:
+        client = await get_db_client(config)
+    for collection_name, collection_accessions in pending.items():
+        collection = client[config.db_name][collection_name]
+        async for document in collection.find(
+            {"accession": {"$in": collection_accessions}},
+            {"_id": False, "id": True, "accession": True},
+        ):
+            entry = {
+                "accession": document["accession"],
+                "entity_type": collection_name,
+                "id": document["id"],
+            }
+            if cache:
+                cache.put(
+                    (collection_name, "accession", entry["accession"], None), entry
+                )
+            resolved[entry["accession"]] = entry
+
+    return AccessionResolution(
+        items=[ResolvedAccession(**resolved[x]) for x in accessions if x in resolved],
+        missing=[x for x in accessions if x not in resolved],
+    )
+
+
+async def resolve_accession(
+    accession: str, config: Config = CONFIG
+) -> Optional[ResolvedAccession]:
+    """
+    Given an accession, get the type and ID of the entity it identifies.
+
+    Args:
+        accession: The accession to resolve
+        config: Runtime configuration
+
+    Returns:
+        The resolved accession, or ``None`` if there is no such entity
+
+    """
+    resolution = await resolve_accessions([accession], config=config)
+    return resolution.items[0] if resolution.items else None
@@ -16,32 +16,115 @@
 Convenience methods for retrieving Analysis records
 """
 
-from typing import List
+from typing import AsyncIterator, List
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.dao.batch import get_entity_batch
 from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import embed_references, get_entity
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import (
+    embed_documents,
+    get_entity,
+    get_reference_fields,
+)
 from metadata_repository_service.models import Analysis
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Analysis"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    # files are looked up by get_analysis_by_linked_files
+    *reference_indexes([*get_reference_fields(COLLECTION_NAME), "has_file"]),
+]
 
 
-async def retrieve_analyses(config: Config = CONFIG) -> List[str]:
+async def retrieve_analyses(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Analysis objects from metadata store.
+    Retrieve the Analysis object IDs from metadata store, without loading
+    the Analysis objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Analysis object IDs.
+
+    """
+    async for analysis_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield analysis_id
+
+
+async def list_analyses(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Analysis objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of Analysis object IDs.
+        The page of Analysis objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    analyses = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in analyses]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Analysis, config=config
+    )
+
+
+async def get_analysis_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Analysis IDs and accessions, get the Analysis objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Analysis IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found Analysis objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=Analysis, embedded=embedded, config=config
+    )
+
+
+async def get_analysis_referenced_by(
+    analysis_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given an Analysis ID, get a page of the entities that reference the Analysis.
+
+    Args:
+        analysis_id: The Analysis ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        analysis_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_analysis(
@@ -116,8 +199,6 @@ async def get_analysis_by_linked_files(
     collection = client[config.db_name][COLLECTION_NAME]
     entities = await collection.find({"has_file": {"$in": file_id_list}}).to_list(None)
     if entities and embedded:
-        for analysis in entities:
-            analysis = await embed_references(analysis, config=config)
-    client.close()
+        entities = await embed_documents(entities, config=config)
     analysis_entities = [Analysis(**x) for x in entities]
     return analysis_entities
@@ -16,32 +16,114 @@
 Convenience methods for retrieving AnalysisProcess records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import AnalysisProcess
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "AnalysisProcess"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_analysis_processes(config: Config = CONFIG) -> List[str]:
+async def retrieve_analysis_processes(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of AnalysisProcess objects from metadata store.
+    Retrieve the AnalysisProcess object IDs from metadata store, without loading
+    the AnalysisProcess objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The AnalysisProcess object IDs.
+
+    """
+    async for analysis_process_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield analysis_process_id
+
+
+async def list_analysis_processes(
+    page: PageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Get a page of AnalysisProcess objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of AnalysisProcess object IDs.
+        The page of AnalysisProcess objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    analysis_processes = await collection.find_distinct().to_list(None)
-    client.close()
-    return [x["id"] for x in analysis_processes]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=AnalysisProcess, config=config
+    )
+
+
+async def get_analysis_process_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given AnalysisProcess IDs and accessions, get the AnalysisProcess objects from metadata
+    store with one query.
+
+    Args:
+        batch: The AnalysisProcess IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found AnalysisProcess objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME,
+        batch,
+        model_class=AnalysisProcess,
+        embedded=embedded,
+        config=config,
+    )
+
+
+async def get_analysis_process_referenced_by(
+    analysis_process_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given an AnalysisProcess ID, get a page of the entities that reference
+    the AnalysisProcess.
+
+    Args:
+        analysis_process_id: The AnalysisProcess ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        analysis_process_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_analysis_process(
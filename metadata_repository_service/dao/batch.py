@@ -0,0 +1,90 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Looking up many entities of a collection at once."""
+
+from typing import Any, Dict, List
+
+from pydantic import parse_obj_as
+
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.utils import embed_documents
+
+
+async def get_entity_batch(
+    collection_name: str,
+    batch: BatchRequest,
+    model_class: Any = None,
+    embedded: bool = False,
+    config: Config = CONFIG,
+) -> EntityBatch:
+    """
+    Given IDs and accessions, look up the documents of a collection with one
+    query and embed their references with one query per collection and level.
+
+    Args:
+        collection_name: The collection in the metadata store
+        batch: The IDs and accessions of the documents
+        model_class: The model class, or type, of the documents
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns
+        The found documents in the order of the request, and the IDs and
+        accessions without a document
+
+    """
+    ids = list(dict.fromkeys(batch.ids))
+    accessions = list(dict.fromkeys(batch.accessions))
+    documents: List[Dict] = []
+    if ids or accessions:
+        client = await get_db_client(config)
+        collection = client[config.db_name][collection_name]
+        documents = await collection.find(_get_batch_query(ids, accessions)).to_list(
+            None
+        )
+
+    by_id = {document["id"]: document for document in documents}
+    by_accession = {
+        document["accession"]: document
+        for document in documents
+        if document.get("accession")
+    }
+    found: Dict[str, Dict] = {}
+    for document in [
+        *(by_id[x] for x in ids if x in by_id),
+        *(by_accession[x] for x in accessions if x in by_accession),
+    ]:
+        found.setdefault(document["id"], document)
+    items = list(found.values())
+    if embedded:
+        items = await embed_documents(items, config=config)
+    return EntityBatch(
+        items=parse_obj_as(List[model_class], items) if model_class else items,
+        missing_ids=[x for x in ids if x not in by_id],
+        missing_accessions=[x for x in accessions if x not in by_accession],
+    )
+
+
+def _get_batch_query(ids: List[str], accessions: List[str]) -> Dict:
+    """Get the query for the documents with any of the IDs or accessions."""
+    clauses: List[Dict] = []
+    if ids:
+        clauses.append({"id": {"$in": ids}})
+    if accessions:
+        clauses.append({"accession": {"$in": accessions}})
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
@@ -16,32 +16,113 @@
 Convenience methods for retrieving Biospecimen records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import Biospecimen
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Biospecimen"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_biospecimens(config: Config = CONFIG) -> List[str]:
+async def retrieve_biospecimens(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Biospecimen object IDs from metadata store.
+    Retrieve the Biospecimen object IDs from metadata store, without loading
+    the Biospecimen objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Biospecimen object IDs.
+
+    """
+    async for biospecimen_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield biospecimen_id
+
+
+async def list_biospecimens(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Biospecimen objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of Biospecimen object IDs.
+        The page of Biospecimen objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    biospecimens = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in biospecimens]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Biospecimen, config=config
+    )
+
+
+async def get_biospecimen_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Biospecimen IDs and accessions, get the Biospecimen objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Biospecimen IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found Biospecimen objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME,
+        batch,
+        model_class=Biospecimen,
+        embedded=embedded,
+        config=config,
+    )
+
+
+async def get_biospecimen_referenced_by(
+    biospecimen_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a Biospecimen ID, get a page of the entities that reference the Biospecimen.
+
+    Args:
+        biospecimen_id: The Biospecimen ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        biospecimen_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_biospecimen(
@@ -0,0 +1,160 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide caching of entities.
+
+Metadata entities rarely change once they are released, so the documents that
+``get_entity`` looks up are kept in an LRU cache whose entries expire after a
+configurable time. The write paths of the DAO invalidate the entries of the
+collections they touch. Each process has its own cache, so changes made by
+another process become visible at the latest when the entries expire.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.dao.loader import invalidate_loaded_entities
+
+# (collection name, field name, value, embedding)
+EntityKey = Tuple[str, str, str, Hashable]
+
+
+class EntityCache:
+    """LRU cache of documents whose entries expire after a time to live.
+
+    Documents are copied when they are stored and when they are returned,
+    so that callers can modify them freely.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[EntityKey, Tuple[float, Dict]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: EntityKey) -> Optional[Dict]:
+        """Get a copy of the cached document, if there is one and it did not expire."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: EntityKey, document: Dict):
+        """Cache a copy of the document, evicting the least recently used entries."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(document))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, collection_name: str):
+        """Drop the entries of a collection and all entries with embedded references,
+        since those may contain documents of the collection.
+        """
+        for key in list(self._entries):
+            if key[0] == collection_name or key[3]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
+
+    def stats(self) -> Dict:
+        """Get the size of the cache and its hit and miss counts."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+# One cache per database, keyed by database URL and name
+ENTITY_CACHES: Dict[Tuple[str, str], EntityCache] = {}
+# The entities that accessions resolve to, per database
+ACCESSION_CACHES: Dict[Tuple[str, str], EntityCache] = {}
+
+
+def get_entity_cache(config: Config = CONFIG) -> Optional[EntityCache]:
+    """Get the entity cache for the database of the runtime configuration,
+    or ``None`` if caching is disabled.
+    """
+    if config.entity_cache_size <= 0 or config.entity_cache_ttl <= 0:
+        return None
+    key = (config.db_url, config.db_name)
+    cache = ENTITY_CACHES.get(key)
+    if cache is None:
+        cache = EntityCache(config.entity_cache_size, config.entity_cache_ttl)
+        ENTITY_CACHES[key] = cache
+    return cache
+
+
+def get_accession_cache(config: Config = CONFIG) -> Optional[EntityCache]:
+    """Get the cache of resolved accessions for the database of the runtime
+    configuration, or ``None`` if caching is disabled.
+    """
+    if config.accession_cache_size <= 0 or config.entity_cache_ttl <= 0:
+        return None
+    key = (config.db_url, config.db_name)
+    cache = ACCESSION_CACHES.get(key)
+    if cache is None:
+        cache = EntityCache(config.accession_cache_size, config.entity_cache_ttl)
+        ACCESSION_CACHES[key] = cache
+    return cache
+
+
+def invalidate_entities(collection_name: str):
+    """Forget the cached and request-scoped documents and the resolved accessions
+    of a collection after writing to it.
+    """
+    for cache in [*ENTITY_CACHES.values(), *ACCESSION_CACHES.values()]:
+        cache.invalidate(collection_name)
+    invalidate_loaded_entities(collection_name)
+
+
+def _get_database_label(db_url: str, db_name: str) -> str:
+    """Get a label of a database that does not reveal the credentials in its URL."""
+    scheme, _, location = db_url.partition("://")
+    hosts = location.split("/", 1)[0].rpartition("@")[2]
+    return f"{scheme}://{hosts}/{db_name}"
+
+
+def get_cache_stats() -> Dict:
+    """Get the statistics of the entity caches, keyed by database URL (without
+    credentials) and name."""
+    return {
+        _get_database_label(db_url, db_name): cache.stats()
+        for (db_url, db_name), cache in ENTITY_CACHES.items()
+    }
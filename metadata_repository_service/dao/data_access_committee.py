@@ -18,38 +18,132 @@
 Convenience methods for retrieving DataAccessCommittee records
 """
 
-from typing import List, Union
+from typing import AsyncIterator, Union
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
 from metadata_repository_service.core.utils import generate_uuid, get_timestamp
 from metadata_repository_service.creation_models import (
     CreateDataAccessCommittee,
     CreateMember,
 )
+from metadata_repository_service.dao.accession import generate_accession
+from metadata_repository_service.dao.batch import get_entity_batch
 from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.entity_registry import register_entities
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
 from metadata_repository_service.dao.member import create_member, get_member_by_email
-from metadata_repository_service.dao.utils import generate_accession, get_entity
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import (
+    add_reference_edges,
+    get_referencing_entities,
+)
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import DataAccessCommittee
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "DataAccessCommittee"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
+
+
+async def retrieve_data_access_committees(
+    config: Config = CONFIG,
+) -> AsyncIterator[str]:
+    """
+    Retrieve the DataAccessCommittee object IDs from metadata store, without loading
+    the DataAccessCommittee objects themselves.
+
+    Args:
+        config: Rumtime configuration
+
+    Yields:
+        The DataAccessCommittee object IDs.
+
+    """
+    async for data_access_committee_id in iter_entity_ids(
+        COLLECTION_NAME, config=config
+    ):
+        yield data_access_committee_id
 
 
-async def retrieve_data_access_committees(config: Config = CONFIG) -> List[str]:
+async def list_data_access_committees(
+    page: PageRequest, config: Config = CONFIG
+) -> EntityPage:
     """
-    Retrieve a list of DataAccessCommittee object IDs from metadata store.
+    Get a page of DataAccessCommittee objects from metadata store.
 
     Args:
+        page: The requested page
         config: Rumtime configuration
 
     Returns:
-        A list of DataAccessCommittee object IDs.
+        The page of DataAccessCommittee objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    data_access_committees = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in data_access_committees]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=DataAccessCommittee, config=config
+    )
+
+
+async def get_data_access_committee_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given DataAccessCommittee IDs and accessions, get the DataAccessCommittee objects from metadata
+    store with one query.
+
+    Args:
+        batch: The DataAccessCommittee IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found DataAccessCommittee objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME,
+        batch,
+        model_class=DataAccessCommittee,
+        embedded=embedded,
+        config=config,
+    )
+
+
+async def get_data_access_committee_referenced_by(
+    data_access_committee_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a DataAccessCommittee ID, get a page of the entities that reference
+    the DataAccessCommittee.
+
+    Args:
+        data_access_committee_id: The DataAccessCommittee ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        data_access_committee_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_data_access_committee(
@@ -165,6 +259,7 @@ async def create_data_access_committee(
     dac_entity["accession"] = await generate_accession(COLLECTION_NAME, config=config)
     dac_entity["schema_type"] = "DataAccessCommittee"
     await collection.insert_one(dac_entity)
-    client.close()
+    await register_entities({COLLECTION_NAME: [dac_entity]}, config=config)
+    await add_reference_edges({COLLECTION_NAME: [dac_entity]}, config=config)
     dac = await get_data_access_committee(dac_entity["id"], config=config)
     return dac
@@ -18,37 +18,127 @@
 Convenience methods for retrieving DataAccessPolicy records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
 from metadata_repository_service.core.utils import generate_uuid, get_timestamp
 from metadata_repository_service.creation_models import CreateDataAccessPolicy
+from metadata_repository_service.dao.accession import generate_accession
+from metadata_repository_service.dao.batch import get_entity_batch
 from metadata_repository_service.dao.data_access_committee import (
     get_data_access_committee_by_accession,
 )
 from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import generate_accession, get_entity
+from metadata_repository_service.dao.entity_registry import register_entities
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import (
+    add_reference_edges,
+    get_referencing_entities,
+)
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import DataAccessPolicy
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "DataAccessPolicy"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_data_access_policies(config: Config = CONFIG) -> List[str]:
+async def retrieve_data_access_policies(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of DataAccessPolicy object IDs from metadata store.
+    Retrieve the DataAccessPolicy object IDs from metadata store, without loading
+    the DataAccessPolicy objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The DataAccessPolicy object IDs.
+
+    """
+    async for data_access_policy_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield data_access_policy_id
+
+
+async def list_data_access_policies(
+    page: PageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Get a page of DataAccessPolicy objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of DataAccessPolicy object IDs.
+        The page of DataAccessPolicy objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    data_access_policies = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in data_access_policies]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=DataAccessPolicy, config=config
+    )
+
+
+async def get_data_access_policy_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given DataAccessPolicy IDs and accessions, get the DataAccessPolicy objects from metadata
+    store with one query.
+
+    Args:
+        batch: The DataAccessPolicy IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found DataAccessPolicy objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME,
+        batch,
+        model_class=DataAccessPolicy,
+        embedded=embedded,
+        config=config,
+    )
+
+
+async def get_data_access_policy_referenced_by(
+    data_access_policy_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a DataAccessPolicy ID, get a page of the entities that reference
+    the DataAccessPolicy.
+
+    Args:
+        data_access_policy_id: The DataAccessPolicy ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        data_access_policy_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_data_access_policy(
@@ -145,6 +235,7 @@ async def create_data_access_policy(
     dap_entity["accession"] = await generate_accession(COLLECTION_NAME, config=config)
     dap_entity["schema_type"] = "DataAccessPolicy"
     await collection.insert_one(dap_entity)
-    client.close()
+    await register_entities({COLLECTION_NAME: [dap_entity]}, config=config)
+    await add_reference_edges({COLLECTION_NAME: [dap_entity]}, config=config)
     dap = await get_data_access_policy(dap_entity["id"], config=config)
     return dap
@@ -18,30 +18,96 @@
 Convenience methods for retrieving Dataset records
 """
 
-from typing import List
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Set, Tuple, Union
 
+from pydantic import BaseModel
+from pymongo.errors import BulkWriteError
+
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.pagination import encode_cursor
+from metadata_repository_service.core.scheduler import get_background_scheduler
 from metadata_repository_service.core.utils import generate_uuid, get_timestamp
 from metadata_repository_service.creation_models import (
     CreateDataAccessPolicy,
     CreateDataset,
     CreateFile,
 )
-from metadata_repository_service.dao.analysis import get_analysis_by_linked_files
+from metadata_repository_service.dao.accession import (
+    allocate_accessions,
+    generate_accession,
+)
+from metadata_repository_service.dao.analysis import (
+    COLLECTION_NAME as ANALYSIS_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.cache import invalidate_entities
 from metadata_repository_service.dao.data_access_policy import (
-    get_data_access_policy_by_accession,
+    COLLECTION_NAME as DAP_COLLECTION_NAME,
 )
+from metadata_repository_service.dao.dataset_closure import build_dataset_closure
 from metadata_repository_service.dao.dataset_embedded import (
+    DATASET_EMBEDDING_BUILDS,
     create_dataset_embedded_object,
     get_dataset_embedded,
+    get_dataset_embedded_window,
+)
+from metadata_repository_service.dao.dataset_summary import (
+    create_dataset_summary,
+    mark_dataset_summaries_dirty,
 )
 from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.experiment import get_experiments_by_linked_files
-from metadata_repository_service.dao.file import get_file_by_accession
-from metadata_repository_service.dao.sample import get_sample
-from metadata_repository_service.dao.study import get_study
-from metadata_repository_service.dao.utils import generate_accession, get_entity
-from metadata_repository_service.models import Dataset
+from metadata_repository_service.dao.entity_registry import register_entities
+from metadata_repository_service.dao.experiment import (
+    COLLECTION_NAME as EXPERIMENT_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.file import COLLECTION_NAME as FILE_COLLECTION_NAME
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.metadata_summary import (
+    count_summary_changes,
+    update_summary_counters,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import (
+    add_reference_edges,
+    get_referencing_entities,
+)
+from metadata_repository_service.dao.sample import (
+    COLLECTION_NAME as SAMPLE_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.study import (
+    COLLECTION_NAME as STUDY_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.utils import (
+    embedded_fields,
+    get_entities,
+    get_entity,
+    get_reference_fields,
+    get_referencing_documents,
+)
+from metadata_repository_service.models import (
+    Analysis,
+    DataAccessPolicy,
+    Dataset,
+    Experiment,
+    File,
+    Sample,
+    Study,
+)
+from metadata_repository_service.pagination_models import (
+    DatasetPage,
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+    RelationPage,
+)
 from metadata_repository_service.patch_models import (
     DatasetStatusPatch,
     ReleaseStatusEnum,
@@ -50,29 +116,95 @@ from metadata_repository_service.patch_models import (
 # pylint: disable=too-many-locals, too-many-statements, too-many-branches
 
 COLLECTION_NAME = "Dataset"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
+
+# Relations of embedded Datasets that clients can page through
+PAGED_RELATIONS = ("has_file", "has_sample", "has_experiment", "has_analysis")
 
 
-async def retrieve_datasets(config: Config = CONFIG) -> List[str]:
+async def retrieve_datasets(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Dataset object IDs from metadata store.
+    Retrieve the Dataset object IDs from metadata store, without loading
+    the Dataset objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Dataset object IDs.
+
+    """
+    async for dataset_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield dataset_id
+
+
+async def list_datasets(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Dataset objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of Dataset object IDs.
+        The page of Dataset objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    datasets = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in datasets]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Dataset, config=config
+    )
+
+
+async def get_dataset_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Dataset IDs and accessions, get the Dataset objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Dataset IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found Dataset objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=Dataset, embedded=embedded, config=config
+    )
+
+
+async def get_dataset_referenced_by(
+    dataset_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a Dataset ID, get a page of the entities that reference the Dataset.
+
+    Args:
+        dataset_id: The Dataset ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        dataset_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_dataset(
     dataset_id: str, embedded: bool = False, config: Config = CONFIG
-) -> Dataset:
+) -> Optional[Dataset]:
     """
     Given a Dataset ID, get the Dataset object from metadata store.
 
@@ -82,7 +214,7 @@ async def get_dataset(
         config: Rumtime configuration
 
     Returns:
-        The Dataset object
+        The Dataset object, or ``None`` if there is no such Dataset
 
     """
     if not embedded:
@@ -97,22 +229,131 @@ async def get_dataset(
         return dataset
     dataset_embedded = await get_dataset_embedded(dataset_id=dataset_id, config=config)
     if dataset_embedded is None:
-        dataset = await get_entity(
-            identifier=dataset_id,
-            field="id",
-            collection_name=COLLECTION_NAME,
-            model_class=Dataset,
-            embedded=True,
-            config=config,
-        )
-        await create_dataset_embedded_object(dataset, config)
-        dataset_embedded = await get_dataset_embedded(
-            dataset_id=dataset_id, config=config
+        # concurrent requests for the same Dataset share a single build
+        dataset_embedded = await DATASET_EMBEDDING_BUILDS.run(
+            (config.db_url, config.db_name, dataset_id),
+            lambda: build_dataset_embedded(dataset_id, config=config),
         )
-        return dataset_embedded
     return dataset_embedded
 
 
+async def get_dataset_page(
+    dataset_id: str,
+    pages: Mapping[str, Tuple[int, int]],
+    config: Config = CONFIG,
+) -> Optional[DatasetPage]:
+    """
+    Given a Dataset ID, get the embedded Dataset with pages of its relations.
+
+    Only the requested pages are read from the embedded Dataset. The pageable
+    relations (``PAGED_RELATIONS``) without a requested page are left out, and
+    all other relations are returned in full.
+
+    Args:
+        dataset_id: The Dataset ID
+        pages: The offset and limit of the requested page per relation
+        config: Rumtime configuration
+
+    Returns:
+        The embedded Dataset with pages, or ``None`` if there is no such Dataset
+
+    """
+    windows: Dict[str, Tuple[int, Optional[int]]] = {
+        field: (0, None) for field in embedded_fields if field not in PAGED_RELATIONS
+    }
+    windows.update(pages)
+    result = await get_dataset_embedded_window(dataset_id, windows, config=config)
+    if result is None:
+        # the Dataset has not been embedded yet
+        if await get_dataset(dataset_id, embedded=True, config=config) is None:
+            return None
+        result = await get_dataset_embedded_window(dataset_id, windows, config=config)
+        if result is None:
+            return None
+    document, counts = result
+    document["pages"] = {}
+    for relation, (offset, limit) in pages.items():
+        total = counts.get(relation, 0)
+        next_cursor = None
+        if limit and offset + limit < total:
+            next_cursor = encode_cursor(
+                {"relation": relation, "offset": offset + limit, "limit": limit}
+            )
+        document["pages"][relation] = RelationPage(
+            offset=offset, limit=limit, total=total, next_cursor=next_cursor
+        )
+    return DatasetPage(**document)
+
+
+async def build_dataset_embedded(
+    dataset_id: str, config: Config = CONFIG
+) -> Optional[Dataset]:
+    """
+    Given a Dataset ID, embed the Dataset and store it as Dataset embedded object.
+
+    Args:
+        dataset_id: The Dataset ID
+        config: Rumtime configuration
+
+    Returns:
+        The embedded Dataset object, or ``None`` if there is no such Dataset
+
+    """
+    dataset = await get_entity(
+        identifier=dataset_id,
+        field="id",
+        collection_name=COLLECTION_NAME,
+        model_class=Dataset,
+        embedded=True,
+        config=config,
+    )
+    if dataset is None:
+        return None
+    return await create_dataset_embedded_object(dataset, config)
+
+
+async def materialize_dataset(dataset_id: str, config: Config = CONFIG) -> bool:
+    """
+    Given a Dataset ID, (re)build the documents derived from the Dataset,
+    i.e. the embedded Dataset, the Dataset summary and the Dataset closure.
+
+    Args:
+        dataset_id: The Dataset ID
+        config: Rumtime configuration
+
+    Returns:
+        Whether the Dataset exists
+
+    """
+    # the closure only follows the stored references, so it is kept current
+    # even if the Dataset cannot be embedded
+    if not await build_dataset_closure(dataset_id, config=config):
+        return False
+    dataset_embedded = await build_dataset_embedded(dataset_id, config=config)
+    if dataset_embedded is None:
+        return False
+    await create_dataset_summary(dataset_id, config=config)
+    return True
+
+
+def schedule_dataset_materialization(dataset_id: str, config: Config = CONFIG):
+    """
+    Schedule the materialization of a Dataset in the background.
+
+    Args:
+        dataset_id: The Dataset ID
+        config: Rumtime configuration
+
+    """
+
+    async def materialize():
+        await materialize_dataset(dataset_id, config=config)
+
+    get_background_scheduler(config).schedule(
+        (config.db_url, config.db_name, COLLECTION_NAME, dataset_id), materialize
+    )
+
+
 async def get_dataset_by_accession(
     dataset_accession: str, embedded: bool = False, config: Config = CONFIG
 ) -> Dataset:
@@ -143,106 +384,339 @@ class DatasetError(RuntimeError):
     """Custom exception for Dataset"""
 
 
-async def create_dataset(  # noqa: C901
-    dataset: CreateDataset, config: Config = CONFIG
-) -> Dataset:
-    """
-    Given a list of File IDs and a Data Access Policy ID, create a new Dataset object
-    and write to the metadata store.
+class DatasetReferenceError(DatasetError):
+    """Raised when entities referenced by a new Dataset cannot be found"""
 
-    Args:
-        dataset: The Dataset object
-        config: Rumtime configuration
+    def __init__(self, missing: Dict[str, List[str]]):
+        self.missing = missing
+        super().__init__(
+            "Cannot find the referenced entities: "
+            + "; ".join(f"{field}: {values}" for field, values in missing.items())
+        )
 
-    Returns:
-        The Dataset object
 
-    """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    # Get referenced File entities
-    file_entities = {}
+class DatasetReferences(BaseModel):
+    """The entities that a new Dataset references"""
+
+    data_access_policy: DataAccessPolicy
+    files: List[File]
+    experiments: List[Experiment]
+    analyses: List[Analysis]
+    studies: List[Study]
+    samples: List[Sample]
+
+
+def _get_reference_id(reference: Any) -> str:
+    """Get the ID of a reference that may be an ID or an embedded entity."""
+    return reference if isinstance(reference, str) else reference.id
+
+
+def _warn_missing_references(
+    collection_name: str, ids: List[str], entities: Dict[str, Any]
+):
+    """Log the referenced IDs that were not found in a collection."""
+    for entity_id in ids:
+        if entity_id not in entities:
+            logging.warning(
+                "Reference with ID %s not found in collection %s",
+                entity_id,
+                collection_name,
+            )
+
+
+def _get_requested_accessions(dataset: CreateDataset) -> Tuple[List[str], str]:
+    """Get the File accessions and the DataAccessPolicy accession of a new Dataset."""
+    file_accessions = []
     for file_accession in dataset.has_file:
         if not file_accession:
             raise DatasetError("Dataset does not have a valid File: " f"{dataset}")
         if isinstance(file_accession, CreateFile):
             file_accession = file_accession.alias
-        file_entity = await get_file_by_accession(
-            file_accession=file_accession, config=config
-        )
-        if not file_entity:
-            raise DatasetError(f"Cannot find a File with accession: {file_accession}")
-        file_entities[file_entity.id] = file_entity
-
+        file_accessions.append(file_accession)
     dap_accession = dataset.has_data_access_policy
     if isinstance(dap_accession, CreateDataAccessPolicy):
         dap_accession = dap_accession.alias
-    dap_entity = await get_data_access_policy_by_accession(dap_accession, config=config)
-    if not dap_entity:
-        raise DatasetError(
-            "Cannot find a DataAccessPolicy with accession: "
-            f"{dataset.has_data_access_policy}"
-        )
-    file_entity_id_list = list(file_entities.keys())
+    return file_accessions, dap_accession
+
+
+def _is_linked(document: Dict, file_ids: Set[str]) -> bool:
+    """Whether a document references any of the files."""
+    return any(x in file_ids for x in document.get("has_file") or [])
+
+
+async def resolve_dataset_references(
+    dataset: CreateDataset, config: Config = CONFIG
+) -> DatasetReferences:
+    """
+    Given a new Dataset, look up all the entities it references with one
+    query per collection.
+
+    Args:
+        dataset: The Dataset object
+        config: Rumtime configuration
 
-    experiment_entities = await get_experiments_by_linked_files(
-        file_id_list=file_entity_id_list, config=config
+    Returns:
+        The referenced entities
+
+    Raises:
+        DatasetReferenceError: If the DataAccessPolicy or any File cannot be found
+
+    """
+    (references,) = await resolve_datasets_references([dataset], config=config)
+    if isinstance(references, DatasetError):
+        raise references
+    return references
+
+
+async def resolve_datasets_references(  # noqa: C901
+    datasets: List[CreateDataset], config: Config = CONFIG
+) -> List[Union[DatasetReferences, DatasetError]]:
+    """
+    Given new Datasets, look up all the entities they reference with one
+    query per collection for the whole batch.
+
+    Args:
+        datasets: The Dataset objects
+        config: Rumtime configuration
+
+    Returns:
+        The referenced entities of each Dataset, or the error that prevents
+        its creation, e.g. a ``DatasetReferenceError`` for missing accessions
+
+    """
+    results: Dict[int, Union[DatasetReferences, DatasetError]] = {}
+    requested: Dict[int, Tuple[List[str], str]] = {}
+    for index, dataset in enumerate(datasets):
+        try:
+            requested[index] = _get_requested_accessions(dataset)
+        except DatasetError as error:
+            results[index] = error
+
+    file_entities, dap_entities = await asyncio.gather(
+        get_entities(
+            (x for files, _ in requested.values() for x in files),
+            "accession",
+            FILE_COLLECTION_NAME,
+            File,
+            config=config,
+        ),
+        get_entities(
+            (dap for _, dap in requested.values()),
+            "accession",
+            DAP_COLLECTION_NAME,
+            DataAccessPolicy,
+            config=config,
+        ),
+    )
+    files_by_dataset: Dict[int, List[File]] = {}
+    for index, (file_accessions, dap_accession) in requested.items():
+        missing: Dict[str, List[str]] = {}
+        if dap_accession not in dap_entities:
+            missing["has_data_access_policy"] = [dap_accession]
+        missing_files = [x for x in file_accessions if x not in file_entities]
+        if missing_files:
+            missing["has_file"] = list(dict.fromkeys(missing_files))
+        if missing:
+            results[index] = DatasetReferenceError(missing)
+            continue
+        files_by_id = {file_entities[x].id: file_entities[x] for x in file_accessions}
+        files_by_dataset[index] = list(files_by_id.values())
+
+    file_ids = [x.id for files in files_by_dataset.values() for x in files]
+    experiment_documents, analysis_documents = await asyncio.gather(
+        get_referencing_documents(
+            file_ids, "has_file", EXPERIMENT_COLLECTION_NAME, config=config
+        ),
+        get_referencing_documents(
+            file_ids, "has_file", ANALYSIS_COLLECTION_NAME, config=config
+        ),
     )
+    experiments = [Experiment(**x) for x in experiment_documents]
+    analyses = [Analysis(**x) for x in analysis_documents]
+
+    linked: Dict[int, Tuple[List[Experiment], List[Analysis]]] = {}
+    for index, dataset_files in files_by_dataset.items():
+        dataset_file_ids = {x.id for x in dataset_files}
+        linked[index] = (
+            [
+                experiment
+                for experiment, document in zip(experiments, experiment_documents)
+                if _is_linked(document, dataset_file_ids)
+            ],
+            [
+                analysis
+                for analysis, document in zip(analyses, analysis_documents)
+                if _is_linked(document, dataset_file_ids)
+            ],
+        )
 
-    # Get Sample entities that are linked to Experiment entities
-    study_entities = {}
-    sample_entities = {}
-    for experiment in experiment_entities:
-        if isinstance(experiment.has_study, str):
-            study_entity = await get_study(experiment.has_study, config=config)
-        else:
-            study_entity = await get_study(experiment.has_study.id, config=config)
-        study_entities[study_entity.id] = study_entity
-        for sample in experiment.has_sample:
-            if isinstance(sample, str):
-                sample_entity = await get_sample(sample, config=config)
-            else:
-                sample_entity = await get_sample(sample.id, config=config)
-            sample_entities[sample_entity.id] = sample_entity
-
-    # Analysis
-    analysis_entities = await get_analysis_by_linked_files(
-        file_id_list=file_entity_id_list, config=config
+    # Studies of the experiments first, then the ones only referenced by analyses
+    study_ids: Dict[int, List[str]] = {}
+    sample_ids: Dict[int, List[str]] = {}
+    for index, (dataset_experiments, dataset_analyses) in linked.items():
+        ids = [_get_reference_id(x.has_study) for x in dataset_experiments]
+        ids += [_get_reference_id(x.has_study) for x in dataset_analyses if x.has_study]
+        study_ids[index] = list(dict.fromkeys(ids))
+        ids = [_get_reference_id(x) for y in dataset_experiments for x in y.has_sample]
+        sample_ids[index] = list(dict.fromkeys(ids))
+    all_study_ids = list(dict.fromkeys(x for ids in study_ids.values() for x in ids))
+    all_sample_ids = list(dict.fromkeys(x for ids in sample_ids.values() for x in ids))
+    study_entities, sample_entities = await asyncio.gather(
+        get_entities(all_study_ids, "id", STUDY_COLLECTION_NAME, Study, config=config),
+        get_entities(
+            all_sample_ids, "id", SAMPLE_COLLECTION_NAME, Sample, config=config
+        ),
     )
-    for analysis in analysis_entities:
-        if analysis.has_study:
-            if isinstance(analysis.has_study, str):
-                study_entity = await get_study(analysis.has_study, config=config)
-            else:
-                study_entity = await get_study(analysis.has_study.id, config=config)
-            if study_entity.id not in study_entities:
-                study_entities[study_entity.id] = study_entity
-
-    # Dataset
+    _warn_missing_references(STUDY_COLLECTION_NAME, all_study_ids, study_entities)
+    _warn_missing_references(SAMPLE_COLLECTION_NAME, all_sample_ids, sample_entities)
+
+    for index, (dataset_experiments, dataset_analyses) in linked.items():
+        results[index] = DatasetReferences(
+            data_access_policy=dap_entities[requested[index][1]],
+            files=files_by_dataset[index],
+            experiments=dataset_experiments,
+            analyses=dataset_analyses,
+            studies=[
+                study_entities[x] for x in study_ids[index] if x in study_entities
+            ],
+            samples=[
+                sample_entities[x] for x in sample_ids[index] if x in sample_entities
+            ],
+        )
+    return [results[index] for index in range(len(datasets))]
+
+
+def _build_dataset_entity(
+    dataset: CreateDataset, references: DatasetReferences
+) -> Dict:
+    """Build the document of a new Dataset from its resolved references."""
     dataset_entity = dataset.dict()
+    dataset_entity["release_status"] = ReleaseStatusEnum.unreleased.value
+    dataset_entity["has_file"] = [x.id for x in references.files]
+    dataset_entity["has_experiment"] = [x.id for x in references.experiments]
+    dataset_entity["has_analysis"] = [x.id for x in references.analyses]
+    dataset_entity["has_study"] = [x.id for x in references.studies]
+    dataset_entity["has_sample"] = [x.id for x in references.samples]
+    dataset_entity["has_data_access_policy"] = references.data_access_policy.id
+    dataset_entity["schema_type"] = "Dataset"
+    return dataset_entity
+
+
+async def create_dataset(
+    dataset: CreateDataset,
+    config: Config = CONFIG,
+    references: Optional[DatasetReferences] = None,
+) -> Optional[Dataset]:
+    """
+    Given a list of File IDs and a Data Access Policy ID, create a new Dataset object
+    and write to the metadata store.
+
+    Args:
+        dataset: The Dataset object
+        config: Rumtime configuration
+        references: The entities referenced by the Dataset, if they
+            were already resolved with ``resolve_dataset_references``
+
+    Returns:
+        The Dataset object
+
+    """
+    if references is None:
+        references = await resolve_dataset_references(dataset, config=config)
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+
+    dataset_entity = _build_dataset_entity(dataset, references)
     dataset_entity["id"] = await generate_uuid()
     dataset_entity["creation_date"] = await get_timestamp()
     dataset_entity["update_date"] = dataset_entity["creation_date"]
-    dataset_entity["release_status"] = ReleaseStatusEnum.unreleased.value
     dataset_entity["accession"] = await generate_accession(
         COLLECTION_NAME, config=config
     )
-    dataset_entity["has_file"] = file_entity_id_list
-    dataset_entity["has_experiment"] = [x.id for x in experiment_entities]
-    dataset_entity["has_analysis"] = [x.id for x in analysis_entities]
-    dataset_entity["has_study"] = list(study_entities.keys())
-    dataset_entity["has_sample"] = list(sample_entities.keys())
-    dataset_entity["has_data_access_policy"] = dap_entity.id
-    dataset_entity["schema_type"] = "Dataset"
 
     await collection.insert_one(dataset_entity)
+    await update_summary_counters(
+        count_summary_changes(COLLECTION_NAME, added=[dataset_entity]), config=config
+    )
+    await register_entities({COLLECTION_NAME: [dataset_entity]}, config=config)
+    await add_reference_edges({COLLECTION_NAME: [dataset_entity]}, config=config)
+    schedule_dataset_materialization(dataset_entity["id"], config=config)
     new_dataset = await get_dataset(dataset_entity["id"], config=config)
     return new_dataset
 
 
+async def bulk_create_datasets(
+    datasets: List[CreateDataset], config: Config = CONFIG
+) -> List[Union[Dataset, DatasetError]]:
+    """
+    Given new Datasets, create them with shared lookups of their references,
+    one allocation of accessions and one ``insert_many``.
+
+    Args:
+        datasets: The Dataset objects
+        config: Rumtime configuration
+
+    Returns:
+        The created Dataset object, or the error that prevented its creation,
+        for each of the given Datasets
+
+    """
+    references = await resolve_datasets_references(datasets, config=config)
+    results: Dict[int, Union[Dataset, DatasetError]] = {
+        index: x for index, x in enumerate(references) if isinstance(x, DatasetError)
+    }
+    valid = [
+        (index, dataset, dataset_references)
+        for index, (dataset, dataset_references) in enumerate(zip(datasets, references))
+        if isinstance(dataset_references, DatasetReferences)
+    ]
+    if not valid:
+        return [results[index] for index in range(len(datasets))]
+
+    accessions = await allocate_accessions({COLLECTION_NAME: len(valid)}, config=config)
+    timestamp = await get_timestamp()
+    entities = []
+    for (_, dataset, dataset_references), accession in zip(
+        valid, accessions[COLLECTION_NAME]
+    ):
+        dataset_entity = _build_dataset_entity(dataset, dataset_references)
+        dataset_entity["id"] = await generate_uuid()
+        dataset_entity["creation_date"] = timestamp
+        dataset_entity["update_date"] = timestamp
+        dataset_entity["accession"] = accession
+        entities.append(dataset_entity)
+
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    write_errors: Dict[int, str] = {}
+    try:
+        await collection.insert_many(entities, ordered=False)
+    except BulkWriteError as error:
+        write_errors = {
+            x["index"]: x.get("errmsg", "")
+            for x in error.details.get("writeErrors", [])
+        }
+    for position, ((index, _, _), dataset_entity) in enumerate(zip(valid, entities)):
+        if position in write_errors:
+            results[index] = DatasetError(
+                f"Cannot store the Dataset: {write_errors[position]}"
+            )
+        else:
+            results[index] = Dataset(**dataset_entity)
+    created = [x for i, x in enumerate(entities) if i not in write_errors]
+    await update_summary_counters(
+        count_summary_changes(COLLECTION_NAME, added=created), config=config
+    )
+    await register_entities({COLLECTION_NAME: created}, config=config)
+    await add_reference_edges({COLLECTION_NAME: created}, config=config)
+    for dataset_entity in created:
+        schedule_dataset_materialization(dataset_entity["id"], config=config)
+    return [results[index] for index in range(len(datasets))]
+
+
 async def change_dataset_status(
     dataset_accession: str, dataset: DatasetStatusPatch, config: Config = CONFIG
-) -> Dataset:
+) -> Optional[Dataset]:
     """_summary_
     Given a Dataset accession, update its status.
 
@@ -273,8 +747,12 @@ async def change_dataset_status(
                 }
             },
         )
+        invalidate_entities(COLLECTION_NAME)
+        await mark_dataset_summaries_dirty(
+            [dataset_entity.id], schedule=False, config=config
+        )
+        schedule_dataset_materialization(dataset_entity.id, config=config)
         updated_dataset = await get_dataset(dataset_entity.id, config=config)
     else:
         updated_dataset = dataset_entity
-    client.close()
     return updated_dataset
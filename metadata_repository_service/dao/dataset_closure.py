@@ -0,0 +1,185 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""The transitive closure of the entities of each Dataset.
+
+The closure of a Dataset holds one document for each entity that the Dataset
+references directly or indirectly, e.g. its Files, the Samples of its
+Experiments and their Individuals, or the Members of the DataAccessCommittee of
+its DataAccessPolicy. Whether an entity is part of a Dataset and which Datasets
+cover an entity are thus single indexed reads.
+
+The closure is built when the Dataset is materialized. Write paths that change
+entities schedule the rebuild of the closures that cover them with
+``refresh_covering_dataset_closures``. A rebuild upserts the entities with a new
+generation before it removes the ones of older generations, so that readers
+never see a partial closure.
+"""
+
+from typing import Iterable, List, Optional
+
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.scheduler import get_background_scheduler
+from metadata_repository_service.core.utils import generate_uuid
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.graph import get_reachable_entities
+from metadata_repository_service.resolution_models import DatasetClosureEntry
+
+COLLECTION_NAME = "DatasetClosure"
+INDEXES = [
+    IndexModel(
+        [("entity_id", ASCENDING), ("dataset_id", ASCENDING)],
+        name="entity_id_dataset_id",
+        unique=True,
+    ),
+    IndexModel(
+        [("dataset_id", ASCENDING), ("generation", ASCENDING)],
+        name="dataset_id_generation",
+    ),
+]
+
+# The Dataset collection, whose DAO module depends on this one
+DATASET_COLLECTION_NAME = "Dataset"
+
+
+async def build_dataset_closure(dataset_id: str, config: Config = CONFIG) -> bool:
+    """
+    Given a Dataset ID, (re)build the closure of the entities of the Dataset
+    with one query per collection and level of references.
+
+    Args:
+        dataset_id: The Dataset ID
+        config: Runtime configuration
+
+    Returns:
+        Whether the Dataset exists. The closure of a Dataset that does not exist
+        is removed.
+
+    """
+    reached = await get_reachable_entities(
+        DATASET_COLLECTION_NAME, dataset_id, config=config
+    )
+    generation = await generate_uuid()
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    if reached:
+        await collection.bulk_write(
+            [
+                UpdateOne(
+                    {"entity_id": entity_id, "dataset_id": dataset_id},
+                    {"$set": {"entity_type": entity_type, "generation": generation}},
+                    upsert=True,
+                )
+                for entity_type, entity_id in sorted(reached)
+            ],
+            ordered=False,
+        )
+    await collection.delete_many(
+        {"dataset_id": dataset_id, "generation": {"$ne": generation}}
+    )
+    return reached is not None
+
+
+async def get_dataset_closure_entry(
+    dataset_id: str, entity_id: str, config: Config = CONFIG
+) -> Optional[DatasetClosureEntry]:
+    """
+    Given a Dataset ID and an entity ID, get whether the entity is part of
+    the Dataset. The closure of a Dataset that was not materialized yet is
+    built on demand.
+
+    Args:
+        dataset_id: The Dataset ID
+        entity_id: The ID of the entity
+        config: Runtime configuration
+
+    Returns:
+        The entity of the closure of the Dataset, or ``None`` if the entity is
+        not part of the Dataset
+
+    """
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    query = {"entity_id": entity_id, "dataset_id": dataset_id}
+    projection = {"_id": False, "generation": False}
+    entry = await collection.find_one(query, projection)
+    if (
+        entry is None
+        and await collection.find_one({"dataset_id": dataset_id}, {"_id": True}) is None
+        and await build_dataset_closure(dataset_id, config=config)
+    ):
+        entry = await collection.find_one(query, projection)
+    return DatasetClosureEntry(**entry) if entry else None
+
+
+async def get_covering_datasets(
+    entity_ids: Iterable[str], config: Config = CONFIG
+) -> List[str]:
+    """
+    Given entity IDs, get the Datasets whose closure covers any of the entities.
+
+    Args:
+        entity_ids: The IDs of the entities
+        config: Runtime configuration
+
+    Returns:
+        The IDs of the covering Datasets
+
+    """
+    entity_ids = list(set(entity_ids))
+    if not entity_ids:
+        return []
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    dataset_ids = await collection.distinct(
+        "dataset_id", {"entity_id": {"$in": entity_ids}}
+    )
+    return sorted(dataset_ids)
+
+
+async def refresh_covering_dataset_closures(
+    entity_ids: Iterable[str], config: Config = CONFIG
+):
+    """
+    Schedule the rebuild of the closures of the Datasets that cover any of the
+    given entities, e.g. after the entities changed.
+
+    Args:
+        entity_ids: The IDs of changed entities
+        config: Runtime configuration
+
+    """
+    for dataset_id in await get_covering_datasets(entity_ids, config=config):
+        schedule_dataset_closure(dataset_id, config=config)
+
+
+def schedule_dataset_closure(dataset_id: str, config: Config = CONFIG):
+    """
+    Schedule the rebuild of the closure of a Dataset in the background.
+
+    Args:
+        dataset_id: The Dataset ID
+        config: Runtime configuration
+
+    """
+
+    async def rebuild():
+        await build_dataset_closure(dataset_id, config=config)
+
+    get_background_scheduler(config).schedule(
+        (config.db_url, config.db_name, COLLECTION_NAME, dataset_id), rebuild
+    )
@@ -15,21 +15,71 @@
 
 """
 Convenience methods for retrieving Dataset Embedded
+
+An embedded Dataset is stored in chunks, since the embedded entities of large
+Datasets would exceed the size limit of a single document: A header document in
+the DatasetEmbedded collection holds the fields of the Dataset, and the embedded
+entities of each list of references (relation) are stored in chunk documents of
+``dataset_embedded_chunk_size`` entities each. All chunks of an embedded Dataset
+share a generation with their header, so that rebuilding an embedded Dataset
+never mixes the chunks of two builds. Headers without generation are embedded
+Datasets that were stored as a single document before.
 """
 
 
-from typing import Any, Dict, List
+import logging
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import DuplicateKeyError, OperationFailure
 
 from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.singleflight import SingleFlight
+from metadata_repository_service.core.utils import generate_uuid, get_timestamp
+from metadata_repository_service.dao.cache import get_entity_cache, invalidate_entities
 from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import embedded_fields, get_entity
+from metadata_repository_service.dao.indexes import field_index, id_index
+from metadata_repository_service.dao.utils import embedded_fields
 from metadata_repository_service.models import Dataset
 
 # pylint: disable=too-many-locals, too-many-statements, too-many-branches
 COLLECTION_NAME = "DatasetEmbedded"
+INDEXES = [id_index()]
+
+CHUNK_COLLECTION_NAME = "DatasetEmbeddedChunk"
+CHUNK_INDEXES = [
+    IndexModel(
+        [
+            ("dataset_id", ASCENDING),
+            ("generation", ASCENDING),
+            ("relation", ASCENDING),
+            ("index", ASCENDING),
+        ],
+        name="dataset_id_generation_relation_index",
+        unique=True,
+    ),
+    field_index("generation"),
+]
+
+# Databases whose headers are known to have their unique index
+_DATASET_EMBEDDED_INDEXED: Set[Tuple[str, str]] = set()
 
+# Fields of the header that are not fields of the Dataset
+HEADER_FIELDS = ("_id", "generation", "chunk_size", "relations")
+# Attempts to read the chunks of a header that is replaced concurrently
+READ_ATTEMPTS = 3
 
-async def get_dataset_embedded(dataset_id: str, config: Config = CONFIG) -> Dataset:
+# Builds of embedded Datasets that are in flight in this process
+DATASET_EMBEDDING_BUILDS = SingleFlight()
+
+# The window of entities to read per relation: (offset, limit), with no
+# limit if the limit is ``None``
+RelationWindows = Mapping[str, Tuple[int, Optional[int]]]
+
+
+async def get_dataset_embedded(
+    dataset_id: str, config: Config = CONFIG
+) -> Optional[Dataset]:
     """
     Given a Dataset ID, get the Dataset embedded object from metadata store.
 
@@ -41,32 +91,160 @@ async def get_dataset_embedded(dataset_id: str, config: Config = CONFIG) -> Data
         The Dataset object
 
     """
-    dataset_embedded = await get_entity(
-        identifier=dataset_id,
-        field="id",
-        collection_name=COLLECTION_NAME,
-        model_class=Dataset,
-        embedded=False,
-        config=config,
-    )
-    return dataset_embedded
+    cache = get_entity_cache(config)
+    cache_key = (COLLECTION_NAME, "id", dataset_id, None)
+    document = cache.get(cache_key) if cache else None
+    if document is None:
+        document = await get_dataset_embedded_document(dataset_id, config=config)
+        if cache and document:
+            cache.put(cache_key, document)
+    return Dataset(**document) if document else None
+
+
+async def get_dataset_embedded_document(
+    dataset_id: str, windows: Optional[RelationWindows] = None, config: Config = CONFIG
+) -> Optional[Dict]:
+    """
+    Given a Dataset ID, assemble the embedded Dataset from its header and chunks.
+
+    Args:
+        dataset_id: The Dataset ID
+        windows: The window of entities to read per relation. Only the chunks
+            that overlap the windows are read and relations without window are
+            left out. All entities of all relations are read by default.
+        config: Rumtime configuration
+
+    Returns:
+        The embedded Dataset document, or ``None`` if there is none
+
+    """
+    result = await get_dataset_embedded_window(dataset_id, windows, config=config)
+    return result[0] if result else None
+
+
+async def get_dataset_embedded_window(
+    dataset_id: str, windows: Optional[RelationWindows] = None, config: Config = CONFIG
+) -> Optional[Tuple[Dict, Dict[str, int]]]:
+    """
+    Given a Dataset ID, assemble the embedded Dataset from its header and chunks,
+    along with the number of entities of each of its relations.
+
+    Args:
+        dataset_id: The Dataset ID
+        windows: The window of entities to read per relation. Only the chunks
+            that overlap the windows are read and relations without window are
+            left out. All entities of all relations are read by default.
+        config: Rumtime configuration
+
+    Returns:
+        The embedded Dataset document and the number of entities per relation,
+        or ``None`` if there is no embedded Dataset
+
+    """
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    chunk_collection = client[config.db_name][CHUNK_COLLECTION_NAME]
+    for _ in range(READ_ATTEMPTS):
+        header = await collection.find_one({"id": dataset_id})
+        if header is None:
+            return None
+        if "generation" not in header:
+            return _slice_document(header, windows)
+        relations = header["relations"]
+        counts = {relation: value["count"] for relation, value in relations.items()}
+        if windows is None:
+            windows = {relation: (0, None) for relation in relations}
+        ranges = {
+            relation: _get_chunk_range(counts[relation], header["chunk_size"], *window)
+            for relation, window in windows.items()
+            if relation in relations
+        }
+        query = [
+            {"relation": relation, "index": {"$gte": first, "$lt": last}}
+            for relation, (first, last) in ranges.items()
+            if first < last
+        ]
+        chunks: List[Dict] = []
+        if query:
+            chunks = await chunk_collection.find(
+                {
+                    "dataset_id": dataset_id,
+                    "generation": header["generation"],
+                    "$or": query,
+                },
+                {"_id": False, "relation": True, "index": True, "items": True},
+            ).to_list(None)
+        if len(chunks) == sum(last - first for first, last in ranges.values()):
+            return _assemble_document(header, windows, ranges, chunks), counts
+    return None
+
+
+def _get_chunk_range(
+    count: int, chunk_size: int, offset: int, limit: Optional[int]
+) -> Tuple[int, int]:
+    """Get the chunks [first, last) of a relation that overlap a window."""
+    end = count if limit is None else min(count, offset + limit)
+    if offset >= end:
+        return (0, 0)
+    return (offset // chunk_size, (end - 1) // chunk_size + 1)
+
+
+def _assemble_document(
+    header: Dict,
+    windows: RelationWindows,
+    ranges: Mapping[str, Tuple[int, int]],
+    chunks: List[Dict],
+) -> Dict:
+    """Assemble an embedded Dataset from its header and the chunks of its
+    relations, cut to the windows of the relations."""
+    document = {k: v for k, v in header.items() if k not in HEADER_FIELDS}
+    chunks.sort(key=lambda chunk: (chunk["relation"], chunk["index"]))
+    items: Dict[str, List] = {relation: [] for relation in ranges}
+    for chunk in chunks:
+        items[chunk["relation"]].extend(chunk["items"])
+    for relation, (first, _) in ranges.items():
+        offset, limit = windows[relation]
+        start = offset - first * header["chunk_size"]
+        end = None if limit is None else start + limit
+        document[relation] = items[relation][max(start, 0) : end]
+    return document
+
+
+def _slice_document(
+    document: Dict, windows: Optional[RelationWindows]
+) -> Tuple[Dict, Dict[str, int]]:
+    """Cut the relations of an embedded Dataset stored as a single document."""
+    document = {k: v for k, v in document.items() if k != "_id"}
+    counts = {
+        field: len(value)
+        for field, value in document.items()
+        if field in embedded_fields and isinstance(value, list)
+    }
+    if windows is None:
+        return document, counts
+    for field in counts:
+        if field in windows:
+            offset, limit = windows[field]
+            end = None if limit is None else offset + limit
+            document[field] = document[field][offset:end]
+        else:
+            del document[field]
+    return document, counts
 
 
 async def create_dataset_embedded_object(
     dataset: Dataset, config: Config = CONFIG
 ) -> Dataset:
-    """Create the embedded dataset and store it to database if not added before
+    """Create the embedded dataset and store it to database, replacing an
+    embedded dataset that was stored before
 
     Args:
-        dataset (Dataset): _description_
-        config (Config, optional): _description_. Defaults to CONFIG.
+        dataset (Dataset): The Dataset with embedded references
+        config (Config, optional): Runtime configuration. Defaults to CONFIG.
 
     Returns:
         The final dataset with embedded objects
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-
     dataset_dict = dataset.dict()
     dataset_embedded_entity = {}
 
@@ -84,11 +262,97 @@ async def create_dataset_embedded_object(
                 dataset_dict[field], filters
             )
 
-    await collection.insert_one(dataset_embedded_entity)
+    await store_dataset_embedded(dataset_embedded_entity, config=config)
 
     return Dataset(**dataset_embedded_entity)
 
 
+async def _ensure_dataset_embedded_indexes(config: Config = CONFIG):
+    """Create the unique index of the headers that the generation guard of
+    ``store_dataset_embedded`` relies on, once per database and process."""
+    key = (config.db_url, config.db_name)
+    if key in _DATASET_EMBEDDED_INDEXED:
+        return
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    try:
+        await collection.create_indexes(INDEXES)
+    except OperationFailure as error:
+        logging.error(
+            "Embedded Datasets may be stored twice,"
+            " since their headers cannot be indexed: %s",
+            error,
+        )
+    _DATASET_EMBEDDED_INDEXED.add(key)
+
+
+async def store_dataset_embedded(document: Dict, config: Config = CONFIG):
+    """
+    Store an embedded Dataset as a header and chunks of a new generation.
+
+    The chunks are written first, then the header is replaced unless a newer
+    generation has been stored concurrently, and finally the chunks of the
+    generation that lost are removed.
+
+    Args:
+        document: The embedded Dataset
+        config: Runtime configuration
+
+    """
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    chunk_collection = client[config.db_name][CHUNK_COLLECTION_NAME]
+    dataset_id = document["id"]
+    chunk_size = config.dataset_embedded_chunk_size
+    # generations are ordered by the time of the build
+    generation = f"{await get_timestamp()}-{await generate_uuid()}"
+
+    header: Dict[str, Any] = {"generation": generation, "chunk_size": chunk_size}
+    header["relations"] = {}
+    chunks: List[Dict] = []
+    for field, value in document.items():
+        if field in embedded_fields and isinstance(value, list):
+            header["relations"][field] = {"count": len(value)}
+            chunks.extend(
+                {
+                    "dataset_id": dataset_id,
+                    "generation": generation,
+                    "relation": field,
+                    "index": index,
+                    "items": value[start : start + chunk_size],
+                }
+                for index, start in enumerate(range(0, len(value), chunk_size))
+            )
+        else:
+            header[field] = value
+    if chunks:
+        await chunk_collection.insert_many(chunks, ordered=False)
+
+    await _ensure_dataset_embedded_indexes(config)
+    try:
+        await collection.replace_one(
+            {
+                "id": dataset_id,
+                "$or": [
+                    {"generation": {"$exists": False}},
+                    {"generation": {"$lt": generation}},
+                ],
+            },
+            header,
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        # a newer generation was stored concurrently
+        await chunk_collection.delete_many(
+            {"dataset_id": dataset_id, "generation": generation}
+        )
+    else:
+        await chunk_collection.delete_many(
+            {"dataset_id": dataset_id, "generation": {"$lt": generation}}
+        )
+    invalidate_entities(COLLECTION_NAME)
+
+
 def get_embedded_entity_list(entity_obj: Dict, filters: Dict) -> Dict:
     """Embed the full objects instead of reference in an entity / list of entities
 
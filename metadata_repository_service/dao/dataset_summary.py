@@ -14,15 +14,73 @@
 # limitations under the License.
 """
 Convenience methods for retrieving Dataset summary
+
+Dataset summaries are stored with a ``version``, which counts how often the
+summary was computed, and the time it was ``computed_at``. Write paths that
+change a Dataset or the entities it references mark its summary as dirty with
+``mark_dataset_summaries_dirty``, which schedules the recomputation of the
+summary in the background. Until then, reads keep serving the last stored
+summary.
 """
 
+from typing import Dict, Iterable, List, Optional
+
 from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.scheduler import get_background_scheduler
+from metadata_repository_service.core.singleflight import SingleFlight
+from metadata_repository_service.core.utils import get_timestamp
+from metadata_repository_service.dao.cache import invalidate_entities
+from metadata_repository_service.dao.data_access_committee import (
+    COLLECTION_NAME as DAC_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.data_access_policy import (
+    COLLECTION_NAME as DAP_COLLECTION_NAME,
+)
 from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.experiment import (
+    COLLECTION_NAME as EXPERIMENT_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.file import COLLECTION_NAME as FILE_COLLECTION_NAME
+from metadata_repository_service.dao.indexes import field_index, id_index
+from metadata_repository_service.dao.individual import (
+    COLLECTION_NAME as INDIVIDUAL_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.member import (
+    COLLECTION_NAME as MEMBER_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.protocol import (
+    COLLECTION_NAME as PROTOCOL_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.sample import (
+    COLLECTION_NAME as SAMPLE_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.study import (
+    COLLECTION_NAME as STUDY_COLLECTION_NAME,
+)
 from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.models import BiologicalSexEnum
 from metadata_repository_service.summary_models import DatasetSummary, Summary
 
-# pylint: disable=too-many-locals, too-many-statements, too-many-branches
 COLLECTION_NAME = "DatasetSummary"
+INDEXES = [id_index(), field_index("dirty")]
+
+# The Dataset collection, whose DAO module depends on this one
+DATASET_COLLECTION_NAME = "Dataset"
+# The fields of a Dataset that are copied to its summary
+DATASET_FIELDS = ["id", "title", "description", "accession", "ega_accession", "type"]
+# The fields of the (last) Study of a Dataset that are copied to its summary
+STUDY_STATS = ["ega_accession", "accession", "title"]
+# The reference fields of a Dataset whose entities are summarized
+SUMMARIZED_REFERENCES = [
+    "has_data_access_policy",
+    "has_experiment",
+    "has_file",
+    "has_sample",
+    "has_study",
+]
+
+# Builds of missing summaries that are in flight in this process
+DATASET_SUMMARY_BUILDS = SingleFlight()
 
 
 async def get_dataset_summary_object(
@@ -50,15 +108,40 @@ async def get_dataset_summary_object(
     return dataset_summary
 
 
-async def create_dataset_summary_object(  # noqa: C901
+async def get_or_create_dataset_summary(
+    dataset_id: str, config: Config = CONFIG
+) -> Optional[DatasetSummary]:
+    """
+    Given a Dataset ID, get the Dataset summary, computing it if there is none yet.
+    Concurrent requests for a missing summary share a single computation.
+
+    Args:
+        dataset_id: The Dataset ID
+        config: Runtime configuration
+
+    Returns:
+        The Dataset summary, or ``None`` if there is no such Dataset
+
+    """
+    dataset_summary = await get_dataset_summary_object(dataset_id, config=config)
+    if dataset_summary is None:
+        dataset_summary = await DATASET_SUMMARY_BUILDS.run(
+            (config.db_url, config.db_name, dataset_id),
+            lambda: create_dataset_summary(dataset_id, config=config),
+        )
+    return dataset_summary
+
+
+async def create_dataset_summary_object(
     dataset_summary: DatasetSummary, config: Config = CONFIG
 ) -> DatasetSummary:
     """
-    This method creates a dataset summary objects and write to DatasetSummary collection
+    This method stores a dataset summary object in the DatasetSummary collection,
+    replacing the previous version of the summary.
 
     Args:
-        dataset_summary:
-        config :
+        dataset_summary: The Dataset summary
+        config: Runtime configuration
 
     Returns:
         DatasetSummary
@@ -66,46 +149,313 @@ async def create_dataset_summary_object(  # noqa: C901
     client = await get_db_client(config)
     collection = client[config.db_name][COLLECTION_NAME]
 
-    dataset_summary_entity = dataset_summary.dict()
-    dataset_summary_entity["id"] = dataset_summary.id
-    dataset_summary_entity["title"] = dataset_summary.title
-    dataset_summary_entity["ega_accession"] = dataset_summary.ega_accession
-    dataset_summary_entity["accession"] = dataset_summary.accession
-    dataset_summary_entity["description"] = dataset_summary.description
-    dataset_summary_entity["type"] = dataset_summary.type
-    dataset_summary_entity["dac_email"] = dataset_summary.dac_email
-
-    dataset_summary_entity["sample_summary"] = get_summary_dict(
-        dataset_summary.sample_summary
+    dataset_summary_entity = dataset_summary.dict(exclude={"version"})
+    dataset_summary_entity["computed_at"] = await get_timestamp()
+    dataset_summary_entity["dirty"] = False
+
+    # the unique index on the id lets concurrent computations in other
+    # processes converge on a single document
+    await collection.update_one(
+        {"id": dataset_summary.id},
+        {"$set": dataset_summary_entity, "$inc": {"version": 1}},
+        upsert=True,
     )
-    dataset_summary_entity["study_summary"] = get_summary_dict(
-        dataset_summary.study_summary
+    invalidate_entities(COLLECTION_NAME)
+    new_dataset_summary = await get_dataset_summary_object(
+        dataset_summary_entity["id"], config=config
     )
-    dataset_summary_entity["experiment_summary"] = get_summary_dict(
-        dataset_summary.experiment_summary
+    return new_dataset_summary
+
+
+def _lookup(
+    from_: str, local_field: str, as_field: str, position: Optional[str] = None
+) -> List[Dict]:
+    """Get the stages that join the documents referenced by a field, one per
+    reference. The references are unwound before the lookup, so that repeated
+    references are counted as often as they occur, like in the embedded Dataset,
+    and their position can be kept in the ``position`` field. The unwinding
+    directly follows the lookup, so that MongoDB never materializes all
+    referenced documents at once."""
+    unwind: Dict = {"path": f"${local_field}"}
+    if position:
+        unwind["includeArrayIndex"] = position
+    return [
+        {"$unwind": unwind},
+        {
+            "$lookup": {
+                "from": from_,
+                "localField": local_field,
+                "foreignField": "id",
+                "as": as_field,
+            }
+        },
+        {"$unwind": f"${as_field}"},
+    ]
+
+
+def _count_values(field: str) -> List[Dict]:
+    """Get the stages that count the documents per value of a field."""
+    return [
+        {"$match": {field: {"$ne": None}}},
+        {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+    ]
+
+
+def build_dataset_summary_pipeline(dataset_id: str) -> List[Dict]:
+    """
+    Build the aggregation pipeline that computes the summary of a Dataset from
+    the collections it references, in a single query on the Dataset collection.
+
+    Args:
+        dataset_id: The Dataset ID
+
+    Returns:
+        The aggregation pipeline, which yields one document with a list per
+        part of the summary
+
+    """
+    samples = _lookup(SAMPLE_COLLECTION_NAME, "has_sample", "sample")
+    individuals = samples + _lookup(
+        INDIVIDUAL_COLLECTION_NAME, "sample.has_individual", "individual"
     )
-    dataset_summary_entity["file_summary"] = get_summary_dict(
-        dataset_summary.file_summary
+    experiments = _lookup(EXPERIMENT_COLLECTION_NAME, "has_experiment", "experiment")
+    return [
+        {"$match": {"id": dataset_id}},
+        {"$limit": 1},
+        {
+            "$facet": {
+                "dataset": [{"$project": {x: 1 for x in DATASET_FIELDS}}],
+                "dac_email": _lookup(
+                    DAP_COLLECTION_NAME, "has_data_access_policy", "policy"
+                )
+                + _lookup(
+                    DAC_COLLECTION_NAME,
+                    "policy.has_data_access_committee",
+                    "committee",
+                )
+                + _lookup(MEMBER_COLLECTION_NAME, "committee.has_member", "member")
+                + [{"$project": {"email": "$member.email"}}],
+                "sample_count": samples + [{"$count": "count"}],
+                "sex": individuals + _count_values("individual.sex"),
+                "tissues": samples
+                + [{"$unwind": "$sample.has_anatomical_entity"}]
+                + _count_values("sample.has_anatomical_entity.concept_name"),
+                "phenotypes": individuals
+                + [{"$unwind": "$individual.has_phenotypic_feature"}]
+                + _count_values("individual.has_phenotypic_feature.concept_name"),
+                "studies": _lookup(
+                    STUDY_COLLECTION_NAME, "has_study", "study", position="position"
+                )
+                + [
+                    {"$sort": {"position": 1}},
+                    {
+                        "$project": {
+                            "ega_accession": "$study.ega_accession",
+                            "accession": "$study.accession",
+                            "title": "$study.title",
+                        }
+                    },
+                ],
+                "experiment_count": experiments + [{"$count": "count"}],
+                "protocols": experiments
+                + _lookup(
+                    PROTOCOL_COLLECTION_NAME, "experiment.has_protocol", "protocol"
+                )
+                + _count_values("protocol.instrument_model"),
+                "files": _lookup(FILE_COLLECTION_NAME, "has_file", "file")
+                + [
+                    {
+                        "$group": {
+                            "_id": "$file.format",
+                            "count": {"$sum": 1},
+                            "size": {"$sum": "$file.size"},
+                        }
+                    }
+                ],
+            }
+        },
+    ]
+
+
+def _get_counts(groups: List[Dict]) -> Dict[str, int]:
+    """Get the counts per value from the output of ``_count_values``."""
+    return {str(x["_id"]): x["count"] for x in groups if x["_id"] is not None}
+
+
+def _get_total(counts: List[Dict]) -> int:
+    """Get the count from the output of a ``$count`` stage."""
+    return counts[0]["count"] if counts else 0
+
+
+def _assemble_dataset_summary(facets: Dict) -> DatasetSummary:
+    """Assemble the Dataset summary from the output of the summary pipeline."""
+    dataset = facets["dataset"][0]
+    sex_counts = _get_counts(facets["sex"])
+    # ordered like the references in has_study
+    studies = facets["studies"]
+    files = facets["files"]
+    return DatasetSummary(
+        id=dataset["id"],
+        title=dataset.get("title"),
+        description=dataset.get("description"),
+        accession=dataset.get("accession"),
+        ega_accession=dataset.get("ega_accession"),
+        type=dataset.get("type"),
+        dac_email="".join(
+            f"{x['email']};" for x in facets["dac_email"] if x.get("email")
+        ),
+        sample_summary=Summary(
+            count=_get_total(facets["sample_count"]),
+            stats={
+                "sex": {
+                    "male": sex_counts.get(BiologicalSexEnum.male.value, 0),
+                    "female": sex_counts.get(BiologicalSexEnum.female.value, 0),
+                    "unkown": sex_counts.get(BiologicalSexEnum.unknown.value, 0),
+                },
+                "tissues": _get_counts(facets["tissues"]),
+                "phenotypes": _get_counts(facets["phenotypes"]),
+            },
+        ),
+        study_summary=Summary(
+            count=len(studies),
+            stats={key: studies[-1].get(key) for key in STUDY_STATS} if studies else {},
+        ),
+        experiment_summary=Summary(
+            count=_get_total(facets["experiment_count"]),
+            stats={"protocol": _get_counts(facets["protocols"])},
+        ),
+        file_summary=Summary(
+            count=sum(x["count"] for x in files),
+            stats={
+                "format": _get_counts(files),
+                "size": sum(x["size"] for x in files),
+            },
+        ),
     )
 
-    await collection.insert_one(dataset_summary_entity)
-    new_dataset_summary = await get_dataset_summary_object(
-        dataset_summary_entity["id"], config=config
+
+async def create_dataset_summary(
+    dataset_id: str, config: Config = CONFIG
+) -> Optional[DatasetSummary]:
+    """
+    Compute the summary of a Dataset in the metadata store and write it
+    to the metadata store.
+
+    Args:
+        dataset_id: The Dataset ID
+        config: Runtime configuration
+
+    Returns:
+        The Dataset summary, or ``None`` if there is no such Dataset
+
+    """
+    client = await get_db_client(config)
+    collection = client[config.db_name][DATASET_COLLECTION_NAME]
+    results = await collection.aggregate(
+        build_dataset_summary_pipeline(dataset_id)
+    ).to_list(None)
+    if not results or not results[0]["dataset"]:
+        return None
+    dataset_summary = _assemble_dataset_summary(results[0])
+    new_dataset_summary = await create_dataset_summary_object(
+        dataset_summary, config=config
     )
     return new_dataset_summary
 
 
-def get_summary_dict(summary: Summary):
+async def mark_dataset_summaries_dirty(
+    dataset_ids: Iterable[str], schedule: bool = True, config: Config = CONFIG
+):
+    """
+    Mark the summaries of Datasets as dirty and schedule their recomputation.
+
+    Datasets that do not have a summary yet are skipped, their summary is
+    computed when it is first requested.
+
+    Args:
+        dataset_ids: The Dataset IDs
+        schedule: Whether to schedule the recomputation, ``False`` if the
+            caller recomputes the summaries itself
+        config: Runtime configuration
+
+    """
+    dataset_ids = list(set(dataset_ids))
+    if not dataset_ids:
+        return
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    await collection.update_many(
+        {"id": {"$in": dataset_ids}}, {"$set": {"dirty": True}}
+    )
+    if not schedule:
+        return
+    summarized = await collection.distinct(
+        "id", {"id": {"$in": dataset_ids}, "dirty": True}
+    )
+    for dataset_id in summarized:
+        schedule_dataset_summary(dataset_id, config=config)
+
+
+async def mark_referencing_dataset_summaries_dirty(
+    entity_ids: Iterable[str], config: Config = CONFIG
+):
+    """
+    Mark the summaries of the given Datasets and of the Datasets that
+    reference any of the given entities as dirty.
+
+    Args:
+        entity_ids: The IDs of changed Datasets or entities
+        config: Runtime configuration
+
+    """
+    entity_ids = list(set(entity_ids))
+    if not entity_ids:
+        return
+    client = await get_db_client(config)
+    collection = client[config.db_name][DATASET_COLLECTION_NAME]
+    dataset_ids = await collection.distinct(
+        "id",
+        {
+            "$or": [{"id": {"$in": entity_ids}}]
+            + [{field: {"$in": entity_ids}} for field in SUMMARIZED_REFERENCES]
+        },
+    )
+    await mark_dataset_summaries_dirty(dataset_ids, config=config)
+
+
+def schedule_dataset_summary(dataset_id: str, config: Config = CONFIG):
+    """
+    Schedule the recomputation of the summary of a Dataset in the background.
+
+    Args:
+        dataset_id: The Dataset ID
+        config: Runtime configuration
+
     """
-    This method converts the summary object into dict
+
+    async def recompute():
+        await create_dataset_summary(dataset_id, config=config)
+
+    get_background_scheduler(config).schedule(
+        (config.db_url, config.db_name, COLLECTION_NAME, dataset_id), recompute
+    )
+
+
+async def schedule_dirty_dataset_summaries(config: Config = CONFIG) -> int:
+    """
+    Schedule the recomputation of all summaries that are marked as dirty,
+    e.g. because the process that marked them stopped before recomputing them.
 
     Args:
-        summary (Summary): summary
+        config: Runtime configuration
 
     Returns:
-        _type_: summary_dict
+        The number of scheduled summaries
+
     """
-    summary_dict = {"count": int, "stats": any}
-    summary_dict["count"] = summary.count
-    summary_dict["stats"] = summary.stats
-    return summary_dict
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    dataset_ids = await collection.distinct("id", {"dirty": True})
+    for dataset_id in dataset_ids:
+        schedule_dataset_summary(dataset_id, config=config)
+    return len(dataset_ids)
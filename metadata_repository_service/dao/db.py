@@ -15,15 +15,71 @@
 
 """Connects to database."""
 
+import asyncio
+from typing import Dict, Tuple
+
 from motor.motor_asyncio import AsyncIOMotorClient
 
 from metadata_repository_service.config import CONFIG, Config
 
+# One client (and therefore one connection pool) per database URL and event loop,
+# since a Motor client is bound to the event loop that first uses it
+DB_CLIENTS: Dict[Tuple[str, asyncio.AbstractEventLoop], AsyncIOMotorClient] = {}
+
+
+def create_db_client(config: Config = CONFIG) -> AsyncIOMotorClient:
+    """
+    Create a new database client with the pool settings from the configuration.
+    """
+    return AsyncIOMotorClient(
+        config.db_url,
+        maxPoolSize=config.db_max_pool_size,
+        minPoolSize=config.db_min_pool_size,
+        maxIdleTimeMS=config.db_max_idle_time_ms,
+        connectTimeoutMS=config.db_connect_timeout_ms,
+        serverSelectionTimeoutMS=config.db_server_selection_timeout_ms,
+        socketTimeoutMS=config.db_socket_timeout_ms,
+    )
+
+
+def _close_stale_db_clients():
+    """
+    Close the clients of event loops that are closed already, e.g. the ones of
+    previous ``asyncio.run`` calls of a script.
+    """
+    for key in [key for key in DB_CLIENTS if key[1].is_closed()]:
+        DB_CLIENTS.pop(key).close()
+
+
+async def connect_db(config: Config = CONFIG) -> AsyncIOMotorClient:
+    """
+    Create the process-wide database client for the configured database URL and
+    the running event loop, unless it already exists.
+    """
+    key = (config.db_url, asyncio.get_running_loop())
+    db_client = DB_CLIENTS.get(key)
+    if db_client is None:
+        _close_stale_db_clients()
+        db_client = create_db_client(config)
+        DB_CLIENTS[key] = db_client
+    return db_client
+
+
+async def close_db():
+    """
+    Close all process-wide database clients.
+    """
+    while DB_CLIENTS:
+        _, db_client = DB_CLIENTS.popitem()
+        db_client.close()
+
 
 async def get_db_client(config: Config = CONFIG) -> AsyncIOMotorClient:
     """
     Get database client.
+
+    The client is shared by the whole process (per event loop) and must not be
+    closed by the caller. It is created on first use if the application startup
+    did not create it already (e.g. when the DAO is used from scripts).
     """
-    db_url = config.db_url
-    db_client = AsyncIOMotorClient(db_url)
-    return db_client
+    return await connect_db(config)
@@ -0,0 +1,198 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Registry of the collection of each entity, keyed by its ID.
+
+Entity IDs are UUIDs that do not tell the type of their entity. The registry
+keeps the collection, accession and schema type of each entity, so that an
+entity can be found by its ID alone without looking into every collection. The
+write paths of the DAO register the entities that they store and unregister
+the ones that they delete. ``rebuild_entity_registry`` registers the entities
+that were written without going through the service.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from pymongo import UpdateOne
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.utils import generate_uuid
+from metadata_repository_service.dao.cache import get_entity_cache, invalidate_entities
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.indexes import id_index
+from metadata_repository_service.resolution_models import EntityRegistration
+
+COLLECTION_NAME = "EntityRegistry"
+INDEXES = [id_index()]
+
+# The collections whose entities are registered
+REGISTERED_COLLECTIONS = (
+    "Analysis",
+    "AnalysisProcess",
+    "Biospecimen",
+    "DataAccessCommittee",
+    "DataAccessPolicy",
+    "Dataset",
+    "Experiment",
+    "ExperimentProcess",
+    "File",
+    "Individual",
+    "Member",
+    "Project",
+    "Protocol",
+    "Publication",
+    "Sample",
+    "Study",
+    "Submission",
+    "Technology",
+    "Workflow",
+)
+# Number of entities that are registered with one bulk write by the rebuild
+REBUILD_BATCH_SIZE = 1000
+
+
+def _get_registration(collection_name: str, document: Mapping) -> Dict:
+    """Get the registration of a document of a collection."""
+    return {
+        "id": document["id"],
+        "entity_type": collection_name,
+        "accession": document.get("accession"),
+        "schema_type": document.get("schema_type") or collection_name,
+    }
+
+
+def _get_registration_operations(
+    records: Mapping[str, Iterable[Mapping]], rebuild: Optional[str] = None
+) -> List[UpdateOne]:
+    """Get the upserts that register the documents per collection name."""
+    operations = []
+    for collection_name, documents in records.items():
+        if collection_name not in REGISTERED_COLLECTIONS:
+            continue
+        for document in documents:
+            registration = _get_registration(collection_name, document)
+            if rebuild is not None:
+                registration["rebuild"] = rebuild
+            operations.append(
+                UpdateOne({"id": document["id"]}, {"$set": registration}, upsert=True)
+            )
+    return operations
+
+
+async def register_entities(
+    records: Mapping[str, Iterable[Mapping]], config: Config = CONFIG
+):
+    """
+    Register the collection, accession and schema type of stored documents
+    with a single bulk write.
+
+    Args:
+        records: The stored documents per collection name
+        config: Runtime configuration
+
+    """
+    operations = _get_registration_operations(records)
+    if not operations:
+        return
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    await collection.bulk_write(operations, ordered=False)
+    invalidate_entities(COLLECTION_NAME)
+
+
+async def unregister_entities(entity_ids: Iterable[str], config: Config = CONFIG):
+    """
+    Remove the registrations of deleted documents.
+
+    Args:
+        entity_ids: The IDs of the deleted documents
+        config: Runtime configuration
+
+    """
+    entity_ids = list(entity_ids)
+    if not entity_ids:
+        return
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    await collection.delete_many({"id": {"$in": entity_ids}})
+    invalidate_entities(COLLECTION_NAME)
+
+
+async def get_entity_registration(
+    entity_id: str, config: Config = CONFIG
+) -> Optional[EntityRegistration]:
+    """
+    Given an ID, get the collection, accession and schema type of its entity.
+
+    Args:
+        entity_id: The ID of the entity
+        config: Runtime configuration
+
+    Returns:
+        The registration of the entity, or ``None`` if there is no such entity
+
+    """
+    cache = get_entity_cache(config)
+    cache_key = (COLLECTION_NAME, "id", entity_id, None)
+    registration = cache.get(cache_key) if cache else None
+    if registration is None:
+        client = await get_db_client(config)
+        collection = client[config.db_name][COLLECTION_NAME]
+        registration = await collection.find_one(
+            {"id": entity_id}, {"_id": False, "rebuild": False}
+        )
+        if cache and registration:
+            cache.put(cache_key, registration)
+    return EntityRegistration(**registration) if registration else None
+
+
+async def rebuild_entity_registry(config: Config = CONFIG) -> Dict[str, int]:
+    """
+    Register all entities of the registered collections and remove the
+    registrations of entities that no longer exist.
+
+    Registrations of documents that are written while the registry is rebuilt
+    may get lost, so this should be run at a quiet moment.
+
+    Args:
+        config: Runtime configuration
+
+    Returns:
+        The number of registered entities per collection name
+
+    """
+    rebuild = await generate_uuid()
+    client = await get_db_client(config)
+    registry = client[config.db_name][COLLECTION_NAME]
+    counts: Dict[str, int] = {}
+    for collection_name in REGISTERED_COLLECTIONS:
+        counts[collection_name] = 0
+        collection = client[config.db_name][collection_name]
+        cursor = collection.find(
+            {}, {"_id": False, "id": True, "accession": True, "schema_type": True}
+        )
+        while True:
+            batch = await cursor.to_list(REBUILD_BATCH_SIZE)
+            if not batch:
+                break
+            await registry.bulk_write(
+                _get_registration_operations({collection_name: batch}, rebuild),
+                ordered=False,
+            )
+            counts[collection_name] += len(batch)
+    # registrations of entities that were not found in the rebuild
+    await registry.delete_many({"rebuild": {"$ne": rebuild}})
+    invalidate_entities(COLLECTION_NAME)
+    return counts
@@ -16,32 +16,114 @@
 Convenience methods for retrieving Experiment records
 """
 
-from typing import List
+from typing import AsyncIterator, List
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.dao.batch import get_entity_batch
 from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import embed_references, get_entity
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import (
+    embed_documents,
+    get_entity,
+    get_reference_fields,
+)
 from metadata_repository_service.models import Experiment
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Experiment"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_experiments(config: Config = CONFIG) -> List[str]:
+async def retrieve_experiments(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Experiment object IDs from metadata store.
+    Retrieve the Experiment object IDs from metadata store, without loading
+    the Experiment objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Experiment object IDs.
+
+    """
+    async for experiment_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield experiment_id
+
+
+async def list_experiments(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Experiment objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of Experiment object IDs.
+        The page of Experiment objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    experiments = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in experiments]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Experiment, config=config
+    )
+
+
+async def get_experiment_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Experiment IDs and accessions, get the Experiment objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Experiment IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found Experiment objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=Experiment, embedded=embedded, config=config
+    )
+
+
+async def get_experiment_referenced_by(
+    experiment_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given an Experiment ID, get a page of the entities that reference the Experiment.
+
+    Args:
+        experiment_id: The Experiment ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        experiment_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_experiment(
@@ -90,8 +172,6 @@ async def get_experiments_by_linked_files(
     collection = client[config.db_name][COLLECTION_NAME]
     entities = await collection.find({"has_file": {"$in": file_id_list}}).to_list(None)
     if entities and embedded:
-        for experiment in entities:
-            experiment = await embed_references(experiment, config=config)
-    client.close()
+        entities = await embed_documents(entities, config=config)
     experiment_entities = [Experiment(**x) for x in entities]
     return experiment_entities
@@ -16,32 +16,114 @@
 Convenience methods for retrieving ExperimentProcess records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import ExperimentProcess
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "ExperimentProcess"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_experiment_processes(config: Config = CONFIG) -> List[str]:
+async def retrieve_experiment_processes(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of ExperimentProcess object IDs from metadata store.
+    Retrieve the ExperimentProcess object IDs from metadata store, without loading
+    the ExperimentProcess objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The ExperimentProcess object IDs.
+
+    """
+    async for experiment_process_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield experiment_process_id
+
+
+async def list_experiment_processes(
+    page: PageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Get a page of ExperimentProcess objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of ExperimentProcess object IDs.
+        The page of ExperimentProcess objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    experiment_processes = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in experiment_processes]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=ExperimentProcess, config=config
+    )
+
+
+async def get_experiment_process_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given ExperimentProcess IDs and accessions, get the ExperimentProcess objects from metadata
+    store with one query.
+
+    Args:
+        batch: The ExperimentProcess IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found ExperimentProcess objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME,
+        batch,
+        model_class=ExperimentProcess,
+        embedded=embedded,
+        config=config,
+    )
+
+
+async def get_experiment_process_referenced_by(
+    experiment_process_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given an ExperimentProcess ID, get a page of the entities that reference
+    the ExperimentProcess.
+
+    Args:
+        experiment_process_id: The ExperimentProcess ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        experiment_process_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_experiment_process(
@@ -16,32 +16,105 @@
 Convenience methods for retrieving File records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import File
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "File"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_files(config: Config = CONFIG) -> List[str]:
+async def retrieve_files(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of File object IDs from metadata store.
+    Retrieve the File object IDs from metadata store, without loading
+    the File objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The File object IDs.
+
+    """
+    async for file_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield file_id
+
+
+async def list_files(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of File objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of File objects.
+
+    """
+    return await get_entity_page(COLLECTION_NAME, page, model_class=File, config=config)
+
+
+async def get_file_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given File IDs and accessions, get the File objects from metadata
+    store with one query.
+
+    Args:
+        batch: The File IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found File objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=File, embedded=embedded, config=config
+    )
+
+
+async def get_file_referenced_by(
+    file_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a File ID, get a page of the entities that reference the File.
+
+    Args:
+        file_id: The File ID
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of File object IDs.
+        The page of referencing entities, with the cursor of the next page
+        if there is one
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    files = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in files]
+    return await get_referencing_entities(file_id, COLLECTION_NAME, page, config=config)
 
 
 async def get_file(
@@ -96,14 +169,3 @@ async def get_file_by_accession(
         config=config,
     )
     return file_entity
-
-
-async def get_file_format(config: Config = CONFIG):
-    """
-    Returns file format
-    """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    file_format = await collection.find({}, {"format": 1, "_id": False}).to_list(None)
-    client.close()
-    return file_format
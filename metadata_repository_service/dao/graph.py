@@ -0,0 +1,235 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Walking the references between entities.
+
+A walk starts at one entity and follows the references level by level: down to
+the entities that the reached entities reference, and up to the entities that
+reference them, through the reference edges. Each level takes one query per
+collection of the newly reached entities, plus one query on the reference edges
+when walking up, however many entities the level has. Each entity is visited
+once, so cycles end the walk, which also stops at the configured maximum number
+of entities.
+"""
+
+import asyncio
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.reference_edges import (
+    COLLECTION_NAME as EDGE_COLLECTION_NAME,
+)
+from metadata_repository_service.dao.reference_edges import (
+    embedded_fields,
+    get_reference_edges,
+)
+from metadata_repository_service.graph_models import (
+    Graph,
+    GraphDirectionEnum,
+    GraphEdge,
+    GraphNode,
+    GraphRequest,
+)
+
+# (collection name, ID) of an entity
+NodeKey = Tuple[str, str]
+
+
+async def _load_nodes(
+    keys: Iterable[NodeKey], with_references: bool, config: Config = CONFIG
+) -> Dict[NodeKey, Dict]:
+    """Load the documents of entities with one query per collection, with their
+    reference fields if requested."""
+    ids_by_collection: Dict[str, List[str]] = {}
+    for collection_name, entity_id in keys:
+        ids_by_collection.setdefault(collection_name, []).append(entity_id)
+    projection = {"_id": False, "id": True, "accession": True, "schema_type": True}
+    if with_references:
+        projection.update({field: True for field in embedded_fields})
+    client = await get_db_client(config)
+    results = await asyncio.gather(
+        *(
+            client[config.db_name][collection_name]
+            .find({"id": {"$in": ids}}, projection)
+            .to_list(None)
+            for collection_name, ids in ids_by_collection.items()
+        )
+    )
+    return {
+        (collection_name, document["id"]): document
+        for collection_name, documents in zip(ids_by_collection, results)
+        for document in documents
+    }
+
+
+async def _get_referencing_edges(
+    keys: Iterable[NodeKey], config: Config = CONFIG
+) -> List[Dict]:
+    """Get the reference edges to entities with one query."""
+    keys = set(keys)
+    client = await get_db_client(config)
+    collection = client[config.db_name][EDGE_COLLECTION_NAME]
+    edges = await collection.find(
+        {"target_id": {"$in": [entity_id for _, entity_id in keys]}},
+        {"_id": False, "key": False, "rebuild": False},
+    ).to_list(None)
+    return [x for x in edges if (x["target_collection"], x["target_id"]) in keys]
+
+
+def _get_node(key: NodeKey, document: Dict, depth: int) -> GraphNode:
+    """Get the node of a reached entity."""
+    return GraphNode(
+        entity_type=key[0],
+        id=key[1],
+        accession=document.get("accession"),
+        schema_type=document.get("schema_type"),
+        depth=depth,
+    )
+
+
+def _get_edge(edge: Dict) -> GraphEdge:
+    """Get the graph edge of a reference edge."""
+    return GraphEdge(
+        source_type=edge["source_collection"],
+        source_id=edge["source_id"],
+        field=edge["field"],
+        target_type=edge["target_collection"],
+        target_id=edge["target_id"],
+    )
+
+
+def _add_edges(
+    edges: Dict[Tuple[str, str, str], GraphEdge],
+    candidates: Iterable[Dict],
+    nodes: Dict[NodeKey, GraphNode],
+):
+    """Add the reference edges whose both entities were reached."""
+    for edge in candidates:
+        source = (edge["source_collection"], edge["source_id"])
+        target = (edge["target_collection"], edge["target_id"])
+        if source in nodes and target in nodes:
+            key = (edge["source_id"], edge["field"], edge["target_id"])
+            edges[key] = _get_edge(edge)
+
+
+async def _get_candidates(
+    frontier: Dict[NodeKey, Dict], request: GraphRequest, config: Config = CONFIG
+) -> List[Tuple[Dict, NodeKey]]:
+    """Get the reference edges that lead away from the entities of a level, each
+    with the entity at its other end, in the direction and types of the walk."""
+    candidates: List[Tuple[Dict, NodeKey]] = []
+    if request.direction in (GraphDirectionEnum.DOWN, GraphDirectionEnum.BOTH):
+        candidates.extend(
+            (edge, (edge["target_collection"], edge["target_id"]))
+            for key, document in frontier.items()
+            for edge in get_reference_edges(key[0], document)
+        )
+    if request.direction in (GraphDirectionEnum.UP, GraphDirectionEnum.BOTH):
+        candidates.extend(
+            (edge, (edge["source_collection"], edge["source_id"]))
+            for edge in await _get_referencing_edges(frontier, config=config)
+        )
+    if request.types is not None:
+        candidates = [x for x in candidates if x[1][0] in request.types]
+    return candidates
+
+
+async def get_entity_graph(
+    collection_name: str,
+    entity_id: str,
+    request: GraphRequest,
+    config: Config = CONFIG,
+) -> Optional[Graph]:
+    """
+    Given an entity, walk its references level by level and get the reached
+    entities and the references between them.
+
+    Args:
+        collection_name: The collection of the start entity
+        entity_id: The ID of the start entity
+        request: The direction, depth and entity types of the walk
+        config: Runtime configuration
+
+    Returns:
+        The reached entities and the followed references, or ``None`` if there
+        is no start entity
+
+    """
+    with_references = request.direction != GraphDirectionEnum.UP
+    start: NodeKey = (collection_name, entity_id)
+    frontier = await _load_nodes([start], with_references, config=config)
+    if start not in frontier:
+        return None
+    nodes = {start: _get_node(start, frontier[start], 0)}
+    edges: Dict[Tuple[str, str, str], GraphEdge] = {}
+    truncated = False
+
+    for depth in range(1, request.depth + 1):
+        candidates = await _get_candidates(frontier, request, config=config)
+        frontier = await _load_nodes(
+            sorted({key for _, key in candidates if key not in nodes}),
+            with_references,
+            config=config,
+        )
+        remaining = config.max_graph_nodes - len(nodes)
+        if len(frontier) > remaining:
+            truncated = True
+            frontier = {key: frontier[key] for key in sorted(frontier)[:remaining]}
+        for key, document in frontier.items():
+            nodes[key] = _get_node(key, document, depth)
+        _add_edges(edges, (edge for edge, _ in candidates), nodes)
+        if truncated or not frontier:
+            break
+
+    return Graph(
+        nodes=list(nodes.values()), edges=list(edges.values()), truncated=truncated
+    )
+
+
+async def get_reachable_entities(
+    collection_name: str, entity_id: str, config: Config = CONFIG
+) -> Optional[Set[NodeKey]]:
+    """
+    Given an entity, get all entities that it references directly or indirectly,
+    without limits on the depth or the number of entities.
+
+    Args:
+        collection_name: The collection of the start entity
+        entity_id: The ID of the start entity
+        config: Runtime configuration
+
+    Returns:
+        The collection names and IDs of the reached entities, without the start
+        entity, or ``None`` if there is no start entity
+
+    """
+    start: NodeKey = (collection_name, entity_id)
+    frontier = await _load_nodes([start], with_references=True, config=config)
+    if start not in frontier:
+        return None
+    reached = {start}
+    while frontier:
+        referenced = {
+            (edge["target_collection"], edge["target_id"])
+            for key, document in frontier.items()
+            for edge in get_reference_edges(key[0], document)
+        }
+        frontier = await _load_nodes(
+            sorted(referenced - reached), with_references=True, config=config
+        )
+        reached.update(frontier)
+    reached.discard(start)
+    return reached
@@ -0,0 +1,85 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Registry of the declared indexes of all collections of the metadata store"""
+
+from typing import Dict, List
+
+from pymongo import IndexModel
+
+from metadata_repository_service.dao import (
+    analysis,
+    analysis_process,
+    biospecimen,
+    data_access_committee,
+    data_access_policy,
+    dataset,
+    dataset_closure,
+    dataset_embedded,
+    dataset_summary,
+    entity_registry,
+    experiment,
+    experiment_process,
+    file,
+    individual,
+    member,
+    metadata_summary,
+    project,
+    protocol,
+    publication,
+    reference_edges,
+    sample,
+    study,
+    submission,
+    technology,
+    workflow,
+)
+from metadata_repository_service.dao.accession import (
+    ACCESSION_TRACKER_COLLECTION,
+    ACCESSION_TRACKER_INDEXES,
+)
+
+INDEX_REGISTRY: Dict[str, List[IndexModel]] = {
+    module.COLLECTION_NAME: module.INDEXES
+    for module in (
+        analysis,
+        analysis_process,
+        biospecimen,
+        data_access_committee,
+        data_access_policy,
+        dataset,
+        dataset_closure,
+        dataset_embedded,
+        dataset_summary,
+        entity_registry,
+        experiment,
+        experiment_process,
+        file,
+        individual,
+        member,
+        metadata_summary,
+        project,
+        protocol,
+        publication,
+        reference_edges,
+        sample,
+        study,
+        submission,
+        technology,
+        workflow,
+    )
+}
+INDEX_REGISTRY[ACCESSION_TRACKER_COLLECTION] = ACCESSION_TRACKER_INDEXES
+INDEX_REGISTRY[dataset_embedded.CHUNK_COLLECTION_NAME] = dataset_embedded.CHUNK_INDEXES
@@ -0,0 +1,234 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declaration and reconciliation of the indexes of the metadata store.
+
+Each DAO module declares the indexes of its collection in ``INDEXES``, next to
+its ``COLLECTION_NAME``. ``reconcile_indexes`` compares the declared indexes with
+the ones that exist in the metadata store, creates the missing ones and reports
+the ones that differ from their declaration or are not declared at all.
+Text indexes, e.g. the ones of the ``populate_metadata_store`` script, are not
+managed and thus never reported or dropped.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Mapping, Sequence
+
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.dao.db import get_db_client
+
+# Options that are compared between a declared and an existing index
+INDEX_OPTIONS = ("unique", "sparse", "partialFilterExpression", "expireAfterSeconds")
+
+
+def id_index(unique: bool = True) -> IndexModel:
+    """Index on the ``id`` of the documents of a collection."""
+    return IndexModel([("id", ASCENDING)], name="id", unique=unique)
+
+
+def accession_index() -> IndexModel:
+    """Unique index on the ``accession`` of the documents that have one."""
+    return IndexModel(
+        [("accession", ASCENDING)],
+        name="accession",
+        unique=True,
+        partialFilterExpression={"accession": {"$type": "string"}},
+    )
+
+
+def creation_date_index() -> IndexModel:
+    """Index on the ``creation_date`` and ``id`` of the documents of a collection,
+    to page through the documents in the order of their creation."""
+    return IndexModel(
+        [("creation_date", ASCENDING), ("id", ASCENDING)], name="creation_date_id"
+    )
+
+
+def field_index(field: str, unique: bool = False) -> IndexModel:
+    """Index on a single field of the documents of a collection."""
+    return IndexModel([(field, ASCENDING)], name=field, unique=unique)
+
+
+def reference_indexes(fields: Iterable[str]) -> List[IndexModel]:
+    """Multikey indexes on reference fields, to look up the documents that
+    reference a given document.
+    """
+    return [field_index(field) for field in sorted(set(fields))]
+
+
+class CollectionIndexReport(BaseModel):
+    """The differences between the declared and the existing indexes of a collection."""
+
+    collection_name: str
+    missing: List[str] = Field(
+        [], description="Declared indexes that do not exist (yet)."
+    )
+    changed: List[str] = Field(
+        [],
+        description="Existing indexes whose keys or options differ from the declaration.",
+    )
+    extra: List[str] = Field([], description="Existing indexes that are not declared.")
+    created: List[str] = []
+    dropped: List[str] = []
+    failed: Dict[str, str] = Field(
+        {}, description="Indexes that could not be created or dropped, with the error."
+    )
+
+    def is_consistent(self) -> bool:
+        """Whether the existing indexes match the declared indexes."""
+        return not (
+            set(self.missing) - set(self.created)
+            or set(self.changed) - set(self.created)
+            or set(self.extra) - set(self.dropped)
+        )
+
+
+def _normalize_index(index: Mapping) -> Dict:
+    """Get the keys and the compared options of an index specification."""
+    normalized = {"key": list(index["key"].items())}
+    for option in INDEX_OPTIONS:
+        if index.get(option):
+            normalized[option] = index[option]
+    return normalized
+
+
+def _is_text_index(index: Mapping) -> bool:
+    """Check whether an existing index is a text index."""
+    return "_fts" in index["key"]
+
+
+def _compare_indexes(
+    collection_name: str, indexes: Sequence[IndexModel], existing: Mapping[str, Dict]
+) -> CollectionIndexReport:
+    """Compare the declared indexes of a collection with the existing ones."""
+    report = CollectionIndexReport(collection_name=collection_name)
+    for index in indexes:
+        name = index.document["name"]
+        if name not in existing:
+            report.missing.append(name)
+        elif _normalize_index(existing[name]) != _normalize_index(index.document):
+            report.changed.append(name)
+    declared = {index.document["name"] for index in indexes}
+    report.extra = sorted(
+        name
+        for name, index in existing.items()
+        if name not in declared and name != "_id_" and not _is_text_index(index)
+    )
+    return report
+
+
+async def reconcile_collection_indexes(
+    collection_name: str,
+    indexes: Sequence[IndexModel],
+    create: bool = True,
+    prune: bool = False,
+    config: Config = CONFIG,
+) -> CollectionIndexReport:
+    """
+    Compare the declared indexes of a collection with the existing ones.
+
+    Args:
+        collection_name: The collection in the metadata store
+        indexes: The declared indexes of the collection
+        create: Whether to create the missing indexes
+        prune: Whether to drop the indexes that are not declared and to
+            rebuild the ones that differ from their declaration
+        config: Runtime configuration
+
+    Returns:
+        The report of the differences and the changes that were made
+
+    """
+    client = await get_db_client(config)
+    collection = client[config.db_name][collection_name]
+    existing = {
+        index["name"]: index for index in await collection.list_indexes().to_list(None)
+    }
+    report = _compare_indexes(collection_name, indexes, existing)
+
+    to_drop = report.extra + report.changed if prune else []
+    to_create = report.missing + to_drop if create or prune else []
+    for name in to_drop:
+        try:
+            await collection.drop_index(name)
+        except OperationFailure as error:
+            report.failed[name] = str(error)
+        else:
+            if name in report.extra:
+                report.dropped.append(name)
+    for index in indexes:
+        name = index.document["name"]
+        if name not in to_create or name in report.failed:
+            continue
+        try:
+            await collection.create_indexes([index])
+        except OperationFailure as error:
+            report.failed[name] = str(error)
+        else:
+            report.created.append(name)
+    return report
+
+
+async def reconcile_indexes(
+    registry: Mapping[str, Sequence[IndexModel]],
+    create: bool = True,
+    prune: bool = False,
+    config: Config = CONFIG,
+) -> List[CollectionIndexReport]:
+    """
+    Compare the declared indexes of all collections with the existing ones
+    and log the differences.
+
+    Args:
+        registry: The declared indexes per collection name
+        create: Whether to create the missing indexes
+        prune: Whether to drop the indexes that are not declared and to
+            rebuild the ones that differ from their declaration
+        config: Runtime configuration
+
+    Returns:
+        The reports of all collections
+
+    """
+    reports = []
+    for collection_name, indexes in registry.items():
+        report = await reconcile_collection_indexes(
+            collection_name, indexes, create=create, prune=prune, config=config
+        )
+        for name, error in report.failed.items():
+            logging.error(
+                "Could not reconcile index %s of collection %s: %s",
+                name,
+                collection_name,
+                error,
+            )
+        if report.changed and not prune:
+            logging.warning(
+                "Indexes of collection %s differ from their declaration: %s",
+                collection_name,
+                ", ".join(report.changed),
+            )
+        if report.extra and not prune:
+            logging.info(
+                "Collection %s has undeclared indexes: %s",
+                collection_name,
+                ", ".join(report.extra),
+            )
+        reports.append(report)
+    return reports
@@ -16,33 +16,109 @@
 Convenience methods for retrieving Individual records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import Individual
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Individual"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_individuals(config: Config = CONFIG) -> List[str]:
+async def retrieve_individuals(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Individual object IDs from metadata store.
+    Retrieve the Individual object IDs from metadata store, without loading
+    the Individual objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Individual object IDs.
+
+    """
+    async for individual_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield individual_id
+
+
+async def list_individuals(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Individual objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of Individual object IDs.
+        The page of Individual objects.
+
+    """
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Individual, config=config
+    )
+
+
+async def get_individual_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Individual IDs and accessions, get the Individual objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Individual IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
         config: Rumtime configuration
 
+    Returns:
+        The found Individual objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=Individual, embedded=embedded, config=config
+    )
+
+
+async def get_individual_referenced_by(
+    individual_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given an Individual ID, get a page of the entities that reference the Individual.
+
+    Args:
+        individual_id: The Individual ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    individuals = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in individuals]
+    return await get_referencing_entities(
+        individual_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_individual(
@@ -69,14 +145,3 @@ async def get_individual(
         config=config,
     )
     return individual
-
-
-async def get_sex_count(config: Config = CONFIG):
-    """
-    Returns file format
-    """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    sex_count = await collection.find({}, {"sex": 1, "_id": False}).to_list(None)
-    client.close()
-    return sex_count
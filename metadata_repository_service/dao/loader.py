@@ -0,0 +1,186 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Request-scoped loading of entities.
+
+Within one request the same entities are often looked up many times, and
+independent lookups are often issued concurrently. The ``EntityLoader`` batches
+all lookups that are issued in the same iteration of the event loop into one
+``$in`` query per collection and field, and memoizes the documents it found
+for the rest of the request.
+"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.dao.db import get_db_client
+
+# (collection name, field name, value)
+DocumentKey = Tuple[str, str, str]
+
+REQUEST_LOADER: ContextVar[Optional["EntityLoader"]] = ContextVar(
+    "request_loader", default=None
+)
+
+
+class EntityLoader:
+    """Batches and memoizes lookups of documents by the value of a field.
+
+    The memoized documents are shared by all callers within a request and must
+    not be modified. Lookups that find nothing are not memoized, so that
+    documents created during the request can be found afterwards.
+    """
+
+    def __init__(self, config: Config = CONFIG):
+        self.config = config
+        self._documents: Dict[DocumentKey, Dict] = {}
+        # lookups that were requested but not dispatched yet, per collection and field
+        self._batches: Dict[Tuple[str, str], Tuple[Set[str], asyncio.Future]] = {}
+        # batches that will resolve a lookup, until they are done
+        self._in_flight: Dict[DocumentKey, asyncio.Future] = {}
+        # dispatches that are running, referenced so that they are not collected
+        self._dispatches: Set[asyncio.Future] = set()
+
+    async def load(
+        self, collection_name: str, field: str, value: str
+    ) -> Optional[Dict]:
+        """Get the document of a collection that has the value in the given field."""
+        documents = await self.load_many(collection_name, field, [value])
+        return documents.get(value)
+
+    async def load_many(
+        self, collection_name: str, field: str, values: Iterable[str]
+    ) -> Dict[str, Dict]:
+        """Get the documents of a collection that have one of the values in the
+        given field, keyed by that value. Values without a document are omitted.
+        """
+        values = list(values)
+        found: Dict[str, Dict] = {}
+        batches: Set[asyncio.Future] = set()
+        for value in values:
+            key = (collection_name, field, value)
+            document = self._documents.get(key)
+            if document is not None:
+                found[value] = document
+                continue
+            batch = self._in_flight.get(key)
+            if batch is None:
+                batch = self._add_to_batch(collection_name, field, value)
+                self._in_flight[key] = batch
+            batches.add(batch)
+        if batches:
+            results = await asyncio.gather(*(asyncio.shield(x) for x in batches))
+            for documents in results:
+                found.update(
+                    (value, documents[value]) for value in values if value in documents
+                )
+        return found
+
+    def invalidate(self, collection_name: str):
+        """Forget the memoized documents of a collection, e.g. after writing to it."""
+        self._documents = {
+            key: document
+            for key, document in self._documents.items()
+            if key[0] != collection_name
+        }
+
+    def _add_to_batch(
+        self, collection_name: str, field: str, value: str
+    ) -> asyncio.Future:
+        """Add a lookup to the batch that is dispatched in the next loop iteration."""
+        batch = self._batches.get((collection_name, field))
+        if batch is None:
+            loop = asyncio.get_running_loop()
+            if not self._batches:
+                loop.call_soon(self._start_dispatch)
+            batch = (set(), loop.create_future())
+            self._batches[(collection_name, field)] = batch
+        batch[0].add(value)
+        return batch[1]
+
+    def _start_dispatch(self):
+        """Start the dispatch of the batches collected so far."""
+        dispatch = asyncio.ensure_future(self._dispatch())
+        self._dispatches.add(dispatch)
+        dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self):
+        """Run the queries for all batches collected so far."""
+        batches, self._batches = self._batches, {}
+        try:
+            await asyncio.gather(
+                *(
+                    self._query(collection_name, field, values, future)
+                    for (collection_name, field), (values, future) in batches.items()
+                )
+            )
+        finally:
+            # e.g. if the dispatch was cancelled, the waiters must not hang
+            for (collection_name, field), (values, future) in batches.items():
+                if not future.done():
+                    future.cancel()
+                for value in values:
+                    self._in_flight.pop((collection_name, field, value), None)
+
+    async def _query(
+        self, collection_name: str, field: str, values: Set[str], future: asyncio.Future
+    ):
+        """Look up a batch of values of one collection and field with one query."""
+        try:
+            client = await get_db_client(self.config)
+            collection = client[self.config.db_name][collection_name]
+            documents: List[Dict] = await collection.find(
+                {field: {"$in": list(values)}}
+            ).to_list(None)
+        except Exception as error:  # pylint: disable=broad-except
+            future.set_exception(error)
+            return
+        finally:
+            for value in values:
+                self._in_flight.pop((collection_name, field, value), None)
+        found: Dict[str, Dict] = {}
+        for document in documents:
+            field_value = document.get(field)
+            if isinstance(field_value, str):
+                # keep the first match, like find_one would
+                found.setdefault(field_value, document)
+        for value, document in found.items():
+            self._documents[(collection_name, field, value)] = document
+            if "id" in document:
+                self._documents.setdefault(
+                    (collection_name, "id", document["id"]), document
+                )
+        future.set_result(found)
+
+
+def get_request_loader(config: Config = CONFIG) -> Optional[EntityLoader]:
+    """Get the loader of the current request, if it reads from the same database."""
+    loader = REQUEST_LOADER.get()
+    if (
+        loader is not None
+        and loader.config.db_url == config.db_url
+        and loader.config.db_name == config.db_name
+    ):
+        return loader
+    return None
+
+
+def invalidate_loaded_entities(collection_name: str):
+    """Forget the documents of a collection that the current request loaded."""
+    loader = REQUEST_LOADER.get()
+    if loader is not None:
+        loader.invalidate(collection_name)
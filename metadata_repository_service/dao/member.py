@@ -16,35 +16,107 @@
 Convenience methods for retrieving Member records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
 from metadata_repository_service.core.utils import generate_uuid, get_timestamp
 from metadata_repository_service.creation_models import CreateMember
+from metadata_repository_service.dao.batch import get_entity_batch
 from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.entity_registry import register_entities
+from metadata_repository_service.dao.indexes import (
+    creation_date_index,
+    field_index,
+    id_index,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
 from metadata_repository_service.dao.utils import get_entity
 from metadata_repository_service.models import Member
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Member"
+INDEXES = [id_index(), creation_date_index(), field_index("email")]
 
 
-async def retrieve_members(config: Config = CONFIG) -> List[str]:
+async def retrieve_members(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Member object IDs from metadata store.
+    Retrieve the Member object IDs from metadata store, without loading
+    the Member objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Member object IDs.
+
+    """
+    async for member_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield member_id
+
+
+async def list_members(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Member objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of Member object IDs.
+        The page of Member objects.
+
+    """
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Member, config=config
+    )
+
+
+async def get_member_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Member IDs and accessions, get the Member objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Member IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
         config: Rumtime configuration
 
+    Returns:
+        The found Member objects, and the IDs and accessions without one.
+
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    members = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in members]
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=Member, embedded=embedded, config=config
+    )
+
+
+async def get_member_referenced_by(
+    member_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a Member ID, get a page of the entities that reference the Member.
+
+    Args:
+        member_id: The Member ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        member_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_member(
@@ -119,6 +191,6 @@ async def create_member(member_obj: CreateMember, config: Config = CONFIG) -> Me
     member_entity["update_date"] = member_entity["creation_date"]
     member_entity["schema_type"] = "Member"
     await collection.insert_one(member_entity)
-    client.close()
+    await register_entities({COLLECTION_NAME: [member_entity]}, config=config)
     member = await get_member(member_entity["id"], config=config)
     return member
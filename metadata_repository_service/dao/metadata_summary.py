@@ -13,65 +13,279 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """
-Convenience methods for retrieving Dataset summary
+Convenience methods for retrieving Metadata summary
+
+The Metadata summary is kept in counter documents, one for the document count
+of each summarized collection and one for each value of its stats. The write
+paths of the DAO update the counters with ``$inc`` as they store and delete
+documents, so that reading the summary takes a single query. The counters can
+be rebuilt from the summarized collections with ``rebuild_summary_counters``,
+which also happens when the summary is read before the counters were built.
 """
 
+import asyncio
+from collections import Counter
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pymongo import ASCENDING, DeleteMany, IndexModel, UpdateOne
+
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.dataset_summary import get_summary_dict
+from metadata_repository_service.core.utils import get_timestamp
 from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.summary_models import MetadataSummary
+from metadata_repository_service.summary_models import MetadataSummary, Summary
+
+COLLECTION_NAME = "MetadataSummaryCounter"
+INDEXES: List[IndexModel] = [
+    IndexModel(
+        [("collection", ASCENDING), ("stat", ASCENDING), ("value", ASCENDING)],
+        name="collection_stat_value",
+        unique=True,
+    )
+]
 
-# pylint: disable=too-many-locals, too-many-statements, too-many-branches
-COLLECTION_NAME = "MetadataSummary"
+# The field of the metadata summary for each summarized collection
+SUMMARY_FIELDS: Dict[str, str] = {
+    "Dataset": "dataset_summary",
+    "File": "file_summary",
+    "Individual": "individual_summary",
+    "Protocol": "protocol_summary",
+    "Sample": "sample_summary",
+    "Experiment": "experiment_summary",
+    "Analysis": "analysis_summary",
+    "Study": "study_summary",
+    "Project": "project_summary",
+    "Biospecimen": "biospecimen_summary",
+}
 
+# The stats of each summarized collection, each counting the documents per
+# value of a field. Documents with several values are counted for each value.
+SUMMARY_STATS: Dict[str, Dict[str, str]] = {
+    "Dataset": {"type": "type"},
+    "File": {"format": "format"},
+    "Individual": {"sex": "sex"},
+    "Protocol": {"protocol": "instrument_model"},
+    "Sample": {"type": "type", "case_control_status": "case_control_status"},
+    "Experiment": {"type": "type"},
+    "Analysis": {"type": "type", "reference_genome": "reference_genome"},
+    "Study": {"type": "type"},
+    "Project": {},
+    "Biospecimen": {"type": "type"},
+}
 
-async def get_metadata_summary_object(config: Config = CONFIG) -> MetadataSummary:
+# (collection name, stat, value) of a counter, with stat and value set to
+# ``None`` for the document count of the collection
+CounterKey = Tuple[str, Optional[str], Optional[str]]
+
+# The counter document that records when the counters were last rebuilt
+REBUILD_MARKER = {"collection": None, "stat": None, "value": None}
+
+
+def _get_summary_pipeline(stats: Dict[str, str]) -> List[Dict]:
+    """Get the aggregation pipeline that counts the documents of a collection
+    and the documents per value of each stat field in one pass."""
+    facets: Dict[str, List[Dict]] = {"count": [{"$count": "count"}]}
+    for stat, field in stats.items():
+        facets[stat] = [
+            {"$unwind": f"${field}"},
+            {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+            {"$sort": {"_id": 1}},
+        ]
+    return [{"$facet": facets}]
+
+
+async def get_collection_summary(
+    collection_name: str, config: Config = CONFIG
+) -> Summary:
     """
-    Get the Metadata summary object from metadata store.
+    Summarize a collection with a single aggregation in the metadata store.
 
     Args:
-        config: Rumtime configuration
+        collection_name: The name of the collection
+        config: Runtime configuration
 
     Returns:
-        The Metadata Summary object
+        The document count and the stats of the collection
+
+    """
+    stats = SUMMARY_STATS[collection_name]
+    client = await get_db_client(config)
+    collection = client[config.db_name][collection_name]
+    results = await collection.aggregate(_get_summary_pipeline(stats)).to_list(None)
+    facets = results[0] if results else {}
+    count = facets.get("count")
+    return Summary(
+        count=count[0]["count"] if count else 0,
+        stats={
+            stat: {str(x["_id"]): x["count"] for x in facets.get(stat, [])}
+            for stat in stats
+        },
+    )
+
+
+async def compute_metadata_summary(config: Config = CONFIG) -> MetadataSummary:
+    """
+    Compute the Metadata summary, summarizing all collections concurrently.
+
+    Args:
+        config: Runtime configuration
+
+    Returns:
+        The Metadata summary
+
+    """
+    summaries = await asyncio.gather(
+        *(get_collection_summary(name, config=config) for name in SUMMARY_FIELDS)
+    )
+    return MetadataSummary(**dict(zip(SUMMARY_FIELDS.values(), summaries)))
+
+
+def _get_stat_value(value: Any) -> str:
+    """Get the counted value of a stat field the way it is stored."""
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+def count_summary_changes(
+    collection_name: str,
+    added: Iterable[Dict] = (),
+    removed: Iterable[Dict] = (),
+) -> "Counter[CounterKey]":
+    """
+    Get the changes of the summary counters for documents that are added to or
+    removed from a collection.
 
+    Args:
+        collection_name: The name of the collection
+        added: The documents that are added
+        removed: The documents that are removed
+
+    Returns:
+        The increment of each affected counter
+
+    """
+    changes: "Counter[CounterKey]" = Counter()
+    stats = SUMMARY_STATS.get(collection_name)
+    if stats is None:
+        return changes
+    for documents, sign in ((added, 1), (removed, -1)):
+        for document in documents:
+            changes[(collection_name, None, None)] += sign
+            for stat, field in stats.items():
+                values = document.get(field)
+                if not isinstance(values, list):
+                    values = [values]
+                for value in values:
+                    if value is not None:
+                        key = (collection_name, stat, _get_stat_value(value))
+                        changes[key] += sign
+    return changes
+
+
+async def update_summary_counters(
+    changes: "Counter[CounterKey]", config: Config = CONFIG
+):
+    """
+    Apply changes to the summary counters with a single bulk write.
+
+    Args:
+        changes: The increment of each affected counter
+        config: Runtime configuration
+
+    """
+    operations = [
+        UpdateOne(
+            {"collection": collection_name, "stat": stat, "value": value},
+            {"$inc": {"count": increment}},
+            upsert=True,
+        )
+        for (collection_name, stat, value), increment in changes.items()
+        if increment
+    ]
+    if not operations:
+        return
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    await collection.bulk_write(operations, ordered=False)
+
+
+async def rebuild_summary_counters(config: Config = CONFIG) -> MetadataSummary:
     """
+    Rebuild the summary counters from the summarized collections.
+
+    Counter updates of documents that are written while the collections are
+    summarized may get lost, so this should be run at a quiet moment.
+
+    Args:
+        config: Runtime configuration
+
+    Returns:
+        The rebuilt Metadata summary
+
+    """
+    metadata_summary = await compute_metadata_summary(config=config)
+    operations: List[Any] = []
+    for collection_name, field in SUMMARY_FIELDS.items():
+        summary = getattr(metadata_summary, field)
+        counters: Dict[CounterKey, int] = {(collection_name, None, None): summary.count}
+        for stat, values in summary.stats.items():
+            for value, count in values.items():
+                counters[(collection_name, stat, value)] = count
+        operations.append(DeleteMany({"collection": collection_name}))
+        operations.extend(
+            UpdateOne(
+                {"collection": name, "stat": stat, "value": value},
+                {"$set": {"count": count}},
+                upsert=True,
+            )
+            for (name, stat, value), count in counters.items()
+        )
+    operations.append(
+        UpdateOne(
+            REBUILD_MARKER,
+            {"$set": {"rebuilt_at": await get_timestamp()}},
+            upsert=True,
+        )
+    )
     client = await get_db_client(config)
     collection = client[config.db_name][COLLECTION_NAME]
-    metadata_summary = await collection.find_one()
+    await collection.bulk_write(operations, ordered=True)
     return metadata_summary
 
 
-async def create_metadata_summary_object(  # noqa: C901
-    metadata_summary: MetadataSummary, config: Config = CONFIG
-) -> MetadataSummary:
+async def get_metadata_summary_object(config: Config = CONFIG) -> MetadataSummary:
     """
-    This method creates a metadata summary objects and write to MetadataSummary collection
+    Get the Metadata summary from the summary counters in the metadata store,
+    building the counters first if they were never built.
 
     Args:
-        metadata_summary:
-        config :
+        config: Rumtime configuration
 
     Returns:
-        MetadataSummary
+        The Metadata Summary object
+
     """
     client = await get_db_client(config)
     collection = client[config.db_name][COLLECTION_NAME]
+    counters = await collection.find({}, {"_id": False}).to_list(None)
+    if not any(x["collection"] is None for x in counters):
+        return await rebuild_summary_counters(config=config)
 
-    metadata_summary_entity = metadata_summary.dict()
-    metadata_summary_entity["dataset_summary"] = get_summary_dict(
-        metadata_summary.dataset_summary
+    summaries = {
+        name: Summary(count=0, stats={stat: {} for stat in SUMMARY_STATS[name]})
+        for name in SUMMARY_FIELDS
+    }
+    for counter in counters:
+        summary = summaries.get(counter["collection"])
+        if summary is None or counter.get("count", 0) <= 0:
+            continue
+        if counter["stat"] is None:
+            summary.count = counter["count"]
+        elif counter["stat"] in summary.stats:
+            summary.stats[counter["stat"]][counter["value"]] = counter["count"]
+    for summary in summaries.values():
+        summary.stats = {
+            stat: dict(sorted(values.items())) for stat, values in summary.stats.items()
+        }
+    return MetadataSummary(
+        **{field: summaries[name] for name, field in SUMMARY_FIELDS.items()}
     )
-    metadata_summary_entity["file_summary"] = get_summary_dict(
-        metadata_summary.file_summary
-    )
-    metadata_summary_entity["individual_summary"] = get_summary_dict(
-        metadata_summary.individual_summary
-    )
-    metadata_summary_entity["protocol_summary"] = get_summary_dict(
-        metadata_summary.protocol_summary
-    )
-
-    await collection.insert_one(metadata_summary_entity)
-    new_dataset_summary = await get_metadata_summary_object(config=config)
-    return new_dataset_summary
@@ -0,0 +1,137 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Paging through the documents of a collection.
+
+The pages are selected by the sort key of the last document of the previous
+page (keyset pagination), which the indexes on ``id`` and on ``creation_date``
+and ``id`` serve without skipping over the documents of the previous pages.
+"""
+
+from typing import Any, AsyncIterator, Dict, List, Set
+
+from pydantic import parse_obj_as
+from pymongo import ASCENDING
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.pagination import encode_cursor
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    ListOrderEnum,
+    PageRequest,
+)
+
+
+async def iter_entity_ids(
+    collection_name: str, config: Config = CONFIG
+) -> AsyncIterator[str]:
+    """
+    Stream the IDs of the documents of a collection, without loading the
+    documents themselves.
+
+    Args:
+        collection_name: The collection in the metadata store
+        config: Rumtime configuration
+
+    Yields
+        The IDs of the documents
+
+    """
+    client = await get_db_client(config)
+    collection = client[config.db_name][collection_name]
+    async for document in collection.find({}, {"_id": False, "id": True}):
+        yield document["id"]
+
+
+async def get_entity_page(
+    collection_name: str,
+    page: PageRequest,
+    model_class: Any = None,
+    config: Config = CONFIG,
+) -> EntityPage:
+    """
+    Get a page of the documents of a collection, using the sort key of the
+    last document of the previous page (keyset pagination).
+
+    Args:
+        collection_name: The collection in the metadata store
+        page: The requested page
+        model_class: The model class, or type, of the documents
+        config: Rumtime configuration
+
+    Returns
+        The page of documents, with the cursor of the next page if there is one
+
+    """
+    sort_fields = ["id"]
+    if page.order_by == ListOrderEnum.CREATION_DATE:
+        sort_fields.insert(0, "creation_date")
+    projection = {"_id": False}
+    returned: Set[str] = set()
+    if page.fields is not None:
+        returned = {"id", *page.fields, *_get_required_fields(model_class)}
+        projection.update({field: True for field in [*returned, *sort_fields]})
+    client = await get_db_client(config)
+    collection = client[config.db_name][collection_name]
+    documents = await collection.find(
+        _get_keyset_query(page),
+        projection,
+        sort=[(field, ASCENDING) for field in sort_fields],
+        limit=page.limit + 1,
+    ).to_list(None)
+
+    next_cursor = None
+    if len(documents) > page.limit:
+        documents = documents[: page.limit]
+        position = {field: documents[-1].get(field) for field in sort_fields}
+        next_cursor = encode_cursor({"order_by": page.order_by.value, **position})
+    if page.fields is not None:
+        documents = [
+            {key: value for key, value in document.items() if key in returned}
+            for document in documents
+        ]
+    items = parse_obj_as(List[model_class], documents) if model_class else documents
+    return EntityPage(items=items, next_cursor=next_cursor)
+
+
+def _get_required_fields(model_class: Any) -> Set[str]:
+    """Get the fields that a document needs to be parsed as the model class."""
+    fields = getattr(model_class, "__fields__", {})
+    return {name for name, field in fields.items() if field.required}
+
+
+def _get_keyset_query(page: PageRequest) -> Dict:
+    """Get the query for the documents that follow the previous page."""
+    if page.after is None:
+        return {}
+    after_id = page.after["id"]
+    if page.order_by == ListOrderEnum.ID:
+        return {"id": {"$gt": after_id}}
+    creation_date = page.after.get("creation_date")
+    if creation_date is None:
+        # documents without creation date come first
+        return {
+            "$or": [
+                {"creation_date": None, "id": {"$gt": after_id}},
+                {"creation_date": {"$ne": None}},
+            ]
+        }
+    return {
+        "$or": [
+            {"creation_date": {"$gt": creation_date}},
+            {"creation_date": creation_date, "id": {"$gt": after_id}},
+        ]
+    }
@@ -16,32 +16,109 @@
 Convenience methods for retrieving Project records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    accession_index,
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import Project
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Project"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    accession_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_projects(config: Config = CONFIG) -> List[str]:
+async def retrieve_projects(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Project object IDs from metadata store.
+    Retrieve the Project object IDs from metadata store, without loading
+    the Project objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Project object IDs.
+
+    """
+    async for project_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield project_id
+
+
+async def list_projects(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Project objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of Project objects.
+
+    """
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Project, config=config
+    )
+
+
+async def get_project_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Project IDs and accessions, get the Project objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Project IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
     Returns:
-        A list of Project object IDs.
+        The found Project objects, and the IDs and accessions without one.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    projects = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in projects]
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=Project, embedded=embedded, config=config
+    )
+
+
+async def get_project_referenced_by(
+    project_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a Project ID, get a page of the entities that reference the Project.
+
+    Args:
+        project_id: The Project ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        project_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_project(
@@ -17,38 +17,124 @@ Convenience methods for retrieving Protocol records
 """
 
 from importlib import import_module
-from typing import List
+from typing import AsyncIterator, Optional
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity, get_schema_type
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import (
+    get_entity,
+    get_reference_fields,
+    get_schema_type,
+)
 from metadata_repository_service.models import AnnotatedProtocol
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Protocol"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 MODELS_MODULE_NAME = "metadata_repository_service.models"
 
 
-async def retrieve_protocols(config: Config = CONFIG) -> List[str]:
+async def retrieve_protocols(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Protocol object IDs from metadata store.
+    Retrieve the Protocol object IDs from metadata store, without loading
+    the Protocol objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Protocol object IDs.
+
+    """
+    async for protocol_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield protocol_id
+
+
+async def list_protocols(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Protocol objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of Protocol object IDs.
+        The page of Protocol objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    protocols = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in protocols]
+    if page.fields is not None and "schema_type" not in page.fields:
+        # the schema type tells which kind of Protocol a document is
+        page = page.copy(update={"fields": [*page.fields, "schema_type"]})
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=AnnotatedProtocol, config=config
+    )
+
+
+async def get_protocol_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Protocol IDs and accessions, get the Protocol objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Protocol IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found Protocol objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME,
+        batch,
+        model_class=AnnotatedProtocol,
+        embedded=embedded,
+        config=config,
+    )
+
+
+async def get_protocol_referenced_by(
+    protocol_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a Protocol ID, get a page of the entities that reference the Protocol.
+
+    Args:
+        protocol_id: The Protocol ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        protocol_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_protocol(
     protocol_id: str, embedded: bool = False, config: Config = CONFIG
-) -> AnnotatedProtocol:
+) -> Optional[AnnotatedProtocol]:
     """
     Given an Protocol ID, get the Protocol object from metadata store.
 
@@ -66,8 +152,10 @@ async def get_protocol(
         field="id",
         collection_name=COLLECTION_NAME,
         property_name="schema_type",
-        config=CONFIG,
+        config=config,
     )
+    if protocol_type is None:
+        return None
     module = import_module(MODELS_MODULE_NAME)
     protocol_class = getattr(module, protocol_type)
     protocol = await get_entity(
@@ -80,16 +168,3 @@ async def get_protocol(
     )
 
     return protocol
-
-
-async def get_instrument_model_count(config: Config = CONFIG):
-    """
-    Returns file format
-    """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    instrument_model = await collection.find(
-        {}, {"instrument_model": 1, "_id": False}
-    ).to_list(None)
-    client.close()
-    return instrument_model
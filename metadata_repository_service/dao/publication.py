@@ -16,32 +16,111 @@
 Convenience methods for retrieving Publication records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import Publication
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Publication"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_publications(config: Config = CONFIG) -> List[str]:
+async def retrieve_publications(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Publication object IDs from metadata store.
+    Retrieve the Publication object IDs from metadata store, without loading
+    the Publication objects themselves.
 
     Args:
         config: Rumtime configuration
 
+    Yields:
+        The Publication object IDs.
+
+    """
+    async for publication_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield publication_id
+
+
+async def list_publications(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Publication objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
     Returns:
-        A list of Publication object IDs.
+        The page of Publication objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    publications = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in publications]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Publication, config=config
+    )
+
+
+async def get_publication_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Publication IDs and accessions, get the Publication objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Publication IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found Publication objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME,
+        batch,
+        model_class=Publication,
+        embedded=embedded,
+        config=config,
+    )
+
+
+async def get_publication_referenced_by(
+    publication_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a Publication ID, get a page of the entities that reference the Publication.
+
+    Args:
+        publication_id: The Publication ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        publication_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_publication(
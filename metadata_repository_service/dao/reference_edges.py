@@ -0,0 +1,284 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""References between documents and the index of their reverse edges.
+
+Documents reference each other by ID in their ``has_*`` fields. Finding the
+documents that reference a given document would mean looking into every
+collection and reference field, so each reference is also stored as an edge in
+the reference edge collection, which is indexed by the referenced ID. The write
+paths of the DAO add the edges of the documents that they store and remove the
+edges of the ones that they delete. ``rebuild_reference_edges`` derives the
+edges of documents that were written without going through the service.
+"""
+
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import stringcase
+from pymongo import ASCENDING, IndexModel, UpdateOne
+
+from metadata_repository_service.config import CONFIG, Config
+from metadata_repository_service.core.pagination import encode_cursor
+from metadata_repository_service.core.utils import generate_uuid
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.entity_registry import REGISTERED_COLLECTIONS
+from metadata_repository_service.dao.indexes import field_index
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    ReferencePageRequest,
+)
+from metadata_repository_service.resolution_models import EntityReference
+
+COLLECTION_NAME = "ReferenceEdge"
+INDEXES = [
+    IndexModel(
+        [("target_id", ASCENDING), ("key", ASCENDING)],
+        name="target_id_key",
+        unique=True,
+    ),
+    field_index("source_id"),
+]
+
+embedded_fields: Set = {
+    "has_analysis",
+    "has_analysis_process",
+    "has_biospecimen",
+    "has_data_access_committee",
+    "has_data_access_policy",
+    "has_dataset",
+    "has_experiment_process",
+    "has_experiment",
+    "has_file",
+    "has_individual",
+    "has_member",
+    "has_project",
+    "has_protocol",
+    "has_publication",
+    "has_sample",
+    "has_study",
+    "has_workflow",
+}
+
+# Number of documents whose edges are written with one bulk write by the rebuild
+REBUILD_BATCH_SIZE = 1000
+
+
+def get_reference_collection_name(field: str) -> str:
+    """Given the name of a reference field, e.g. ``has_data_access_policy``,
+    return the name of the referenced collection, e.g. ``DataAccessPolicy``.
+    """
+    cname = field.split("_", 1)[1]
+    return stringcase.pascalcase(cname)
+
+
+def get_document_references(document: Dict) -> Set[Tuple[str, str]]:
+    """Get all (collection name, ID) pairs that are referenced by a document."""
+    references = set()
+    for field, value in document.items():
+        if field not in embedded_fields:
+            continue
+        collection_name = get_reference_collection_name(field)
+        if isinstance(value, str):
+            references.add((collection_name, value))
+        elif isinstance(value, (list, set, tuple)):
+            references.update(
+                (collection_name, ref) for ref in value if isinstance(ref, str)
+            )
+    return references
+
+
+def _get_edge_key(source_collection: str, field: str, source_id: str) -> str:
+    """Get the key that orders the edges of a referenced document by the
+    collection, field and ID of the referencing document."""
+    return f"{source_collection}/{field}/{source_id}"
+
+
+def get_reference_edges(collection_name: str, document: Mapping) -> List[Dict]:
+    """Get the edges from a document of a collection to the documents it references."""
+    edges: Dict[str, Dict] = {}
+    for field, value in document.items():
+        if field not in embedded_fields:
+            continue
+        values = value if isinstance(value, (list, set, tuple)) else [value]
+        for target_id in values:
+            if not isinstance(target_id, str):
+                continue
+            edges[f"{field}/{target_id}"] = {
+                "target_id": target_id,
+                "target_collection": get_reference_collection_name(field),
+                "key": _get_edge_key(collection_name, field, document["id"]),
+                "source_collection": collection_name,
+                "source_id": document["id"],
+                "field": field,
+            }
+    return list(edges.values())
+
+
+def _get_edge_operations(
+    records: Mapping[str, Iterable[Mapping]], rebuild: Optional[str] = None
+) -> List[UpdateOne]:
+    """Get the upserts of the edges of the documents per collection name."""
+    operations = []
+    for collection_name, documents in records.items():
+        if collection_name not in REGISTERED_COLLECTIONS:
+            continue
+        for document in documents:
+            for edge in get_reference_edges(collection_name, document):
+                if rebuild is not None:
+                    edge["rebuild"] = rebuild
+                operations.append(
+                    UpdateOne(
+                        {"target_id": edge["target_id"], "key": edge["key"]},
+                        {"$set": edge},
+                        upsert=True,
+                    )
+                )
+    return operations
+
+
+async def add_reference_edges(
+    records: Mapping[str, Iterable[Mapping]], config: Config = CONFIG
+):
+    """
+    Add the edges of the references of stored documents with a single bulk write.
+
+    Args:
+        records: The stored documents per collection name
+        config: Runtime configuration
+
+    """
+    operations = _get_edge_operations(records)
+    if not operations:
+        return
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    await collection.bulk_write(operations, ordered=False)
+
+
+async def remove_reference_edges(source_ids: Iterable[str], config: Config = CONFIG):
+    """
+    Remove the edges of the references of deleted documents.
+
+    Args:
+        source_ids: The IDs of the deleted documents
+        config: Runtime configuration
+
+    """
+    source_ids = list(source_ids)
+    if not source_ids:
+        return
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    await collection.delete_many({"source_id": {"$in": source_ids}})
+
+
+async def get_referencing_entities(
+    entity_id: str,
+    collection_name: str,
+    page: ReferencePageRequest,
+    config: Config = CONFIG,
+) -> EntityPage:
+    """
+    Given an ID, get a page of the entities that reference the entity, ordered
+    by their type, reference field and ID, with one indexed query.
+
+    Args:
+        entity_id: The ID of the referenced entity
+        collection_name: The collection of the referenced entity
+        page: The requested page
+        config: Runtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    key_query: Dict = {}
+    if page.entity_type is not None:
+        # the keys of the edges from one collection share their prefix
+        key_query["$regex"] = f"^{re.escape(page.entity_type)}/"
+    if page.after is not None:
+        key_query["$gt"] = page.after
+    query: Dict = {"target_id": entity_id, "target_collection": collection_name}
+    if key_query:
+        query["key"] = key_query
+    client = await get_db_client(config)
+    collection = client[config.db_name][COLLECTION_NAME]
+    edges = await collection.find(
+        query,
+        {
+            "_id": False,
+            "key": True,
+            "source_collection": True,
+            "source_id": True,
+            "field": True,
+        },
+        sort=[("key", ASCENDING)],
+        limit=page.limit + 1,
+    ).to_list(None)
+
+    next_cursor = None
+    if len(edges) > page.limit:
+        edges = edges[: page.limit]
+        next_cursor = encode_cursor({"key": edges[-1]["key"]})
+    return EntityPage(
+        items=[
+            EntityReference(
+                entity_type=edge["source_collection"],
+                id=edge["source_id"],
+                field=edge["field"],
+            )
+            for edge in edges
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+async def rebuild_reference_edges(config: Config = CONFIG) -> Dict[str, int]:
+    """
+    Derive the edges of the references of all documents of the registered
+    collections and remove the edges of documents that no longer exist.
+
+    Edges of documents that are written while the edges are rebuilt may get
+    lost, so this should be run at a quiet moment.
+
+    Args:
+        config: Runtime configuration
+
+    Returns:
+        The number of edges per referencing collection name
+
+    """
+    rebuild = await generate_uuid()
+    client = await get_db_client(config)
+    edge_collection = client[config.db_name][COLLECTION_NAME]
+    counts: Dict[str, int] = {}
+    for collection_name in REGISTERED_COLLECTIONS:
+        counts[collection_name] = 0
+        collection = client[config.db_name][collection_name]
+        projection = {"_id": False, "id": True, **{x: True for x in embedded_fields}}
+        cursor = collection.find({}, projection)
+        while True:
+            batch = await cursor.to_list(REBUILD_BATCH_SIZE)
+            if not batch:
+                break
+            operations = _get_edge_operations({collection_name: batch}, rebuild)
+            if operations:
+                await edge_collection.bulk_write(operations, ordered=False)
+            counts[collection_name] += len(operations)
+    # edges of references that were not found in the rebuild
+    await edge_collection.delete_many({"rebuild": {"$ne": rebuild}})
+    return counts
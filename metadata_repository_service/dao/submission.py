@@ -17,16 +17,30 @@ Convenience methods for retrieving Submission records
 """
 
 import copy
-from typing import Dict, List
+from typing import AsyncIterator, Dict
 
 from pymongo import ReturnDocument
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
 from metadata_repository_service.creation_models import CreateSubmission
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.cache import invalidate_entities
+from metadata_repository_service.dao.dataset_closure import (
+    refresh_covering_dataset_closures,
+)
+from metadata_repository_service.dao.dataset_summary import (
+    mark_referencing_dataset_summaries_dirty,
+)
 from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.indexes import creation_date_index, id_index
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
 from metadata_repository_service.dao.utils import (
     delete_document,
     embed_references,
+    get_document_references,
+    get_entity,
     get_timestamp,
     link_embedded,
     parse_document,
@@ -34,27 +48,90 @@ from metadata_repository_service.dao.utils import (
     update_document,
 )
 from metadata_repository_service.models import Submission
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 from metadata_repository_service.patch_models import SubmissionStatusPatch
 
 COLLECTION_NAME = "Submission"
+INDEXES = [id_index(), creation_date_index()]
 
 
-async def retrieve_submissions(config: Config = CONFIG) -> List[str]:
+async def retrieve_submissions(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Submission object IDs from metadata store.
+    Retrieve the Submission object IDs from metadata store, without loading
+    the Submission objects themselves.
 
     Args:
-        config: Runtime configuration
+        config: Rumtime configuration
+
+    Yields:
+        The Submission object IDs.
+
+    """
+    async for submission_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield submission_id
+
+
+async def list_submissions(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Submission objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
 
     Returns:
-        A list of Submission object IDs.
+        The page of Submission objects.
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    submissions = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in submissions]
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Submission, config=config
+    )
+
+
+async def get_submission_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Submission IDs and accessions, get the Submission objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Submission IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
+
+    Returns:
+        The found Submission objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=Submission, embedded=embedded, config=config
+    )
+
+
+async def get_submission_referenced_by(
+    submission_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a Submission ID, get a page of the entities that reference the Submission.
+
+    Args:
+        submission_id: The Submission ID
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
+    """
+    return await get_referencing_entities(
+        submission_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_submission(
@@ -72,13 +149,16 @@ async def get_submission(
         The Submission object
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    submission = await collection.find_one({"id": submission_id})
-    if submission and embedded:
-        submission = await embed_references(submission, config, True)
-    client.close()
-    return Submission(**submission)
+    submission = await get_entity(
+        identifier=submission_id,
+        field="id",
+        collection_name=COLLECTION_NAME,
+        model_class=Submission,
+        embedded=embedded,
+        config=config,
+        only_top_level=True,
+    )
+    return submission
 
 
 async def add_submission(
@@ -97,6 +177,9 @@ async def add_submission(
     docs = await link_embedded(docs)
     docs = await update_document(document, docs)
     await store_document(docs, config)
+    stored_ids = [record["id"] for _, record in docs.values()]
+    await mark_referencing_dataset_summaries_dirty(stored_ids, config=config)
+    await refresh_covering_dataset_closures(stored_ids, config=config)
 
     submission = await embed_references(docs["parent"][1], config, True)
 
@@ -115,7 +198,7 @@ async def insert_submission(submission: Submission, config: Config = CONFIG):
     client = await get_db_client(config)
     collection = client[config.db_name][COLLECTION_NAME]
     await collection.insert_one(submission)
-    client.close()
+    invalidate_entities(COLLECTION_NAME)
 
 
 async def patch_submission(
@@ -161,7 +244,7 @@ async def update_submission_values(
         upsert=True,
         return_document=ReturnDocument.AFTER,
     )
-    client.close()
+    invalidate_entities(COLLECTION_NAME)
 
     return submission
 
@@ -186,6 +269,10 @@ async def update_submission(
     docs = await link_embedded(docs)
     docs = await update_document(document, docs, old_document)
     await store_document(docs, config)
+    changed_ids = [record["id"] for _, record in docs.values()]
+    changed_ids.extend(x for _, x in get_document_references(old_document))
+    await mark_referencing_dataset_summaries_dirty(changed_ids, config=config)
+    await refresh_covering_dataset_closures(changed_ids, config=config)
     updated_submission = await embed_references(docs["parent"][1], config, True)
 
     return updated_submission
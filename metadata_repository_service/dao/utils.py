@@ -16,37 +16,43 @@
 
 # pylint: disable=too-many-arguments
 
+import asyncio
 import copy
 import logging
-import random
-from typing import Any, Dict, List, Set
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import stringcase
+from pydantic import BaseModel
+from pymongo.errors import OperationFailure
 
+from metadata_repository_service import models
 from metadata_repository_service.config import CONFIG, Config
 from metadata_repository_service.core.utils import generate_uuid, get_timestamp
+from metadata_repository_service.dao.accession import allocate_accessions
+from metadata_repository_service.dao.cache import get_entity_cache, invalidate_entities
 from metadata_repository_service.dao.db import get_db_client
-
-embedded_fields: Set = {
-    "has_analysis",
-    "has_analysis_process",
-    "has_biospecimen",
-    "has_data_access_committee",
-    "has_data_access_policy",
-    "has_dataset",
-    "has_experiment_process",
-    "has_experiment",
-    "has_file",
-    "has_individual",
-    "has_member",
-    "has_project",
-    "has_protocol",
-    "has_publication",
-    "has_sample",
-    "has_study",
-    "has_workflow",
-}
-
+from metadata_repository_service.dao.entity_registry import (
+    register_entities,
+    unregister_entities,
+)
+from metadata_repository_service.dao.loader import get_request_loader
+from metadata_repository_service.dao.metadata_summary import (
+    CounterKey,
+    count_summary_changes,
+    update_summary_counters,
+)
+from metadata_repository_service.dao.reference_edges import (
+    add_reference_edges,
+    embedded_fields,
+    get_document_references,
+    get_reference_collection_name,
+    remove_reference_edges,
+)
+
+# Prefix of the temporary fields that hold the documents joined by $lookup
+EMBEDDING_LOOKUP_PREFIX = "__embedded_"
 
 ACCESSIONED_ENTITIES = {
     "Dataset",
@@ -63,32 +69,6 @@ ACCESSIONED_ENTITIES = {
 }
 
 
-async def _get_reference(
-    document_id: str, collection_name: str, config: Config = CONFIG
-) -> Dict:
-    """Given a document ID and a collection name, query the metadata store
-    and return the document.
-
-    Args:
-        document_id: The ID of the document
-        collection_name: The collection in the metadata store that has the document
-
-    Returns
-        The document corresponding to ``document_id``
-
-    """
-    client = await get_db_client(config)
-    collection = client[config.db_name][collection_name]
-    doc = await collection.find_one({"id": document_id})
-    if not doc:
-        logging.warning(
-            "Reference with ID %s not found in collection %s",
-            document_id,
-            collection_name,
-        )
-    return doc
-
-
 async def get_entity(
     identifier: str,
     field: str,
@@ -96,6 +76,7 @@ async def get_entity(
     model_class: Any = None,
     embedded: bool = False,
     config: Config = CONFIG,
+    only_top_level: bool = False,
 ) -> Any:
     """
     Given an identifier, field name and collection name, look up the
@@ -109,17 +90,27 @@ async def get_entity(
         model_class: The model class
         embedded: Whether or not to embed references. ``False``, by default.
         config: Rumtime configuration
+        only_top_level: Whether to embed only the direct references
 
     Returns
         The document
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][collection_name]
-    entity = await collection.find_one({field: identifier})
-    if entity and embedded:
-        entity = await embed_references(entity, config=config)
-    client.close()
+    cache = get_entity_cache(config)
+    embedding = ("top_level" if only_top_level else "all") if embedded else None
+    cache_key = (collection_name, field, identifier, embedding)
+    entity = cache.get(cache_key) if cache else None
+    if entity is None:
+        entity = await _load_entity(
+            identifier,
+            field,
+            collection_name,
+            embedded=embedded,
+            config=config,
+            only_top_level=only_top_level,
+        )
+        if cache and entity:
+            cache.put(cache_key, entity)
     if model_class and entity:
         entity_obj = model_class(**entity)
     else:
@@ -127,13 +118,38 @@ async def get_entity(
     return entity_obj
 
 
+async def _load_entity(
+    identifier: str,
+    field: str,
+    collection_name: str,
+    embedded: bool = False,
+    config: Config = CONFIG,
+    only_top_level: bool = False,
+) -> Optional[Dict]:
+    """Look up a document in the metadata store and embed its references if requested."""
+    if embedded and config.embedding_engine == "aggregation":
+        return await aggregate_embedded_entity(
+            identifier=identifier,
+            field=field,
+            collection_name=collection_name,
+            config=config,
+            only_top_level=only_top_level,
+        )
+    entity = await _find_entity(identifier, field, collection_name, config=config)
+    if entity and embedded:
+        entity = await embed_references(
+            entity, config=config, only_top_level=only_top_level
+        )
+    return entity
+
+
 async def get_schema_type(
     identifier: str,
     field: str,
     collection_name: str,
     property_name: str,
     config: Config = CONFIG,
-) -> str:
+) -> Optional[str]:
     """
     Given an identifier, field name and collection name, return the property,
     e.g. schema type of the object.
@@ -146,13 +162,108 @@ async def get_schema_type(
         config: Rumtime configuration
 
     Returns
-        The value of the property
+        The value of the property, or ``None`` if there is no such document
 
     """
+    entity = await _find_entity(identifier, field, collection_name, config=config)
+    if not entity:
+        return None
+    return entity[property_name]
+
+
+async def _find_entity(
+    identifier: str, field: str, collection_name: str, config: Config = CONFIG
+) -> Optional[Dict]:
+    """Find a document through the loader of the current request, if any."""
+    loader = get_request_loader(config)
+    if loader is not None:
+        return await loader.load(collection_name, field, identifier)
     client = await get_db_client(config)
     collection = client[config.db_name][collection_name]
-    entity = await collection.find_one({field: identifier})
-    return entity[property_name]
+    return await collection.find_one({field: identifier})
+
+
+async def get_entities(
+    identifiers: Iterable[str],
+    field: str,
+    collection_name: str,
+    model_class: Any = None,
+    config: Config = CONFIG,
+) -> Dict[str, Any]:
+    """
+    Given identifiers, field name and collection name, look up all identifiers
+    in the provided field of a collection with one query.
+
+    Args:
+        identifiers: The identifiers
+        field: The name of the field
+        collection_name: The collection in the metadata store that has the documents
+        model_class: The model class
+        config: Rumtime configuration
+
+    Returns
+        The documents keyed by identifier. Identifiers without a document are omitted.
+
+    """
+    entities = await _find_entities(identifiers, field, collection_name, config)
+    if model_class:
+        return {key: model_class(**value) for key, value in entities.items()}
+    return entities
+
+
+async def get_referencing_documents(
+    identifiers: Iterable[str],
+    field: str,
+    collection_name: str,
+    config: Config = CONFIG,
+) -> List[Dict]:
+    """
+    Given identifiers, a reference field and a collection name, get the
+    documents of the collection that reference any of the identifiers in
+    the field, with one query.
+
+    Args:
+        identifiers: The referenced identifiers
+        field: The name of the reference field, e.g. ``has_file``
+        collection_name: The collection in the metadata store that has the documents
+        config: Rumtime configuration
+
+    Returns
+        The referencing documents
+
+    """
+    identifiers = list(dict.fromkeys(identifiers))
+    if not identifiers:
+        return []
+    client = await get_db_client(config)
+    collection = client[config.db_name][collection_name]
+    return await collection.find({field: {"$in": identifiers}}).to_list(None)
+
+
+async def _find_entities(
+    identifiers: Iterable[str],
+    field: str,
+    collection_name: str,
+    config: Config = CONFIG,
+) -> Dict[str, Dict]:
+    """Find documents with one query, through the loader of the current request
+    if any, and key them by the value of the field."""
+    identifiers = set(identifiers)
+    if not identifiers:
+        return {}
+    loader = get_request_loader(config)
+    if loader is not None:
+        return await loader.load_many(collection_name, field, identifiers)
+    client = await get_db_client(config)
+    collection = client[config.db_name][collection_name]
+    documents = await collection.find({field: {"$in": list(identifiers)}}).to_list(None)
+    found: Dict[str, Dict] = {}
+    for document in documents:
+        value = document.get(field)
+        if isinstance(value, str):
+            # keep the first match, like find_one would
+            found.setdefault(value, document)
+    return found
 
 
 async def embed_references(
@@ -169,105 +280,325 @@ async def embed_references(
         The denormalize/embedded document
 
     """
-    parent_document = copy.deepcopy(document)
-    for field in parent_document.keys():
-        if field.startswith("has_") and field not in {"has_attribute"}:
-            if field not in embedded_fields:
-                continue
-            cname = field.split("_", 1)[1]
-            formatted_cname = stringcase.pascalcase(cname)
-            if isinstance(parent_document[field], str):
-                referenced_doc = await get_referenced_doc(
-                    parent_document[field],
-                    formatted_cname,
-                    config=config,
-                    only_top_level=only_top_level,
-                )
-                parent_document[field] = referenced_doc
-            elif isinstance(parent_document[field], (list, set, tuple)):
-                docs = []
-                for ref in parent_document[field]:
-                    referenced_doc = await get_referenced_doc(
-                        ref,
-                        formatted_cname,
-                        config=config,
-                        only_top_level=only_top_level,
-                    )
-                    docs.append(referenced_doc)
-                if docs:
-                    parent_document[field] = docs
-    return parent_document
+    embedded_documents = await embed_documents(
+        [document], config=config, only_top_level=only_top_level
+    )
+    return embedded_documents[0]
 
 
-async def get_referenced_doc(
-    ref: str,
-    collection_name: str,
-    config: Config = CONFIG,
-    only_top_level: bool = False,
-) -> Dict:
-    """Retrieve the referenced document"""
-    referenced_doc = await _get_reference(ref, collection_name, config=config)
-    if referenced_doc:
-        if not only_top_level:
-            referenced_doc = await embed_references(referenced_doc, config=config)
-    return referenced_doc
+async def embed_documents(
+    documents: List[Dict], config: Config = CONFIG, only_top_level: bool = False
+) -> List[Dict]:
+    """Given a list of documents, resolve their references level by level and
+    embed the referenced documents in place of the references.
 
+    All references of one level are fetched with a single ``$in`` query per
+    collection, and every referenced document is fetched only once, no matter
+    how often it is referenced within the tree.
+
+    Args:
+        documents: The documents that have one or more references
+        config: Runtime configuration
+        only_top_level: Whether to embed only the direct references
+
+    Returns
+        The denormalized/embedded documents, in the order of ``documents``
 
-async def generate_accession(collection_name: str, config: Config = CONFIG) -> str:
     """
-    Generate a unique accession.
+    fetched: Dict[Tuple[str, str], Optional[Dict]] = {}
+    pending = {
+        reference
+        for document in documents
+        for reference in get_document_references(document)
+    }
+    while pending:
+        found = await _get_references(pending, config=config)
+        for collection_name, document_id in pending:
+            doc = found.get((collection_name, document_id))
+            if not doc:
+                logging.warning(
+                    "Reference with ID %s not found in collection %s",
+                    document_id,
+                    collection_name,
+                )
+            fetched[(collection_name, document_id)] = doc
+        if only_top_level:
+            break
+        next_pending: Set[Tuple[str, str]] = set()
+        for key in pending:
+            doc = fetched[key]
+            if doc:
+                next_pending.update(
+                    reference
+                    for reference in get_document_references(doc)
+                    if reference not in fetched
+                )
+        pending = next_pending
+    return [
+        _assemble_document(
+            copy.deepcopy(document),
+            fetched,
+            only_top_level=only_top_level,
+            path=set(),
+        )
+        for document in documents
+    ]
 
-    The uniqueness of the accession is ensured by checking the metadata store
-    to see if a generated accession already exists.
+
+async def _get_references(
+    references: Set[Tuple[str, str]], config: Config = CONFIG
+) -> Dict[Tuple[str, str], Dict]:
+    """Fetch the referenced documents with one query per collection.
 
     Args:
-        collection_name: The name of the collection
+        references: The (collection name, ID) pairs to fetch
         config: Runtime configuration
 
-    Returns:
-        A new accession
+    Returns
+        The documents found, keyed by (collection name, ID)
 
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name]["_accession_tracker_"]
-    accession = await _generate_accession(collection_name=collection_name)
-    accession_tracker_obj = await collection.find_one({"accession": accession})
-    if accession_tracker_obj:
-        accession = await generate_accession(
-            collection_name=collection_name, config=config
+    ids_by_collection: Dict[str, Set[str]] = {}
+    for collection_name, document_id in references:
+        ids_by_collection.setdefault(collection_name, set()).add(document_id)
+
+    collection_names = list(ids_by_collection.keys())
+    results = await asyncio.gather(
+        *(
+            _find_entities(
+                ids_by_collection[collection_name], "id", collection_name, config
+            )
+            for collection_name in collection_names
         )
-    else:
-        accession_tracker_obj = {
-            "accession": accession,
-            "timestamp": await get_timestamp(),
+    )
+    found: Dict[Tuple[str, str], Dict] = {}
+    for collection_name, docs in zip(collection_names, results):
+        for document_id, doc in docs.items():
+            found[(collection_name, document_id)] = doc
+    return found
+
+
+def _assemble_document(
+    document: Dict,
+    fetched: Dict[Tuple[str, str], Optional[Dict]],
+    only_top_level: bool,
+    path: Set[Tuple[str, str]],
+) -> Dict:
+    """Replace the references of ``document`` in place with the fetched documents,
+    recursing into the referenced documents unless ``only_top_level`` is set.
+    """
+
+    def resolve(collection_name: str, ref: Any) -> Optional[Dict]:
+        key = (collection_name, ref)
+        referenced_doc = fetched.get(key) if isinstance(ref, str) else None
+        if not referenced_doc:
+            return referenced_doc
+        # every occurrence gets its own copy, also of the nested values
+        referenced_doc = copy.deepcopy(referenced_doc)
+        if only_top_level:
+            return referenced_doc
+        if key in path:
+            logging.warning(
+                "Circular reference to ID %s in collection %s is not embedded",
+                ref,
+                collection_name,
+            )
+            return referenced_doc
+        return _assemble_document(
+            referenced_doc, fetched, only_top_level=False, path=path | {key}
+        )
+
+    for field, value in document.items():
+        if field not in embedded_fields:
+            continue
+        collection_name = get_reference_collection_name(field)
+        if isinstance(value, str):
+            document[field] = resolve(collection_name, value)
+        elif isinstance(value, (list, set, tuple)):
+            docs = [resolve(collection_name, ref) for ref in value]
+            if docs:
+                document[field] = docs
+    return document
+
+
+class EmbeddingPipelineError(RuntimeError):
+    """Raised when no embedding pipeline can be built for a collection"""
+
+
+@lru_cache(maxsize=None)
+def get_reference_fields(collection_name: str) -> Tuple[str, ...]:
+    """Given a collection name, return the reference fields that the documents
+    of this collection can have, according to the model of the same name and
+    all of its subclasses (e.g. ``SequencingProtocol`` for ``Protocol``).
+    """
+    model_class = getattr(models, collection_name, None)
+    if not (isinstance(model_class, type) and issubclass(model_class, BaseModel)):
+        return ()
+    fields: Set[str] = set()
+    model_classes = [model_class]
+    while model_classes:
+        current_class = model_classes.pop()
+        fields.update(x for x in current_class.__fields__ if x in embedded_fields)
+        model_classes.extend(current_class.__subclasses__())
+    return tuple(sorted(fields))
+
+
+def build_embedding_pipeline(
+    collection_name: str, only_top_level: bool = False
+) -> List[Dict]:
+    """Build the aggregation stages that join all documents referenced by the
+    documents of a collection, following the references recursively.
+
+    Every reference field ``has_x`` is joined with a ``$lookup`` stage into the
+    temporary field ``__embedded_has_x``. Since ``$lookup`` neither keeps the order nor
+    the duplicates of the referenced IDs, the referenced documents are put
+    in place of the references by ``apply_embedding_lookups`` once the
+    aggregation result has been received.
+
+    Args:
+        collection_name: The collection of the documents to embed
+        only_top_level: Whether to join only the direct references
+
+    Returns
+        The list of aggregation stages
+
+    """
+    return _build_lookup_stages(
+        collection_name, only_top_level=only_top_level, path=(collection_name,)
+    )
+
+
+def _build_lookup_stages(
+    collection_name: str, only_top_level: bool, path: Tuple[str, ...]
+) -> List[Dict]:
+    """Build the ``$lookup`` stages for the reference fields of a collection."""
+    stages = []
+    for field in get_reference_fields(collection_name):
+        referenced_cname = get_reference_collection_name(field)
+        if referenced_cname in path:
+            raise EmbeddingPipelineError(
+                f"Recursive reference from {collection_name} to {referenced_cname}"
+                + f" via {field} cannot be embedded with $lookup"
+            )
+        lookup: Dict[str, Any] = {
+            "from": referenced_cname,
+            "localField": field,
+            "foreignField": "id",
+            "as": EMBEDDING_LOOKUP_PREFIX + field,
         }
-        await collection.insert_one(accession_tracker_obj)
-    client.close()
-    return accession
+        if not only_top_level:
+            nested_stages = _build_lookup_stages(
+                referenced_cname,
+                only_top_level=False,
+                path=path + (referenced_cname,),
+            )
+            if nested_stages:
+                lookup["pipeline"] = nested_stages
+        stages.append({"$lookup": lookup})
+    return stages
+
+
+def apply_embedding_lookups(document: Dict) -> Dict:
+    """Put the documents joined by an embedding pipeline in place of the
+    references of a document, keeping the order of the references.
+    Missing references are embedded as ``None``, like ``embed_references`` does.
 
+    Args:
+        document: A document returned by an embedding pipeline
+
+    Returns
+        The denormalized/embedded document
 
-async def _generate_accession(collection_name: str) -> str:
     """
-    Generate an accession for a collection.
+    for lookup_field in [
+        x for x in document.keys() if x.startswith(EMBEDDING_LOOKUP_PREFIX)
+    ]:
+        joined_docs = document.pop(lookup_field)
+        field = lookup_field[len(EMBEDDING_LOOKUP_PREFIX) :]
+        if field not in document:
+            continue
+        collection_name = get_reference_collection_name(field)
+        docs_by_id: Dict[str, Dict] = {}
+        for doc in joined_docs:
+            docs_by_id.setdefault(doc["id"], apply_embedding_lookups(doc))
+
+        value = document[field]
+        if isinstance(value, str):
+            document[field] = _get_joined_doc(value, docs_by_id, collection_name)
+        elif isinstance(value, list):
+            docs = [_get_joined_doc(x, docs_by_id, collection_name) for x in value]
+            if docs:
+                document[field] = docs
+    return document
+
+
+def _get_joined_doc(
+    ref: Any, docs_by_id: Dict[str, Dict], collection_name: str
+) -> Optional[Dict]:
+    """Get a copy of the joined document with the given ID, if any."""
+    referenced_doc = docs_by_id.get(ref) if isinstance(ref, str) else None
+    if referenced_doc is None:
+        logging.warning(
+            "Reference with ID %s not found in collection %s",
+            ref,
+            collection_name,
+        )
+        return None
+    return dict(referenced_doc)
+
+
+async def aggregate_embedded_entity(
+    identifier: str,
+    field: str,
+    collection_name: str,
+    config: Config = CONFIG,
+    only_top_level: bool = False,
+) -> Optional[Dict]:
+    """
+    Given an identifier, field name and collection name, look up the
+    corresponding document and embed its references in a single aggregation.
+
+    If the aggregation cannot be built or fails on the server, e.g. because the
+    embedded document exceeds the maximum document size, the document is
+    embedded by ``embed_references`` instead.
 
     Args:
-        collection_name: The name of the collection
+        identifier: The identifier
+        field: The name of the field
+        collection_name: The collection in the metadata store that has the document
+        config: Runtime configuration
+        only_top_level: Whether to embed only the direct references
 
-    Returns:
-        A new accession
+    Returns
+        The embedded document
 
     """
-    special_accession_prefix = {
-        "DataAccessPolicy": "DAP",
-        "DataAccessCommittee": "DAC",
-    }
-    reference = random.randint(1, 999_999_999_999)  # nosec
-    if collection_name in special_accession_prefix:
-        collection_abbr = special_accession_prefix.get(collection_name)
-    else:
-        collection_abbr = collection_name[:3].upper()
-    accession = f"GHGA:{collection_abbr}{str(reference).zfill(12)}"
-    return accession
+    client = await get_db_client(config)
+    collection = client[config.db_name][collection_name]
+    try:
+        pipeline = [
+            {"$match": {field: identifier}},
+            {"$limit": 1},
+            *build_embedding_pipeline(collection_name, only_top_level=only_top_level),
+        ]
+        entities = await collection.aggregate(pipeline).to_list(None)
+    except (EmbeddingPipelineError, OperationFailure) as error:
+        logging.warning(
+            "Falling back to embed_references for %s with %s %s: %s",
+            collection_name,
+            field,
+            identifier,
+            error,
+        )
+        entity = await collection.find_one({field: identifier})
+        if entity:
+            entity = await embed_references(
+                entity, config=config, only_top_level=only_top_level
+            )
+        return entity
+    if not entities:
+        return None
+    return apply_embedding_lookups(entities[0])
 
 
 async def parse_document(document: Dict) -> Dict:
@@ -415,7 +746,10 @@ async def delete_document(
     client = await get_db_client(config)
 
     collection = client[config.db_name][parent_cname]
-    collection.delete_one({"id": parent_document["id"]})
+    deleted = await collection.find_one_and_delete({"id": parent_document["id"]})
+    invalidate_entities(parent_cname)
+    changes = count_summary_changes(parent_cname, removed=[deleted] if deleted else [])
+    deleted_ids = [deleted["id"]] if deleted else []
 
     for field in parent_document.keys():
         if field.startswith("has_") and field not in {"has_attribute"}:
@@ -426,14 +760,20 @@ async def delete_document(
             cname = field.split("_", 1)[1]
             formatted_cname = stringcase.pascalcase(cname)
             collection = client[config.db_name][formatted_cname]
-            if not isinstance(parent_document[field], list):
-                doc_id = parent_document[field]
-                await collection.delete_one({"id": doc_id})
-            else:
-                for doc_id in parent_document[field]:
-                    await collection.delete_one({"id": doc_id})
-
-    client.close()
+            invalidate_entities(formatted_cname)
+            doc_ids = parent_document[field]
+            if not isinstance(doc_ids, list):
+                doc_ids = [doc_ids]
+            for doc_id in doc_ids:
+                deleted = await collection.find_one_and_delete({"id": doc_id})
+                if deleted:
+                    changes.update(
+                        count_summary_changes(formatted_cname, removed=[deleted])
+                    )
+                    deleted_ids.append(deleted["id"])
+    await update_summary_counters(changes, config=config)
+    await unregister_entities(deleted_ids, config=config)
+    await remove_reference_edges(deleted_ids, config=config)
 
 
 async def store_document(docs: Dict, config: Config = CONFIG):
@@ -454,22 +794,31 @@ async def store_document(docs: Dict, config: Config = CONFIG):
         records[cname].append(record)
 
     client = await get_db_client(config)
-    for key, record_list in records.items():
-        if key in ACCESSIONED_ENTITIES:
-            for record in record_list:
-                if "accession" in record and record["accession"]:
-                    continue
-                accession = await generate_accession(collection_name=key, config=config)
-                record["accession"] = accession
-
+    unaccessioned = {
+        key: [record for record in record_list if not record.get("accession")]
+        for key, record_list in records.items()
+        if key in ACCESSIONED_ENTITIES
+    }
+    accessions = await allocate_accessions(
+        {key: len(record_list) for key, record_list in unaccessioned.items()},
+        config=config,
+    )
+    for key, record_list in unaccessioned.items():
+        for record, accession in zip(record_list, accessions[key]):
+            record["accession"] = accession
+
+    changes: "Counter[CounterKey]" = Counter()
     for key, record_list in records.items():
         collection = client[config.db_name][key]
+        invalidate_entities(key)
         if len(record_list) == 1:
             await collection.insert_one(record_list[0])
         else:
             await collection.insert_many(record_list)
-
-    client.close()
+        changes.update(count_summary_changes(key, added=record_list))
+    await update_summary_counters(changes, config=config)
+    await register_entities(records, config=config)
+    await add_reference_edges(records, config=config)
 
 
 async def add_create_fields(document: Dict) -> Dict:
@@ -16,30 +16,107 @@
 Convenience methods for retrieving Workflow records
 """
 
-from typing import List
+from typing import AsyncIterator
 
+from metadata_repository_service.bulk_models import BatchRequest, EntityBatch
 from metadata_repository_service.config import CONFIG, Config
-from metadata_repository_service.dao.db import get_db_client
-from metadata_repository_service.dao.utils import get_entity
+from metadata_repository_service.dao.batch import get_entity_batch
+from metadata_repository_service.dao.indexes import (
+    creation_date_index,
+    id_index,
+    reference_indexes,
+)
+from metadata_repository_service.dao.pagination import get_entity_page, iter_entity_ids
+from metadata_repository_service.dao.reference_edges import get_referencing_entities
+from metadata_repository_service.dao.utils import get_entity, get_reference_fields
 from metadata_repository_service.models import Workflow
+from metadata_repository_service.pagination_models import (
+    EntityPage,
+    PageRequest,
+    ReferencePageRequest,
+)
 
 COLLECTION_NAME = "Workflow"
+INDEXES = [
+    id_index(),
+    creation_date_index(),
+    *reference_indexes(get_reference_fields(COLLECTION_NAME)),
+]
 
 
-async def retrieve_workflows(config: Config = CONFIG) -> List[str]:
+async def retrieve_workflows(config: Config = CONFIG) -> AsyncIterator[str]:
     """
-    Retrieve a list of Workflow object IDs from metadata store.
+    Retrieve the Workflow object IDs from metadata store, without loading
+    the Workflow objects themselves.
+
+    Args:
+        config: Rumtime configuration
+
+    Yields:
+        The Workflow object IDs.
+
+    """
+    async for workflow_id in iter_entity_ids(COLLECTION_NAME, config=config):
+        yield workflow_id
+
+
+async def list_workflows(page: PageRequest, config: Config = CONFIG) -> EntityPage:
+    """
+    Get a page of Workflow objects from metadata store.
+
+    Args:
+        page: The requested page
+        config: Rumtime configuration
+
+    Returns:
+        The page of Workflow objects.
+
+    """
+    return await get_entity_page(
+        COLLECTION_NAME, page, model_class=Workflow, config=config
+    )
+
+
+async def get_workflow_batch(
+    batch: BatchRequest, embedded: bool = False, config: Config = CONFIG
+) -> EntityBatch:
+    """
+    Given Workflow IDs and accessions, get the Workflow objects from metadata
+    store with one query.
+
+    Args:
+        batch: The Workflow IDs and accessions
+        embedded: Whether or not to embed references. ``False``, by default.
+        config: Rumtime configuration
 
     Returns:
-        A list of Workflow object IDs.
+        The found Workflow objects, and the IDs and accessions without one.
+
+    """
+    return await get_entity_batch(
+        COLLECTION_NAME, batch, model_class=Workflow, embedded=embedded, config=config
+    )
+
+
+async def get_workflow_referenced_by(
+    workflow_id: str, page: ReferencePageRequest, config: Config = CONFIG
+) -> EntityPage:
+    """
+    Given a Workflow ID, get a page of the entities that reference the Workflow.
+
+    Args:
+        workflow_id: The Workflow ID
+        page: The requested page
         config: Rumtime configuration
 
+    Returns:
+        The page of referencing entities, with the cursor of the next page
+        if there is one
+
     """
-    client = await get_db_client(config)
-    collection = client[config.db_name][COLLECTION_NAME]
-    workflows = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in workflows]
+    return await get_referencing_entities(
+        workflow_id, COLLECTION_NAME, page, config=config
+    )
 
 
 async def get_workflow(
@@ -0,0 +1,100 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Models for walking the references between entities"""
+
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class GraphDirectionEnum(str, Enum):
+    """
+    The direction in which the references between entities are followed.
+    """
+
+    DOWN = "down"
+    UP = "up"
+    BOTH = "both"
+
+
+class GraphRequest(BaseModel):
+    """
+    A requested walk through the references between entities.
+    """
+
+    direction: GraphDirectionEnum = Field(
+        GraphDirectionEnum.DOWN,
+        description="Follow the references of the entities (down), the references"
+        + " to the entities (up), or both.",
+    )
+    depth: int = Field(..., description="The maximum number of references to follow.")
+    types: Optional[List[str]] = Field(
+        None,
+        description="The types of the entities to walk through, or all types."
+        + " The start entity is always included.",
+    )
+
+
+class GraphNode(BaseModel):
+    """
+    An entity that was reached by walking the references.
+    """
+
+    entity_type: str = Field(..., description="The type of the entity, e.g. File.")
+    id: str = Field(..., description="The ID of the entity.")
+    accession: Optional[str] = Field(
+        None, description="The accession of the entity, if it has one."
+    )
+    schema_type: Optional[str] = Field(
+        None, description="The schema type of the entity, e.g. SequencingProtocol."
+    )
+    depth: int = Field(
+        ..., description="The number of references between the start and the entity."
+    )
+
+
+class GraphEdge(BaseModel):
+    """
+    A reference from one reached entity to another.
+    """
+
+    source_type: str = Field(..., description="The type of the referencing entity.")
+    source_id: str = Field(..., description="The ID of the referencing entity.")
+    field: str = Field(
+        ..., description="The field that holds the reference, e.g. has_file."
+    )
+    target_type: str = Field(..., description="The type of the referenced entity.")
+    target_id: str = Field(..., description="The ID of the referenced entity.")
+
+
+class Graph(BaseModel):
+    """
+    The entities that were reached from a start entity and the references
+    between them.
+    """
+
+    nodes: List[GraphNode] = Field(
+        ..., description="The reached entities, the start entity first."
+    )
+    edges: List[GraphEdge] = Field(
+        ..., description="The references that were followed."
+    )
+    truncated: bool = Field(
+        False,
+        description="Whether the walk stopped early because it reached the"
+        + " maximum number of entities.",
+    )
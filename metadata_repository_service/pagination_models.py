@@ -0,0 +1,106 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Models for paging through entities"""
+
+from enum import Enum
+from typing import Any, Dict, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+from pydantic.generics import GenericModel
+
+from metadata_repository_service.models import Dataset
+
+EntityT = TypeVar("EntityT")
+
+
+class ListOrderEnum(str, Enum):
+    """
+    The orders in which the entities of a collection can be paged through.
+    """
+
+    ID = "id"
+    CREATION_DATE = "creation_date"
+
+
+class PageRequest(BaseModel):
+    """
+    A requested page of the entities of a collection.
+    """
+
+    limit: int = Field(..., description="The maximum number of entities.")
+    order_by: ListOrderEnum = Field(
+        ListOrderEnum.ID, description="The order of the entities."
+    )
+    after: Optional[Dict[str, Any]] = Field(
+        None,
+        description="The sort key of the last entity of the previous page, if any.",
+    )
+    fields: Optional[List[str]] = Field(
+        None, description="The fields of the entities to return, or all fields."
+    )
+
+
+class ReferencePageRequest(BaseModel):
+    """
+    A requested page of the entities that reference an entity.
+    """
+
+    limit: int = Field(..., description="The maximum number of entities.")
+    entity_type: Optional[str] = Field(
+        None, description="The type of the referencing entities, or all types."
+    )
+    after: Optional[str] = Field(
+        None, description="The key of the last reference of the previous page, if any."
+    )
+
+
+class EntityPage(GenericModel, Generic[EntityT]):
+    """
+    A page of the entities of a collection.
+    """
+
+    items: List[EntityT] = Field(..., description="The entities of the page.")
+    next_cursor: Optional[str] = Field(
+        None, description="The cursor of the next page, if there is one."
+    )
+
+
+class RelationPage(BaseModel):
+    """
+    A page of the entities that an embedded Dataset references in one field.
+    """
+
+    offset: int = Field(..., description="The position of the first entity.")
+    limit: Optional[int] = Field(
+        None,
+        description="The maximum number of entities of the page. Relations that"
+        + " are returned in full have no limit.",
+    )
+    total: int = Field(..., description="The number of all referenced entities.")
+    next_cursor: Optional[str] = Field(
+        None, description="The cursor of the next page, if there is one."
+    )
+
+
+class DatasetPage(Dataset):
+    """
+    A Dataset whose embedded relations may be cut to pages.
+    """
+
+    pages: Dict[str, RelationPage] = Field(
+        {},
+        description="The pages of the relations, e.g. 'has_file', if any were"
+        + " requested. Pageable relations without a requested page are left out.",
+    )
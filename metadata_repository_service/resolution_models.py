@@ -0,0 +1,105 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Models for resolving accessions and IDs to the entities they identify"""
+
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class AccessionResolutionRequest(BaseModel):
+    """
+    The accessions to resolve at once.
+    """
+
+    accessions: List[str] = Field([], description="The accessions to resolve.")
+
+
+class ResolvedAccession(BaseModel):
+    """
+    The entity that an accession identifies.
+    """
+
+    accession: str = Field(..., description="The resolved accession.")
+    entity_type: str = Field(
+        ..., description="The type of the entity, e.g. File or Dataset."
+    )
+    id: str = Field(..., description="The ID of the entity.")
+
+
+class AccessionResolution(BaseModel):
+    """
+    The entities that were found for the accessions of a resolution request.
+    """
+
+    items: List[ResolvedAccession] = Field(
+        ..., description="The resolved accessions, in the order of the request."
+    )
+    missing: List[str] = Field(
+        [], description="The requested accessions without an entity."
+    )
+
+
+class EntityRegistration(BaseModel):
+    """
+    The type and accession of the entity with an ID.
+    """
+
+    id: str = Field(..., description="The ID of the entity.")
+    entity_type: str = Field(
+        ..., description="The type of the entity, e.g. File or Dataset."
+    )
+    accession: Optional[str] = Field(
+        None, description="The accession of the entity, if it has one."
+    )
+    schema_type: str = Field(
+        ..., description="The schema type of the entity, e.g. SequencingProtocol."
+    )
+
+
+class EntityReference(BaseModel):
+    """
+    An entity that references another entity.
+    """
+
+    entity_type: str = Field(
+        ..., description="The type of the referencing entity, e.g. Experiment."
+    )
+    id: str = Field(..., description="The ID of the referencing entity.")
+    field: str = Field(
+        ..., description="The field that holds the reference, e.g. has_file."
+    )
+
+
+class DatasetClosureEntry(BaseModel):
+    """
+    An entity that is part of a Dataset.
+    """
+
+    dataset_id: str = Field(..., description="The ID of the Dataset.")
+    entity_type: str = Field(..., description="The type of the entity, e.g. File.")
+    entity_id: str = Field(..., description="The ID of the entity.")
+
+
+class CoveringDatasets(BaseModel):
+    """
+    The Datasets that an entity is part of.
+    """
+
+    entity_id: str = Field(..., description="The ID of the entity.")
+    dataset_ids: List[str] = Field(
+        ..., description="The IDs of the Datasets that the entity is part of."
+    )
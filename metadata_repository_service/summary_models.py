@@ -54,6 +54,8 @@ class DatasetSummary(BaseModel):
     study_summary: Summary = Field(None, description="Study summary")
     experiment_summary: Summary = Field(None, description="Experiment summary")
     file_summary: Summary = Field(None, description="File summary")
+    version: int = Field(None, description="How often the summary was computed")
+    computed_at: str = Field(None, description="When the summary was last computed")
 
 
 # pylint: disable=too-many-instance-attributes
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the embedding engines on documents of the metadata store"""
+
+import asyncio
+import time
+from typing import List, Optional
+
+import typer
+from bson import json_util
+
+from metadata_repository_service.config import CONFIG
+from metadata_repository_service.dao.db import close_db, get_db_client
+from metadata_repository_service.dao.utils import (
+    aggregate_embedded_entity,
+    embed_references,
+)
+
+
+async def embed_with_python(document_id: str, collection_name: str):
+    """Embed a document with the batched embedding engine"""
+    client = await get_db_client(CONFIG)
+    collection = client[CONFIG.db_name][collection_name]
+    document = await collection.find_one({"id": document_id})
+    return await embed_references(document, config=CONFIG)
+
+
+async def embed_with_aggregation(document_id: str, collection_name: str):
+    """Embed a document with the $lookup aggregation pipeline"""
+    return await aggregate_embedded_entity(
+        identifier=document_id,
+        field="id",
+        collection_name=collection_name,
+        config=CONFIG,
+    )
+
+
+async def get_document_ids(collection_name: str, limit: int) -> List[str]:
+    """Get the IDs of the documents with the most references first"""
+    client = await get_db_client(CONFIG)
+    collection = client[CONFIG.db_name][collection_name]
+    pipeline = [
+        {"$project": {"id": 1, "size": {"$size": {"$ifNull": ["$has_file", []]}}}},
+        {"$sort": {"size": -1}},
+        {"$limit": limit},
+    ]
+    documents = await collection.aggregate(pipeline).to_list(None)
+    return [x["id"] for x in documents]
+
+
+async def benchmark(
+    collection_name: str, document_ids: List[str], limit: int, repeat: int
+):
+    """Time both embedding engines and check that their results are identical"""
+    if not document_ids:
+        document_ids = await get_document_ids(collection_name, limit)
+    typer.echo(f"{'ID':<40}{'python [s]':>12}{'aggregation [s]':>17}{'equal':>7}")
+    for document_id in document_ids:
+        timings = {}
+        results = {}
+        for name, engine in (
+            ("python", embed_with_python),
+            ("aggregation", embed_with_aggregation),
+        ):
+            durations = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                results[name] = await engine(document_id, collection_name)
+                durations.append(time.perf_counter() - start)
+            timings[name] = min(durations)
+        equal = json_util.dumps(results["python"]) == json_util.dumps(
+            results["aggregation"]
+        )
+        typer.echo(
+            f"{document_id:<40}{timings['python']:>12.3f}"
+            + f"{timings['aggregation']:>17.3f}{str(equal):>7}"
+        )
+    await close_db()
+
+
+def main(
+    collection_name: str = "Dataset",
+    document_id: Optional[List[str]] = typer.Option(None),
+    limit: int = 5,
+    repeat: int = 3,
+):
+    """Compare the python and the aggregation embedding engines on the documents
+    with the given IDs or, by default, on the documents with the most files."""
+    asyncio.run(benchmark(collection_name, document_id or [], limit, repeat))
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -29,18 +29,23 @@ CollectionTypes = Literal[
     "DataAccessCommittee",
     "DataAccessPolicy",
     "Dataset",
+    "DatasetClosure",
     "DatasetEmbedded",
+    "DatasetEmbeddedChunk",
     "DatasetSummary",
+    "EntityRegistry",
     "Experiment",
     "File",
     "Individual",
     "Member",
     "MetadataSummary",
+    "MetadataSummaryCounter",
     "Sample",
     "Study",
     "Submission",
     "Publication",
     "Project",
+    "ReferenceEdge",
     "PhenotypicFeature",
     "Protocol",
 ]
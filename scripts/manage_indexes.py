@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Reconciles the indexes of the metadata store with their declaration"""
+
+import asyncio
+
+import typer
+
+from metadata_repository_service.config import CONFIG
+from metadata_repository_service.dao.db import close_db
+from metadata_repository_service.dao.index_registry import INDEX_REGISTRY
+from metadata_repository_service.dao.indexes import reconcile_indexes
+
+
+async def manage_indexes(create: bool, prune: bool) -> bool:
+    """Reconcile and report the indexes of all collections"""
+    reports = await reconcile_indexes(
+        INDEX_REGISTRY, create=create, prune=prune, config=CONFIG
+    )
+    await close_db()
+    consistent = True
+    for report in reports:
+        typer.echo(f"{report.collection_name}:")
+        for label, names in (
+            ("missing", report.missing),
+            ("changed", report.changed),
+            ("extra", report.extra),
+            ("created", report.created),
+            ("dropped", report.dropped),
+            ("failed", list(report.failed)),
+        ):
+            if names:
+                typer.echo(f"  - {label}: {', '.join(names)}")
+        consistent = consistent and report.is_consistent()
+    return consistent
+
+
+def main(
+    create: bool = typer.Option(
+        False, help="Create the declared indexes that are missing."
+    ),
+    prune: bool = typer.Option(
+        False,
+        help="Drop the undeclared indexes, except text indexes, and rebuild the indexes"
+        + " that differ from their declaration.",
+    ),
+):
+    """Report the differences between the declared and the existing indexes of the
+    metadata store configured for the service, and optionally resolve them.
+    Exits with a non-zero code if differences remain."""
+    if not asyncio.run(manage_indexes(create=create, prune=prune)):
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -28,54 +28,66 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""
-Submission through submission API
-"""
+"""Materializes the embedded Datasets, Dataset summaries and Dataset closures of the
+metadata store"""
 
 import asyncio
+from typing import List, Optional, Tuple
 
-import motor.motor_asyncio
-import requests
 import typer
 
+from metadata_repository_service.config import CONFIG
+from metadata_repository_service.dao.dataset import (
+    materialize_dataset,
+    retrieve_datasets,
+)
+from metadata_repository_service.dao.db import close_db
 
-async def populate_db():
-    """
-    Write embedded and summary datasets
-    """
-    datasets = await retrieve_datasets()
-    for item in datasets:
-        typer.echo(f"  - writing Embedded dataset {item} to DatasetEmbedded")
-        response = requests.get(
-            "http://localhost:8080/datasets/" + item + "?embedded=true"
-        )
-        if response.status_code == 200:
-            typer.echo(f"  - writing dataset summary for {item} to DatasetSummary")
-            response = requests.get("http://localhost:8080/dataset_summary/" + item)
-            typer.echo(response.status_code)
 
+async def materialize(dataset_id: str, semaphore: asyncio.Semaphore) -> Tuple[str, str]:
+    """Materialize a Dataset and return its ID with the outcome"""
+    async with semaphore:
+        try:
+            found = await materialize_dataset(dataset_id, config=CONFIG)
+        except Exception as error:  # pylint: disable=broad-except
+            return dataset_id, f"failed: {error}"
+    return dataset_id, "done" if found else "not found"
 
-async def retrieve_datasets():
-    """
-    retrieve a list of all datasets
 
-    Returns:
-        dataset_list: Dataset list
-    """
-    db_url: str = "mongodb://localhost:27017"
-    db_name: str = "metadata-store"
-    collection_name = "Dataset"
-    client = motor.motor_asyncio.AsyncIOMotorClient(db_url)
-    collection = client[db_name][collection_name]
-    datasets = await collection.find().to_list(None)
-    client.close()
-    return [x["id"] for x in datasets]
+async def populate_db(dataset_ids: Optional[List[str]], concurrency: int) -> int:
+    """Materialize the given Datasets, or all Datasets, with bounded parallelism
+    and report the progress. Returns the number of Datasets that failed."""
+    if not dataset_ids:
+        dataset_ids = [x async for x in retrieve_datasets(config=CONFIG)]
+    semaphore = asyncio.Semaphore(concurrency)
+    total = len(dataset_ids)
+    failed = 0
+    for position, result in enumerate(
+        asyncio.as_completed([materialize(x, semaphore) for x in dataset_ids]),
+        start=1,
+    ):
+        dataset_id, outcome = await result
+        failed += outcome != "done"
+        typer.echo(f"  [{position}/{total}] {dataset_id}: {outcome}")
+    await close_db()
+    return failed
 
 
-def main():
-    """main"""
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(populate_db())
+def main(
+    dataset_ids: Optional[List[str]] = typer.Argument(
+        None, help="The IDs of the Datasets to materialize, all Datasets by default."
+    ),
+    concurrency: int = typer.Option(
+        4, min=1, help="Number of Datasets that are materialized at the same time."
+    ),
+):
+    """(Re)build the embedded Datasets, the Dataset summaries and the Dataset
+    closures of the metadata store configured for the service. Exits with a
+    non-zero code if a Dataset could not be materialized."""
+    failed = asyncio.run(populate_db(dataset_ids, concurrency))
+    if failed:
+        typer.echo(f"{failed} Datasets could not be materialized.")
+        raise typer.Exit(code=1)
 
 
 if __name__ == "__main__":
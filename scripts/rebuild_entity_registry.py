@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rebuilds the entity registry from the metadata store"""
+
+import asyncio
+
+import typer
+
+from metadata_repository_service.config import CONFIG
+from metadata_repository_service.dao.db import close_db
+from metadata_repository_service.dao.entity_registry import rebuild_entity_registry
+
+
+async def rebuild_registry():
+    """Rebuild the entity registry and report the registered entity counts"""
+    counts = await rebuild_entity_registry(config=CONFIG)
+    await close_db()
+    for collection_name, count in counts.items():
+        typer.echo(f"{collection_name}: {count}")
+
+
+def main():
+    """Rebuild the entity registry of the metadata store configured for the
+    service, e.g. after the metadata store was populated without going
+    through the service."""
+    asyncio.run(rebuild_registry())
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rebuilds the counters of the metadata summary from the metadata store"""
+
+import asyncio
+
+import typer
+
+from metadata_repository_service.config import CONFIG
+from metadata_repository_service.dao.db import close_db
+from metadata_repository_service.dao.metadata_summary import (
+    SUMMARY_FIELDS,
+    rebuild_summary_counters,
+)
+
+
+async def rebuild_metadata_summary():
+    """Rebuild the summary counters and report the rebuilt document counts"""
+    metadata_summary = await rebuild_summary_counters(config=CONFIG)
+    await close_db()
+    for collection_name, field in SUMMARY_FIELDS.items():
+        typer.echo(f"{collection_name}: {getattr(metadata_summary, field).count}")
+
+
+def main():
+    """Rebuild the counters of the metadata summary of the metadata store
+    configured for the service, e.g. after the metadata store was changed
+    without going through the service."""
+    asyncio.run(rebuild_metadata_summary())
+
+
+if __name__ == "__main__":
+    typer.run(main)
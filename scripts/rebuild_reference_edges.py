@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rebuilds the reference edges from the metadata store"""
+
+import asyncio
+
+import typer
+
+from metadata_repository_service.config import CONFIG
+from metadata_repository_service.dao.db import close_db
+from metadata_repository_service.dao.reference_edges import rebuild_reference_edges
+
+
+async def rebuild_edges():
+    """Rebuild the reference edges and report the edge counts per collection"""
+    counts = await rebuild_reference_edges(config=CONFIG)
+    await close_db()
+    for collection_name, count in counts.items():
+        typer.echo(f"{collection_name}: {count}")
+
+
+def main():
+    """Rebuild the reference edges of the metadata store configured for the
+    service, e.g. after the metadata store was populated without going
+    through the service."""
+    asyncio.run(rebuild_edges())
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -27,6 +27,9 @@ from testcontainers.mongodb import MongoDbContainer
 from metadata_repository_service.api.deps import get_config
 from metadata_repository_service.api.main import app
 from metadata_repository_service.config import Config
+from metadata_repository_service.dao.accession import _ACCESSION_TRACKER_INDEXED
+from metadata_repository_service.dao.cache import ACCESSION_CACHES, ENTITY_CACHES
+from metadata_repository_service.dao.dataset_embedded import _DATASET_EMBEDDED_INDEXED
 
 from . import BASE_DIR
 
@@ -55,6 +58,11 @@ def mongo_app_fixture1():
         connection_url = mongodb.get_connection_url()
         db_client = mongodb.get_connection_client()
         config = Config(db_url=connection_url, db_name="test")
+        # container URLs may repeat between tests
+        ENTITY_CACHES.clear()
+        ACCESSION_CACHES.clear()
+        _ACCESSION_TRACKER_INDEXED.clear()
+        _DATASET_EMBEDDED_INDEXED.clear()
 
         for filename, collection_name in json_files:
             file_path = BASE_DIR / "test_data" / "basic_example" / filename
@@ -64,9 +72,8 @@ def mongo_app_fixture1():
                 db_client[config.db_name][collection_name].insert_many(objects)
 
         app.dependency_overrides[get_config] = lambda: config
-        app_client = TestClient(app)
-
-        yield MongoAppFixture(app_client=app_client, config=config)
+        with TestClient(app) as app_client:
+            yield MongoAppFixture(app_client=app_client, config=config)
 
 
 @pytest.fixture(scope="function")
@@ -90,6 +97,11 @@ def mongo_app_fixture2():
         connection_url = mongodb.get_connection_url()
         db_client = mongodb.get_connection_client()
         config = Config(db_url=connection_url, db_name="test")
+        # container URLs may repeat between tests
+        ENTITY_CACHES.clear()
+        ACCESSION_CACHES.clear()
+        _ACCESSION_TRACKER_INDEXED.clear()
+        _DATASET_EMBEDDED_INDEXED.clear()
 
         for filename, collection_name in json_files:
             file_path = BASE_DIR / "test_data" / "create_dataset_example" / filename
@@ -99,9 +111,8 @@ def mongo_app_fixture2():
                 db_client[config.db_name][collection_name].insert_many(objects)
 
         app.dependency_overrides[get_config] = lambda: config
-        app_client = TestClient(app)
-
-        yield MongoAppFixture(app_client=app_client, config=config)
+        with TestClient(app) as app_client:
+            yield MongoAppFixture(app_client=app_client, config=config)
 
 
 @pytest.fixture
@@ -113,8 +124,12 @@ def mongo_app_fixture3():
     with MongoDbContainer() as mongodb:
         connection_url = mongodb.get_connection_url()
         config = Config(db_url=connection_url, db_name="test")
+        # container URLs may repeat between tests
+        ENTITY_CACHES.clear()
+        ACCESSION_CACHES.clear()
+        _ACCESSION_TRACKER_INDEXED.clear()
+        _DATASET_EMBEDDED_INDEXED.clear()
 
         app.dependency_overrides[get_config] = lambda: config
-        app_client = TestClient(app)
-
-        yield MongoAppFixture(app_client=app_client, config=config)
+        with TestClient(app) as app_client:
+            yield MongoAppFixture(app_client=app_client, config=config)
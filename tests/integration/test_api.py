@@ -15,6 +15,8 @@
 
 """Test the api module"""
 
+from typing import List
+
 import pytest
 from fastapi import status
 
@@ -33,8 +35,7 @@ def test_index(mongo_app_fixture1: MongoAppFixture):  # noqa: F811
 
 @pytest.mark.parametrize(
     "route,entity_id,check_conditions",
-    [
-    ],
+    [],
 )
 def test_get_entity_by_id(
     mongo_app_fixture1: MongoAppFixture,  # noqa: F811
@@ -50,3 +51,91 @@ def test_get_entity_by_id(
     assert "id" in data and data["id"] == entity_id
     for key, value in check_conditions.items():
         assert key in data and data[key] == value
+
+
+def test_list_entities(mongo_app_fixture1: MongoAppFixture):  # noqa: F811
+    """Test paging through the entities of a collection"""
+    client = mongo_app_fixture1.app_client
+
+    ids: List[str] = []
+    cursor = None
+    while True:
+        query = f"&cursor={cursor}" if cursor else ""
+        response = client.get(f"/samples?limit=1{query}")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["items"]) <= 1
+        ids.extend(sample["id"] for sample in data["items"])
+        cursor = data["next_cursor"]
+        if not cursor:
+            break
+    assert ids and ids == sorted(set(ids))
+
+    response = client.get("/samples?fields=alias&limit=1")
+    sample = response.json()["items"][0]
+    assert set(sample) <= {"id", "alias", "schema_type"}
+
+    response = client.get("/samples?fields=unknown")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_get_entities_in_batch(mongo_app_fixture1: MongoAppFixture):  # noqa: F811
+    """Test looking up many entities at once"""
+    client = mongo_app_fixture1.app_client
+    samples = client.get("/samples?limit=2").json()["items"]
+    sample_ids = [sample["id"] for sample in samples]
+
+    response = client.post(
+        "/samples/batch?embedded=true",
+        json={"ids": [*reversed(sample_ids), "unknown"], "accessions": ["unknown"]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [sample["id"] for sample in data["items"]] == sample_ids[::-1]
+    assert data["missing_ids"] == ["unknown"]
+    assert data["missing_accessions"] == ["unknown"]
+
+
+def test_resolve_accessions(mongo_app_fixture1: MongoAppFixture):  # noqa: F811
+    """Test resolving accessions to the entities they identify"""
+    client = mongo_app_fixture1.app_client
+    samples = client.get("/samples?limit=2").json()["items"]
+    accessions = [sample["accession"] for sample in samples]
+
+    response = client.get(f"/accessions/{accessions[0]}")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        "accession": accessions[0],
+        "entity_type": "Sample",
+        "id": samples[0]["id"],
+    }
+
+    response = client.get("/accessions/GHGA:XYZ000000000001")
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = client.post(
+        "/accessions/resolve",
+        json={"accessions": [*reversed(accessions), "unknown"]},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["accession"] for item in data["items"]] == accessions[::-1]
+    assert data["missing"] == ["unknown"]
+
+
+def test_get_metadata_summary(mongo_app_fixture1: MongoAppFixture):  # noqa: F811
+    """Test that the metadata summary covers all summarized collections"""
+    client = mongo_app_fixture1.app_client
+
+    response = client.get("/metadata_summary/")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    for field in ["dataset", "study", "experiment", "biospecimen", "sample"]:
+        assert data[f"{field}_summary"]["count"] > 0
+    for field in ["file", "individual", "protocol", "analysis", "project"]:
+        assert data[f"{field}_summary"]["count"] == 0
+    assert "type" in data["sample_summary"]["stats"]
+    assert "format" in data["file_summary"]["stats"]
+
+    response = client.get("/metadata_summary/")
+    assert response.json() == data
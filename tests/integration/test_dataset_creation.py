@@ -14,6 +14,8 @@
 # limitations under the License.
 """Test the creation of dataset via the API"""
 
+from metadata_repository_service.core.scheduler import get_background_scheduler
+
 from ..fixtures.mongodb import MongoAppFixture, mongo_app_fixture2  # noqa: F401
 
 
@@ -95,6 +97,60 @@ def test_create_dap(mongo_app_fixture2: MongoAppFixture):  # noqa: F811
     assert dap_entity["has_data_access_committee"] == dac_entity["id"]
 
 
+def check_dataset_summary(client, dataset_id: str):
+    """Check the summary of the Dataset created in test_create_dataset"""
+    # the summary is computed once by the materialization of the new Dataset
+    client.portal.call(get_background_scheduler().join)
+    response = client.get(f"/dataset_summary/{dataset_id}")
+    dataset_summary = response.json()
+
+    assert dataset_summary["version"] == 1
+    assert dataset_summary["file_summary"]["count"] == 2
+    assert sum(dataset_summary["file_summary"]["stats"]["format"].values()) <= 2
+    assert dataset_summary["experiment_summary"]["count"] == 2
+    assert dataset_summary["sample_summary"]["count"] == 1
+    assert dataset_summary["study_summary"]["count"] == 1
+    assert "foo@ghga.de;" in dataset_summary["dac_email"]
+
+
+def check_dataset_file_pages(client, dataset_id: str):
+    """Check paging through the files of the Dataset created in test_create_dataset"""
+    response = client.get(f"/datasets/{dataset_id}?embedded=true&files_limit=1")
+    first_page = response.json()
+
+    assert len(first_page["has_file"]) == 1
+    assert first_page["has_sample"] is None
+    assert first_page["pages"]["has_file"]["total"] == 2
+    cursor = first_page["pages"]["has_file"]["next_cursor"]
+    assert cursor
+
+    response = client.get(f"/datasets/{dataset_id}?embedded=true&files_cursor={cursor}")
+    second_page = response.json()
+
+    assert len(second_page["has_file"]) == 1
+    assert second_page["has_file"][0]["id"] != first_page["has_file"][0]["id"]
+    assert second_page["pages"]["has_file"]["next_cursor"] is None
+
+
+def check_dataset_closure(client, dataset_entity: dict, dac_entity: dict):
+    """Check the closure of the Dataset created in test_create_dataset"""
+    dataset_id = dataset_entity["id"]
+    file_id = dataset_entity["has_file"][0]
+    response = client.get(f"/datasets/{dataset_id}/entities/{file_id}")
+    assert response.status_code == 200
+    assert response.json()["entity_type"] == "File"
+
+    response = client.get(f"/datasets/{dataset_id}/entities/{dac_entity['id']}")
+    assert response.status_code == 200
+    assert response.json()["entity_type"] == "DataAccessCommittee"
+
+    response = client.get(f"/datasets/{dataset_id}/entities/unknown")
+    assert response.status_code == 404
+
+    response = client.get(f"/entities/{file_id}/datasets")
+    assert dataset_id in response.json()["dataset_ids"]
+
+
 def test_create_dataset(mongo_app_fixture2: MongoAppFixture):  # noqa: F811
     """Test creation of a Dataset"""
     client = mongo_app_fixture2.app_client
@@ -167,6 +223,10 @@ def test_create_dataset(mongo_app_fixture2: MongoAppFixture):  # noqa: F811
     assert "release_status" in full_dataset_entity
     assert full_dataset_entity["release_status"] == "unreleased"
 
+    check_dataset_summary(client, dataset_entity["id"])
+    check_dataset_file_pages(client, dataset_entity["id"])
+    check_dataset_closure(client, dataset_entity, dac_entity)
+
     dataset_patch = {"release_status": "released"}
     response = client.patch(
         f"/datasets/{full_dataset_entity['accession']}", json=dataset_patch
@@ -174,3 +234,93 @@ def test_create_dataset(mongo_app_fixture2: MongoAppFixture):  # noqa: F811
     patched_dataset = response.json()
     assert patched_dataset["release_status"] == dataset_patch["release_status"]
     assert patched_dataset["creation_date"] != patched_dataset["update_date"]
+
+
+def test_create_datasets_in_bulk(mongo_app_fixture2: MongoAppFixture):  # noqa: F811
+    """Test creation of several Datasets at once with partial failures"""
+    client = mongo_app_fixture2.app_client
+    dac_data = {
+        "name": "Test DAC",
+        "description": "A Data Access Committee for sharing test datasets",
+        "main_contact": {
+            "organization": "GHGA",
+            "email": "foo@ghga.de",
+            "schema_type": "CreateMember",
+        },
+        "has_member": [
+            {
+                "organization": "GHGA",
+                "email": "foo@ghga.de",
+                "schema_type": "CreateMember",
+            },
+        ],
+        "schema_type": "CreateDataAccessCommittee",
+    }
+    response = client.post("/data_access_committees", json=dac_data)
+    dac_accession = response.json()["accession"]
+    dap_data = {
+        "name": "New DAP",
+        "policy_text": "Some text that explains the access restrictions",
+        "has_data_access_committee": dac_accession,
+        "schema_type": "CreateDataAccessPolicy",
+    }
+    response = client.post("/data_access_policies", json=dap_data)
+    dap_accession = response.json()["accession"]
+
+    datasets_data = [
+        {
+            "has_file": ["GHGA:FIL000000000001"],
+            "has_data_access_policy": dap_accession,
+            "schema_type": "CreateDataset",
+        },
+        {
+            "has_file": ["GHGA:FIL000000000001", "GHGA:FIL999999999999"],
+            "has_data_access_policy": dap_accession,
+            "schema_type": "CreateDataset",
+        },
+        {
+            "has_file": ["GHGA:FIL000000000002"],
+            "has_data_access_policy": dap_accession,
+            "schema_type": "CreateDataset",
+        },
+    ]
+    response = client.post("/datasets/bulk", json=datasets_data)
+    assert response.status_code == 200
+    bulk_result = response.json()
+    assert bulk_result["created"] == 2
+    assert bulk_result["failed"] == 1
+
+    results = bulk_result["results"]
+    assert [x["index"] for x in results] == [0, 1, 2]
+    assert results[1]["dataset"] is None
+    assert results[1]["missing"] == {"has_file": ["GHGA:FIL999999999999"]}
+    for result in (results[0], results[2]):
+        assert result["error"] is None
+        assert result["dataset"]["accession"]
+        response = client.get(f"/datasets/{result['dataset']['id']}")
+        assert response.status_code == 200
+        assert response.json()["has_file"] == result["dataset"]["has_file"]
+
+
+def test_create_dataset_with_missing_references(
+    mongo_app_fixture2: MongoAppFixture,  # noqa: F811
+):
+    """Test that all missing references of a new Dataset are reported at once"""
+    client = mongo_app_fixture2.app_client
+    missing_files = ["GHGA:FIL999999999997", "GHGA:FIL999999999998"]
+    dataset_data = {
+        "has_file": ["GHGA:FIL000000000001", *missing_files, missing_files[0]],
+        "has_data_access_policy": "GHGA:DAP999999999999",
+        "schema_type": "CreateDataset",
+    }
+    response = client.post("/datasets", json=dataset_data)
+
+    assert response.status_code == 404
+    detail = response.json()["detail"]
+    assert "GHGA:DAP999999999999" in detail
+    assert str(missing_files) in detail
+    assert "GHGA:FIL000000000001" not in detail
+
+    response = client.get("/datasets")
+    assert response.status_code == 200
+    assert not response.json()["items"]
@@ -84,3 +84,100 @@ def test_create_submission(mongo_app_fixture3: MongoAppFixture):  # noqa: F811
     assert updated_submission["creation_date"] == submission_entity["creation_date"]
     assert updated_submission["creation_date"] != updated_submission["update_date"]
     assert updated_submission["update_date"] != patched_submission["update_date"]
+
+
+def test_submission_entities_registered(
+    mongo_app_fixture3: MongoAppFixture,  # noqa: F811
+):
+    """Test that the entities of a Submission can be found by their ID alone"""
+    client = mongo_app_fixture3.app_client
+
+    file_path = BASE_DIR / "test_data" / "submission_example" / "submission.json"
+    with open(file_path, "r", encoding="utf8") as file:
+        submission_json = json.load(file)
+    submission_entity = client.post("/submissions", json=submission_json).json()
+
+    response = client.get(f"/entities/{submission_entity['id']}")
+    assert response.json()["entity_type"] == "Submission"
+
+    file_entity = submission_entity["has_file"][0]
+    response = client.get(f"/entities/{file_entity['id']}")
+    assert response.json() == {
+        "id": file_entity["id"],
+        "entity_type": "File",
+        "accession": file_entity["accession"],
+        "schema_type": file_entity["schema_type"],
+    }
+
+    protocol = submission_entity["has_protocol"][0]
+    response = client.get(f"/entities/{protocol['id']}")
+    assert response.json()["entity_type"] == "Protocol"
+    assert response.json()["schema_type"] == protocol["schema_type"]
+
+    response = client.get("/entities/unknown")
+    assert response.status_code == 404
+
+
+def test_submission_entities_referenced_by(
+    mongo_app_fixture3: MongoAppFixture,  # noqa: F811
+):
+    """Test looking up the entities that reference an entity of a Submission"""
+    client = mongo_app_fixture3.app_client
+
+    file_path = BASE_DIR / "test_data" / "submission_example" / "submission.json"
+    with open(file_path, "r", encoding="utf8") as file:
+        submission_json = json.load(file)
+    submission_entity = client.post("/submissions", json=submission_json).json()
+    file_id = submission_entity["has_file"][0]["id"]
+    experiment_id = submission_entity["has_experiment"][0]["id"]
+
+    response = client.get(f"/files/{file_id}/referenced_by")
+    assert response.status_code == 200
+    references = response.json()["items"]
+    assert {
+        "entity_type": "Experiment",
+        "id": experiment_id,
+        "field": "has_file",
+    } in references
+    assert {
+        "entity_type": "Submission",
+        "id": submission_entity["id"],
+        "field": "has_file",
+    } in references
+
+    response = client.get(
+        f"/files/{file_id}/referenced_by?entity_type=Experiment&limit=1"
+    )
+    assert [x["entity_type"] for x in response.json()["items"]] == ["Experiment"]
+
+
+def test_submission_graph(mongo_app_fixture3: MongoAppFixture):  # noqa: F811
+    """Test walking from a File of a Submission to its Experiment and Samples"""
+    client = mongo_app_fixture3.app_client
+
+    file_path = BASE_DIR / "test_data" / "submission_example" / "submission.json"
+    with open(file_path, "r", encoding="utf8") as file:
+        submission_json = json.load(file)
+    submission_entity = client.post("/submissions", json=submission_json).json()
+    file_id = submission_entity["has_file"][0]["id"]
+    experiment = submission_entity["has_experiment"][0]
+
+    response = client.get(
+        f"/graph/File/{file_id}?direction=both&depth=2&types=Experiment,Sample"
+    )
+    assert response.status_code == 200
+    graph = response.json()
+    assert graph["nodes"][0]["id"] == file_id
+    nodes = {(x["entity_type"], x["id"]): x["depth"] for x in graph["nodes"]}
+    assert nodes[("Experiment", experiment["id"])] == 1
+    for sample_id in experiment["has_sample"]:
+        assert nodes[("Sample", sample_id)] == 2
+    assert {x["entity_type"] for x in graph["nodes"]} <= {
+        "File",
+        "Experiment",
+        "Sample",
+    }
+    assert not graph["truncated"]
+
+    response = client.get("/graph/File/unknown")
+    assert response.status_code == 404
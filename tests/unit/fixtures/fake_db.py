@@ -0,0 +1,91 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""An in-memory stand-in for the database client, for the unit tests of the DAO"""
+
+import copy
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import pytest
+
+from metadata_repository_service.dao import db
+
+
+def _matches(document: Dict, query: Dict) -> bool:
+    """Check whether a document matches a query of equality and ``$in``
+    conditions."""
+    for field, condition in query.items():
+        if isinstance(condition, dict) and "$in" in condition:
+            if document.get(field) not in condition["$in"]:
+                return False
+        elif document.get(field) != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    """A cursor over the documents found by ``FakeCollection.find``"""
+
+    def __init__(self, documents: List[Dict]):
+        self.documents = documents
+
+    async def to_list(self, length: Optional[int]) -> List[Dict]:
+        return self.documents[:length] if length else self.documents
+
+
+class FakeCollection:
+    """A collection that supports equality and ``$in`` queries and records them"""
+
+    def __init__(self):
+        self.documents: List[Dict] = []
+        self.queries: List[Dict] = []
+
+    def find(self, query: Dict, *_args, **_kwargs) -> FakeCursor:
+        self.queries.append(query)
+        return FakeCursor(
+            [copy.deepcopy(x) for x in self.documents if _matches(x, query)]
+        )
+
+    async def find_one(self, query: Dict, *_args, **_kwargs) -> Optional[Dict]:
+        self.queries.append(query)
+        for document in self.documents:
+            if _matches(document, query):
+                return copy.deepcopy(document)
+        return None
+
+
+class FakeClient:
+    """A database client whose databases and collections are created on use"""
+
+    def __init__(self):
+        self.databases: Dict[str, Dict[str, FakeCollection]] = defaultdict(
+            lambda: defaultdict(FakeCollection)
+        )
+
+    def __getitem__(self, db_name: str) -> Dict[str, FakeCollection]:
+        return self.databases[db_name]
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_client(monkeypatch) -> FakeClient:
+    """Make the DAO use an in-memory database client."""
+    client = FakeClient()
+    monkeypatch.setattr(db, "DB_CLIENTS", {})
+    monkeypatch.setattr(db, "create_db_client", lambda config=None: client)
+    return client
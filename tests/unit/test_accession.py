@@ -0,0 +1,193 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the allocation of unique accessions"""
+
+import asyncio
+from typing import Dict, List
+
+import pytest
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from metadata_repository_service.config import Config
+from metadata_repository_service.dao import accession
+from metadata_repository_service.dao.accession import (
+    ACCESSION_ALLOCATION_ATTEMPTS,
+    ACCESSION_TRACKER_COLLECTION,
+    AccessionAllocationError,
+    allocate_accessions,
+)
+
+from .fixtures.fake_db import FakeClient, FakeCollection, fake_client  # noqa: F401
+
+CONFIG = Config(db_url="mongodb://fake", db_name="test")
+
+
+class TrackerCollection(FakeCollection):
+    """An accession tracker whose insertions fail with the given write errors,
+    one list of write errors per call"""
+
+    def __init__(self, write_errors: List[List[Dict]], indexable: bool = True):
+        super().__init__()
+        self.write_errors = write_errors
+        self.indexable = indexable
+        self.inserted: List[List[str]] = []
+
+    async def create_indexes(self, _indexes):
+        if not self.indexable:
+            raise OperationFailure("cannot index")
+
+    async def insert_many(self, documents: List[Dict], ordered: bool = True):
+        assert not ordered
+        self.inserted.append([x["accession"] for x in documents])
+        write_errors = self.write_errors.pop(0) if self.write_errors else []
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors})
+        self.documents.extend(documents)
+
+
+def _duplicate(index: int) -> Dict:
+    return {"index": index, "code": accession.DUPLICATE_KEY_ERROR}
+
+
+@pytest.fixture
+def tracker(fake_client: FakeClient, monkeypatch):  # noqa: F811
+    """Install an accession tracker and make the candidates predictable"""
+    monkeypatch.setattr(accession, "_ACCESSION_TRACKER_INDEXED", {})
+    numbers = iter(range(1, 1000))
+    monkeypatch.setattr(
+        accession,
+        "_generate_accession",
+        lambda name: accession._format_accession(  # pylint: disable=protected-access
+            accession.get_accession_prefix(name), next(numbers)
+        ),
+    )
+
+    def install(collection: TrackerCollection) -> TrackerCollection:
+        fake_client[CONFIG.db_name][ACCESSION_TRACKER_COLLECTION] = collection
+        return collection
+
+    return install
+
+
+def test_random_allocation_retries_rejected_candidates(tracker):
+    """Test that only the candidates rejected by the unique index are retried"""
+    collection = tracker(TrackerCollection([[_duplicate(1)]]))
+
+    allocated = asyncio.run(allocate_accessions({"File": 2, "Sample": 1}, CONFIG))
+
+    assert len(collection.inserted) == 2
+    first, retried = collection.inserted
+    assert len(first) == 3 and len(retried) == 1
+    assert allocated["File"] == [first[0], retried[0]]
+    assert allocated["Sample"] == [first[2]]
+
+
+def test_random_allocation_raises_other_write_errors(tracker):
+    """Test that write errors other than duplicates are raised"""
+    tracker(TrackerCollection([[_duplicate(0), {"index": 1, "code": 121}]]))
+
+    with pytest.raises(BulkWriteError):
+        asyncio.run(allocate_accessions({"File": 2}, CONFIG))
+
+
+def test_random_allocation_gives_up(tracker):
+    """Test that the allocation fails after the maximum number of attempts"""
+    collection = tracker(
+        TrackerCollection([[_duplicate(0)]] * (ACCESSION_ALLOCATION_ATTEMPTS + 1))
+    )
+
+    with pytest.raises(AccessionAllocationError):
+        asyncio.run(allocate_accessions({"File": 1}, CONFIG))
+    assert len(collection.inserted) == ACCESSION_ALLOCATION_ATTEMPTS
+
+
+def test_random_allocation_without_unique_index(tracker):
+    """Test that issued accessions are looked up if the tracker cannot be indexed"""
+    collection = tracker(TrackerCollection([], indexable=False))
+    collection.documents.append({"accession": "GHGA:FIL000000000001"})
+
+    allocated = asyncio.run(allocate_accessions({"File": 2}, CONFIG))
+
+    assert "GHGA:FIL000000000001" not in allocated["File"]
+    assert collection.inserted == [["GHGA:FIL000000000002"], ["GHGA:FIL000000000003"]]
+    assert allocated["File"] == collection.inserted[0] + collection.inserted[1]
+
+
+class CounterCollection(FakeCollection):
+    """The accession counters, which record the increments of each update"""
+
+    def __init__(self):
+        super().__init__()
+        self.increments: List[int] = []
+
+    async def find_one_and_update(self, query, update, upsert, return_document):
+        assert upsert and return_document
+        counter = await self.find_one(query)
+        if counter is None:
+            counter = {"_id": query["_id"], "value": 0}
+        else:
+            self.documents.remove(counter)
+        counter["value"] += update["$inc"]["value"]
+        self.increments.append(update["$inc"]["value"])
+        self.documents.append(counter)
+        return counter
+
+
+@pytest.fixture
+def counters(fake_client: FakeClient, monkeypatch):  # noqa: F811
+    """Install the accession counters and forget the blocks of this process"""
+    monkeypatch.setattr(accession, "_ACCESSION_BLOCKS", {})
+    collection = CounterCollection()
+    fake_client[CONFIG.db_name][accession.ACCESSION_COUNTER_COLLECTION] = collection
+    return collection
+
+
+COUNTER_CONFIG = Config(
+    db_url="mongodb://fake",
+    db_name="test",
+    accession_strategy="counter",
+    accession_block_size=10,
+)
+
+
+def test_counted_allocation_uses_blocks(counters):
+    """Test that numbers are served from the block of the process and that the
+    counter is advanced by the missing numbers and a new block"""
+
+    async def allocate():
+        return [
+            (await allocate_accessions({"File": count}, COUNTER_CONFIG))["File"]
+            for count in (3, 5, 8)
+        ]
+
+    first, second, third = asyncio.run(allocate())
+
+    assert first == [f"GHGA:FIL{x:012d}" for x in (1, 2, 3)]
+    assert first[0] == "GHGA:FIL000000000001"
+    assert second == [f"GHGA:FIL{x:012d}" for x in range(4, 9)]
+    assert third == [f"GHGA:FIL{x:012d}" for x in range(9, 17)]
+    # the first and the third request advance the counter, the second does not
+    assert counters.increments == [3 + 10, 3 + 10]
+
+
+def test_counted_allocation_exhausted(counters):
+    """Test that the allocation fails when the counter passes the largest number"""
+    counters.documents.append(
+        {"_id": "GHGA:FIL", "value": accession.MAX_ACCESSION_NUMBER - 5}
+    )
+
+    with pytest.raises(AccessionAllocationError):
+        asyncio.run(allocate_accessions({"File": 1}, COUNTER_CONFIG))
@@ -0,0 +1,38 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the resolution of accessions"""
+
+import pytest
+
+from metadata_repository_service.dao.accession import _generate_accession
+from metadata_repository_service.dao.accession_resolver import get_accession_collection
+from metadata_repository_service.dao.utils import ACCESSIONED_ENTITIES
+
+
+@pytest.mark.parametrize("collection_name", sorted(ACCESSIONED_ENTITIES))
+def test_get_accession_collection(collection_name: str):
+    """Test that generated accessions resolve to their collection"""
+    accession = _generate_accession(collection_name)
+    assert get_accession_collection(accession) == collection_name
+
+
+@pytest.mark.parametrize(
+    "accession",
+    ["GHGA:XYZ000000000001", "GHGA:FIL00000000001", "GHGA:FIL00000000000A", ""],
+)
+def test_get_accession_collection_unknown(accession: str):
+    """Test that malformed accessions and unknown prefixes are not resolved"""
+    assert get_accession_collection(accession) is None
@@ -0,0 +1,50 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the chunked storage of embedded Datasets"""
+
+from metadata_repository_service.dao.dataset_embedded import (
+    _assemble_document,
+    _get_chunk_range,
+)
+
+
+def test_get_chunk_range():
+    """Test that only the chunks overlapping a window are selected"""
+    assert _get_chunk_range(5, 2, 0, None) == (0, 3)
+    assert _get_chunk_range(5, 2, 3, 1) == (1, 2)
+    assert _get_chunk_range(5, 2, 3, 10) == (1, 3)
+    assert _get_chunk_range(5, 2, 5, 1) == (0, 0)
+    assert _get_chunk_range(0, 2, 0, None) == (0, 0)
+
+
+def test_assemble_document():
+    """Test that the chunks of a relation are cut to its window"""
+    header = {
+        "_id": "x",
+        "id": "1",
+        "generation": "g",
+        "chunk_size": 2,
+        "relations": {"has_file": {"count": 5}},
+    }
+    chunks = [
+        {"relation": "has_file", "index": 2, "items": [{"id": "e"}]},
+        {"relation": "has_file", "index": 1, "items": [{"id": "c"}, {"id": "d"}]},
+    ]
+    document = _assemble_document(
+        header, {"has_file": (3, 2)}, {"has_file": (1, 3)}, chunks
+    )
+
+    assert document == {"id": "1", "has_file": [{"id": "d"}, {"id": "e"}]}
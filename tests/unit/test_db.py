@@ -0,0 +1,38 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test the sharing of database clients"""
+
+import asyncio
+
+from metadata_repository_service.config import Config
+from metadata_repository_service.dao.db import DB_CLIENTS, close_db, get_db_client
+
+CONFIG = Config(db_url="mongodb://localhost:27017", db_name="test")
+
+
+def test_db_client_per_event_loop():
+    """Test that a client is shared within an event loop but not across loops"""
+
+    async def get_clients():
+        return await get_db_client(CONFIG), await get_db_client(CONFIG)
+
+    first, same = asyncio.run(get_clients())
+    assert first is same
+    second, _ = asyncio.run(get_clients())
+    assert second is not first
+    # the client of the closed loop was dropped
+    assert list(DB_CLIENTS.values()) == [second]
+    asyncio.run(close_db())
+    assert not DB_CLIENTS
@@ -0,0 +1,167 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the level by level embedding of references"""
+
+import asyncio
+import copy
+from typing import Dict, List
+
+from metadata_repository_service.config import Config
+from metadata_repository_service.dao.db import get_db_client
+from metadata_repository_service.dao.loader import REQUEST_LOADER, EntityLoader
+from metadata_repository_service.dao.utils import (
+    embed_references,
+    embedded_fields,
+    get_reference_collection_name,
+)
+
+from .fixtures.fake_db import FakeClient, fake_client  # noqa: F401
+
+CONFIG = Config(db_url="mongodb://fake", db_name="test")
+
+DOCUMENTS: Dict[str, List[Dict]] = {
+    "Dataset": [
+        {
+            "id": "d1",
+            "has_file": ["f1", "f1", "f2", "missing"],
+            "has_study": "s1",
+            "has_sample": [],
+            "has_experiment": ["e1", "e2"],
+            "has_attribute": [{"key": "k", "value": "v"}],
+        },
+        {"id": "d2", "has_study": "s2"},
+    ],
+    "File": [
+        {"id": "f1", "format": "bam", "has_attribute": [{"key": "k", "value": "1"}]},
+        {"id": "f2", "format": "vcf"},
+    ],
+    "Study": [
+        {"id": "s1", "title": "Study", "has_project": "p1"},
+        {"id": "s2", "title": "Cycle", "has_dataset": "d2"},
+    ],
+    "Project": [{"id": "p1", "title": "Project"}],
+    "Experiment": [
+        {"id": "e1", "has_sample": ["sm1"]},
+        {"id": "e2", "has_sample": ["sm1"]},
+    ],
+    "Sample": [
+        {
+            "id": "sm1",
+            "has_individual": "i1",
+            "has_anatomical_entity": [{"concept_name": "liver"}],
+        }
+    ],
+    "Individual": [{"id": "i1", "sex": "female"}],
+}
+
+
+def _populate(client: FakeClient):
+    for collection_name, documents in DOCUMENTS.items():
+        client[CONFIG.db_name][collection_name].documents.extend(
+            copy.deepcopy(documents)
+        )
+
+
+async def _embed_references_recursively(
+    document: Dict, only_top_level: bool = False
+) -> Dict:
+    """The recursive embedding that the level by level embedding replaced,
+    as the reference for its output"""
+    client = await get_db_client(CONFIG)
+    parent_document = copy.deepcopy(document)
+    for field in parent_document.keys():
+        if field.startswith("has_") and field not in {"has_attribute"}:
+            if field not in embedded_fields:
+                continue
+            collection = client[CONFIG.db_name][get_reference_collection_name(field)]
+            refs = parent_document[field]
+            is_single = isinstance(refs, str)
+            docs = []
+            for ref in [refs] if is_single else refs:
+                referenced_doc = await collection.find_one({"id": ref})
+                if referenced_doc and not only_top_level:
+                    referenced_doc = await _embed_references_recursively(referenced_doc)
+                docs.append(referenced_doc)
+            if is_single:
+                parent_document[field] = docs[0]
+            elif docs:
+                parent_document[field] = docs
+    return parent_document
+
+
+def test_embed_references_like_recursive_embedding(
+    fake_client: FakeClient,  # noqa: F811
+):
+    """Test that repeated, missing, empty and shared references are embedded
+    like by the recursive embedding, fully and only at the top level"""
+    _populate(fake_client)
+    dataset = DOCUMENTS["Dataset"][0]
+
+    async def embed(only_top_level: bool):
+        return (
+            await embed_references(
+                dataset, config=CONFIG, only_top_level=only_top_level
+            ),
+            await _embed_references_recursively(dataset, only_top_level),
+        )
+
+    embedded, expected = asyncio.run(embed(only_top_level=False))
+    assert embedded == expected
+    assert [x and x["id"] for x in embedded["has_file"]] == ["f1", "f1", "f2", None]
+    assert embedded["has_sample"] == []
+    assert embedded["has_study"]["has_project"]["title"] == "Project"
+    for experiment in embedded["has_experiment"]:
+        assert experiment["has_sample"][0]["has_individual"]["sex"] == "female"
+
+    embedded, expected = asyncio.run(embed(only_top_level=True))
+    assert embedded == expected
+    assert embedded["has_study"]["has_project"] == "p1"
+    assert embedded["has_experiment"][0]["has_sample"] == ["sm1"]
+
+
+def test_embed_references_stops_at_cycles(fake_client: FakeClient):  # noqa: F811
+    """Test that a referenced document is not expanded again within itself,
+    where the recursive embedding did not terminate"""
+    _populate(fake_client)
+
+    embedded = asyncio.run(embed_references(DOCUMENTS["Dataset"][1], config=CONFIG))
+
+    cycle = embedded["has_study"]["has_dataset"]
+    assert cycle["id"] == "d2"
+    assert cycle["has_study"] == DOCUMENTS["Study"][1]
+
+
+def test_embed_references_returns_independent_documents(
+    fake_client: FakeClient,  # noqa: F811
+):
+    """Test that every occurrence of an embedded document is a separate copy,
+    also of the documents memoized by the loader of the request"""
+    _populate(fake_client)
+
+    async def embed_twice():
+        REQUEST_LOADER.set(EntityLoader(CONFIG))
+        first = await embed_references(DOCUMENTS["Dataset"][0], config=CONFIG)
+        first["has_file"][0]["has_attribute"].append({"key": "x", "value": "y"})
+        first["has_experiment"][0]["has_sample"][0]["has_anatomical_entity"].clear()
+        second = await embed_references(DOCUMENTS["Dataset"][0], config=CONFIG)
+        return first, second
+
+    first, second = asyncio.run(embed_twice())
+
+    assert len(first["has_file"][1]["has_attribute"]) == 1
+    assert first["has_experiment"][1]["has_sample"][0]["has_anatomical_entity"]
+    assert len(second["has_file"][0]["has_attribute"]) == 1
+    assert second["has_experiment"][0]["has_sample"][0]["has_anatomical_entity"]
@@ -0,0 +1,69 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the aggregation based embedding of references"""
+
+from metadata_repository_service.dao.utils import (
+    apply_embedding_lookups,
+    build_embedding_pipeline,
+)
+
+
+def test_build_top_level_pipeline():
+    """Test that only the direct references are joined"""
+    pipeline = build_embedding_pipeline("Experiment", only_top_level=True)
+    lookups = {x["$lookup"]["localField"]: x["$lookup"] for x in pipeline}
+    assert set(lookups) == {
+        "has_experiment_process",
+        "has_file",
+        "has_protocol",
+        "has_sample",
+        "has_study",
+    }
+    assert lookups["has_experiment_process"]["from"] == "ExperimentProcess"
+    assert all("pipeline" not in x for x in lookups.values())
+
+
+def test_build_nested_pipeline():
+    """Test that references of referenced documents are joined as well"""
+    pipeline = build_embedding_pipeline("Sample")
+    lookups = {x["$lookup"]["localField"]: x["$lookup"] for x in pipeline}
+    nested = {
+        x["$lookup"]["localField"]: x["$lookup"]
+        for x in lookups["has_biospecimen"]["pipeline"]
+    }
+    assert nested["has_individual"]["from"] == "Individual"
+    assert nested["has_individual"]["pipeline"][0]["$lookup"]["from"] == "File"
+
+
+def test_apply_embedding_lookups():
+    """Test that joined documents replace the references in their original order"""
+    document = {
+        "id": "experiment",
+        "has_study": "study",
+        "has_file": ["file2", "file1", "file2", "missing"],
+        "has_protocol": [],
+        "__embedded_has_study": [{"id": "study"}],
+        "__embedded_has_file": [{"id": "file1"}, {"id": "file2"}],
+        "__embedded_has_protocol": [],
+        "__embedded_has_sample": [],
+    }
+    embedded = apply_embedding_lookups(document)
+    assert embedded == {
+        "id": "experiment",
+        "has_study": {"id": "study"},
+        "has_file": [{"id": "file2"}, {"id": "file1"}, {"id": "file2"}, None],
+        "has_protocol": [],
+    }
@@ -0,0 +1,139 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the request-scoped batching and memoization of entity lookups"""
+
+import asyncio
+from typing import Dict, List, Optional
+
+import pytest
+
+from metadata_repository_service.config import Config
+from metadata_repository_service.dao.loader import EntityLoader
+
+from .fixtures.fake_db import FakeClient, FakeCollection, fake_client  # noqa: F401
+
+CONFIG = Config(db_url="mongodb://fake", db_name="test")
+
+
+class FailingCollection(FakeCollection):
+    """A collection whose queries fail"""
+
+    def find(self, query: Dict, *_args, **_kwargs):
+        raise RuntimeError("query failed")
+
+
+class BlockingCursor:
+    """A cursor whose results never arrive"""
+
+    async def to_list(self, _length: Optional[int]) -> List[Dict]:
+        await asyncio.Event().wait()
+        return []
+
+
+class BlockingCollection(FakeCollection):
+    """A collection whose queries never finish"""
+
+    def find(self, query: Dict, *_args, **_kwargs):
+        self.queries.append(query)
+        return BlockingCursor()
+
+
+def _add_files(client: FakeClient) -> FakeCollection:
+    collection = client[CONFIG.db_name]["File"]
+    collection.documents.extend({"id": x, "format": "bam"} for x in "abc")
+    return collection
+
+
+def test_loader_batches_lookups_of_one_tick(fake_client: FakeClient):  # noqa: F811
+    """Test that concurrent lookups are resolved with one query"""
+    collection = _add_files(fake_client)
+
+    async def load():
+        loader = EntityLoader(CONFIG)
+        return await asyncio.gather(
+            loader.load("File", "id", "a"),
+            loader.load("File", "id", "b"),
+            loader.load_many("File", "id", ["a", "c", "x"]),
+        )
+
+    first, second, many = asyncio.run(load())
+
+    assert first["id"] == "a" and second["id"] == "b"
+    assert sorted(many) == ["a", "c"]
+    assert len(collection.queries) == 1
+    assert sorted(collection.queries[0]["id"]["$in"]) == ["a", "b", "c", "x"]
+
+
+def test_loader_memoizes_and_invalidates(fake_client: FakeClient):  # noqa: F811
+    """Test that found documents are memoized until their collection is
+    invalidated, and that misses are not memoized"""
+    collection = _add_files(fake_client)
+
+    async def load():
+        loader = EntityLoader(CONFIG)
+        await loader.load_many("File", "id", ["a", "x"])
+        assert await loader.load("File", "id", "a") is not None
+        assert len(collection.queries) == 1
+        assert await loader.load("File", "id", "x") is None
+        assert len(collection.queries) == 2
+        loader.invalidate("Sample")
+        await loader.load("File", "id", "a")
+        assert len(collection.queries) == 2
+        loader.invalidate("File")
+        await loader.load("File", "id", "a")
+        assert len(collection.queries) == 3
+
+    asyncio.run(load())
+
+
+def test_loader_propagates_errors(fake_client: FakeClient):  # noqa: F811
+    """Test that the error of a batch query is raised to every waiter"""
+    fake_client[CONFIG.db_name]["File"] = FailingCollection()
+
+    async def load():
+        loader = EntityLoader(CONFIG)
+        return await asyncio.gather(
+            loader.load("File", "id", "a"),
+            loader.load("File", "id", "b"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(load())
+
+    assert [str(x) for x in results] == ["query failed", "query failed"]
+
+
+def test_loader_cancels_waiters_of_cancelled_dispatch(
+    fake_client: FakeClient,  # noqa: F811
+):
+    """Test that the waiters of a cancelled dispatch do not hang"""
+    collection = BlockingCollection()
+    fake_client[CONFIG.db_name]["File"] = collection
+
+    async def load():
+        loader = EntityLoader(CONFIG)
+        waiters = [
+            asyncio.ensure_future(loader.load("File", "id", x)) for x in ("a", "b")
+        ]
+        while not collection.queries:
+            await asyncio.sleep(0)
+        for dispatch in list(loader._dispatches):  # pylint: disable=protected-access
+            dispatch.cancel()
+        for waiter in waiters:
+            with pytest.raises(asyncio.CancelledError):
+                await asyncio.wait_for(waiter, timeout=1)
+
+    asyncio.run(load())
@@ -0,0 +1,61 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the registry of the collection of each entity"""
+
+from pymongo import UpdateOne
+
+from metadata_repository_service.dao.entity_registry import _get_registration_operations
+
+
+def test_registration_operations():
+    """Test that only entities of registered collections are registered"""
+    operations = _get_registration_operations(
+        {
+            "File": [{"id": "1", "accession": "GHGA:FIL000000000001"}],
+            "Protocol": [{"id": "2", "schema_type": "SequencingProtocol"}],
+            "DatasetSummary": [{"id": "3"}],
+        },
+        rebuild="r",
+    )
+
+    assert operations == [
+        UpdateOne(
+            {"id": "1"},
+            {
+                "$set": {
+                    "id": "1",
+                    "entity_type": "File",
+                    "accession": "GHGA:FIL000000000001",
+                    "schema_type": "File",
+                    "rebuild": "r",
+                }
+            },
+            upsert=True,
+        ),
+        UpdateOne(
+            {"id": "2"},
+            {
+                "$set": {
+                    "id": "2",
+                    "entity_type": "Protocol",
+                    "accession": None,
+                    "schema_type": "SequencingProtocol",
+                    "rebuild": "r",
+                }
+            },
+            upsert=True,
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the walk through the references between entities"""
+
+from metadata_repository_service.dao.graph import _add_edges
+from metadata_repository_service.graph_models import GraphNode
+
+
+def test_add_edges_between_reached_entities():
+    """Test that only the edges whose both entities were reached are added"""
+    nodes = {
+        ("File", "f1"): GraphNode(entity_type="File", id="f1", depth=0),
+        ("Experiment", "e1"): GraphNode(entity_type="Experiment", id="e1", depth=1),
+    }
+    candidates = [
+        {
+            "source_collection": "Experiment",
+            "source_id": "e1",
+            "field": "has_file",
+            "target_collection": "File",
+            "target_id": "f1",
+        },
+        {
+            "source_collection": "Experiment",
+            "source_id": "e1",
+            "field": "has_sample",
+            "target_collection": "Sample",
+            "target_id": "s1",
+        },
+    ]
+    edges: dict = {}
+    _add_edges(edges, candidates * 2, nodes)
+
+    assert [edge.dict() for edge in edges.values()] == [
+        {
+            "source_type": "Experiment",
+            "source_id": "e1",
+            "field": "has_file",
+            "target_type": "File",
+            "target_id": "f1",
+        }
+    ]
@@ -0,0 +1,72 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the comparison of declared and existing indexes"""
+
+from metadata_repository_service.dao.indexes import (
+    _compare_indexes,
+    accession_index,
+    field_index,
+    id_index,
+)
+
+
+def test_compare_indexes():
+    """Test that missing, changed and extra indexes are reported"""
+    existing = {
+        "_id_": {"key": {"_id": 1}, "name": "_id_", "v": 2},
+        "id": {"key": {"id": 1}, "name": "id", "v": 2},
+        "accession": {
+            "key": {"accession": 1},
+            "name": "accession",
+            "unique": True,
+            "partialFilterExpression": {"accession": {"$type": "string"}},
+            "v": 2,
+        },
+        "has_sample": {"key": {"has_sample": 1}, "name": "has_sample", "v": 2},
+    }
+    report = _compare_indexes(
+        "File", [id_index(), accession_index(), field_index("has_file")], existing
+    )
+
+    assert report.missing == ["has_file"]
+    assert report.changed == ["id"]
+    assert report.extra == ["has_sample"]
+    assert not report.is_consistent()
+
+
+def test_compare_indexes_consistent():
+    """Test that matching indexes are not reported"""
+    existing = {
+        "_id_": {"key": {"_id": 1}, "name": "_id_", "v": 2},
+        "id": {"key": {"id": 1}, "name": "id", "unique": True, "v": 2},
+    }
+    report = _compare_indexes("Submission", [id_index()], existing)
+
+    assert not (report.missing or report.changed or report.extra)
+    assert report.is_consistent()
+
+
+def test_compare_indexes_ignores_text_indexes():
+    """Test that text indexes are neither reported nor pruned"""
+    existing = {
+        "_id_": {"key": {"_id": 1}, "name": "_id_", "v": 2},
+        "id": {"key": {"id": 1}, "name": "id", "unique": True, "v": 2},
+        "$**_text": {"key": {"_fts": "text", "_ftsx": 1}, "name": "$**_text", "v": 2},
+    }
+    report = _compare_indexes("File", [id_index()], existing)
+
+    assert not (report.missing or report.changed or report.extra)
+    assert report.is_consistent()
@@ -0,0 +1,41 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the changes of the metadata summary counters"""
+
+from metadata_repository_service.dao.metadata_summary import count_summary_changes
+from metadata_repository_service.models import BiologicalSexEnum
+
+
+def test_count_summary_changes():
+    """Test that added and removed documents change the counts of their values"""
+    changes = count_summary_changes(
+        "Individual",
+        added=[{"sex": BiologicalSexEnum.female}, {"sex": "male"}, {"sex": None}],
+        removed=[{"sex": "male"}],
+    )
+
+    assert changes[("Individual", None, None)] == 2
+    assert changes[("Individual", "sex", "female")] == 1
+    assert changes[("Individual", "sex", "male")] == 0
+
+
+def test_count_summary_changes_of_lists():
+    """Test that documents are counted for each of their values"""
+    changes = count_summary_changes("Dataset", added=[{"type": ["a", "b"]}])
+
+    assert changes[("Dataset", "type", "a")] == 1
+    assert changes[("Dataset", "type", "b")] == 1
+    assert not count_summary_changes("Member", added=[{"id": "1"}])
@@ -0,0 +1,75 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the cursors for paging through entities"""
+
+import pytest
+
+from metadata_repository_service.config import CONFIG
+from metadata_repository_service.core.pagination import (
+    CursorError,
+    decode_cursor,
+    encode_cursor,
+    get_page_size,
+)
+from metadata_repository_service.dao.pagination import _get_keyset_query
+from metadata_repository_service.pagination_models import ListOrderEnum, PageRequest
+
+
+def test_cursor_round_trip():
+    """Test that a decoded cursor yields the encoded position"""
+    position = {"relation": "has_file", "offset": 200, "limit": 100}
+    cursor = encode_cursor(position)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == position
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not a cursor", encode_cursor({})[:-1] + "[", "WzFd"]
+)
+def test_invalid_cursor(cursor: str):
+    """Test that cursors that were not encoded as a position are rejected"""
+    with pytest.raises(CursorError):
+        decode_cursor(cursor)
+
+
+def test_get_page_size():
+    """Test that the page size defaults to and is bounded by the config"""
+    config = CONFIG.copy(update={"default_page_size": 10, "max_page_size": 50})
+
+    assert get_page_size(None, config) == 10
+    assert get_page_size(20, config) == 20
+    assert get_page_size(100, config) == 50
+
+
+def test_keyset_query_by_creation_date():
+    """Test that the next page by creation date continues after the last entity"""
+    page = PageRequest(
+        limit=10,
+        order_by=ListOrderEnum.CREATION_DATE,
+        after={"order_by": "creation_date", "creation_date": "2023-01-01", "id": "b"},
+    )
+
+    assert _get_keyset_query(page) == {
+        "$or": [
+            {"creation_date": {"$gt": "2023-01-01"}},
+            {"creation_date": "2023-01-01", "id": {"$gt": "b"}},
+        ]
+    }
+    assert not _get_keyset_query(page.copy(update={"after": None}))
+    assert _get_keyset_query(page.copy(update={"order_by": ListOrderEnum.ID})) == {
+        "id": {"$gt": "b"}
+    }
@@ -0,0 +1,47 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the derivation of the reverse edges of references"""
+
+from metadata_repository_service.dao.reference_edges import get_reference_edges
+
+
+def test_get_reference_edges():
+    """Test that each referenced ID of the reference fields gets one edge"""
+    edges = get_reference_edges(
+        "Experiment",
+        {
+            "id": "e1",
+            "has_study": "s1",
+            "has_file": ["f1", "f2", "f1"],
+            "has_attribute": ["a1"],
+            "has_sample": [{"id": "embedded"}],
+        },
+    )
+
+    assert sorted((x["field"], x["target_id"]) for x in edges) == [
+        ("has_file", "f1"),
+        ("has_file", "f2"),
+        ("has_study", "s1"),
+    ]
+    study_edge = next(x for x in edges if x["field"] == "has_study")
+    assert study_edge == {
+        "target_id": "s1",
+        "target_collection": "Study",
+        "key": "Experiment/has_study/e1",
+        "source_collection": "Experiment",
+        "source_id": "e1",
+        "field": "has_study",
+    }
@@ -0,0 +1,109 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the background scheduler"""
+
+import asyncio
+from contextvars import ContextVar
+from typing import List, Optional
+
+from metadata_repository_service.core.scheduler import BackgroundScheduler
+
+
+def test_scheduler_bounds_concurrency_and_merges_jobs():
+    """Test that jobs run with bounded concurrency and waiting jobs are merged"""
+    running = []
+    runs = []
+
+    async def main():
+        scheduler = BackgroundScheduler(max_concurrency=2)
+
+        def job(key):
+            async def run():
+                running.append(key)
+                assert len(running) <= 2
+                await asyncio.sleep(0.01)
+                running.remove(key)
+                runs.append(key)
+
+            return run
+
+        for key in ["a", "b", "c", "d", "c"]:
+            scheduler.schedule(key, job(key))
+        await scheduler.join()
+        assert scheduler.pending() == 0
+
+    asyncio.run(main())
+    assert sorted(runs) == ["a", "b", "c", "d"]
+
+
+def test_scheduler_reruns_jobs_scheduled_while_running():
+    """Test that a job scheduled while it runs is run once more afterwards"""
+    runs: List[int] = []
+
+    async def main():
+        scheduler = BackgroundScheduler(max_concurrency=1)
+
+        async def run():
+            runs.append(len(runs))
+            if len(runs) == 1:
+                scheduler.schedule("a", run)
+                scheduler.schedule("a", run)
+
+        scheduler.schedule("a", run)
+        await scheduler.join()
+
+    asyncio.run(main())
+    assert runs == [0, 1]
+
+
+def test_scheduler_survives_failing_jobs():
+    """Test that a failing job does not stop the other jobs"""
+    runs = []
+
+    async def main():
+        scheduler = BackgroundScheduler(max_concurrency=1)
+
+        async def fail():
+            raise ValueError("failed")
+
+        async def run():
+            runs.append("b")
+
+        scheduler.schedule("a", fail)
+        scheduler.schedule("b", run)
+        await scheduler.join()
+
+    asyncio.run(main())
+    assert runs == ["b"]
+
+
+def test_scheduler_runs_jobs_in_fresh_context():
+    """Test that jobs do not inherit the context of the code that scheduled them"""
+    request_state: ContextVar[Optional[str]] = ContextVar("request_state", default=None)
+    seen: List[Optional[str]] = []
+
+    async def main():
+        scheduler = BackgroundScheduler(max_concurrency=1)
+
+        async def run():
+            seen.append(request_state.get())
+
+        request_state.set("request")
+        scheduler.schedule("a", run)
+        await scheduler.join()
+
+    asyncio.run(main())
+    assert seen == [None]
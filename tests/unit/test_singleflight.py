@@ -0,0 +1,65 @@
+# Copyright 2021 - 2023 Universität Tübingen, DKFZ, EMBL, and Universität zu Köln
+# for the German Human Genome-Phenome Archive (GHGA)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test the deduplication of concurrent calls"""
+
+import asyncio
+from functools import partial
+
+from metadata_repository_service.core.singleflight import SingleFlight
+
+
+def test_single_flight_shares_concurrent_calls():
+    """Test that concurrent calls with the same key run only once"""
+    calls = []
+
+    async def main():
+        single_flight = SingleFlight()
+
+        async def call(key):
+            calls.append(key)
+            await asyncio.sleep(0.01)
+            return key
+
+        results = await asyncio.gather(
+            *(single_flight.run(key, partial(call, key)) for key in "aaab")
+        )
+        assert single_flight.in_flight() == 0
+        assert await single_flight.run("a", partial(call, "a")) == "a"
+        return results
+
+    assert asyncio.run(main()) == ["a", "a", "a", "b"]
+    assert calls == ["a", "b", "a"]
+
+
+def test_single_flight_shares_exceptions():
+    """Test that all concurrent callers get the exception of the shared call"""
+
+    async def main():
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        return await asyncio.gather(
+            single_flight.run("a", fail),
+            single_flight.run("a", fail),
+            return_exceptions=True,
+        )
+
+    first, second = asyncio.run(main())
+    assert isinstance(first, ValueError)
+    assert second is first